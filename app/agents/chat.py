@@ -2,13 +2,17 @@
 
 from agno.agent import Agent
 
+from app.agents.pool import AgentPool
 from app.core.logging import get_logger
 from app.models.chat import ChatResponse
 from app.models.providers import ProviderType
 from app.services.providers import ProviderManager
+from app.services.response_cache import AsyncTTLCache, make_cache_key
 
 logger = get_logger(__name__)
 
+CHAT_INSTRUCTIONS = "You are a helpful AI assistant. Be concise and friendly."
+
 
 class ChatAgent:
     """
@@ -18,28 +22,49 @@ class ChatAgent:
     and demonstrating the basic agent pattern.
     """
 
-    def __init__(self, provider_manager: ProviderManager) -> None:
+    def __init__(
+        self,
+        provider_manager: ProviderManager,
+        response_cache: AsyncTTLCache[tuple[str, str]] | None = None,
+    ) -> None:
         """
         Initialize the chat agent.
 
         Args:
             provider_manager: Provider manager instance
+            response_cache: Optional cache for replies to identical messages
         """
         self.provider_manager = provider_manager
+        self.response_cache = response_cache
+        self._agent_pool = AgentPool()
 
     async def _chat_with_provider(self, message: str, provider: ProviderType) -> tuple[str, str]:
         """Execute a chat request with a specific provider."""
-        model = self.provider_manager.get_model(provider)
         model_name = self.provider_manager.get_model_name(provider)
 
-        agent = Agent(
-            model=model,
-            instructions="You are a helpful AI assistant. Be concise and friendly.",
-            markdown=True,
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = make_cache_key({"p": provider.value, "m": model_name, "msg": message})
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Chat reply served from cache", extra={"provider": provider.value})
+                return cached
+
+        agent = self._agent_pool.get(
+            provider=provider,
+            instructions=CHAT_INSTRUCTIONS,
+            factory=lambda: Agent(
+                model=self.provider_manager.get_model(provider),
+                instructions=CHAT_INSTRUCTIONS,
+                markdown=True,
+            ),
         )
 
         response = await agent.arun(message)
         reply = str(response.content) if hasattr(response, "content") else str(response)
+
+        if self.response_cache is not None and cache_key is not None:
+            await self.response_cache.set(cache_key, (reply, model_name))
         return reply, model_name
 
     async def chat(self, message: str, provider: ProviderType | None = None) -> ChatResponse:
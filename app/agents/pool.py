@@ -0,0 +1,51 @@
+"""Reusable agno Agent instances."""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+
+from agno.agent import Agent
+
+from app.models.providers import ProviderType
+
+
+class AgentPool:
+    """
+    LRU pool of agno Agents keyed by provider, variant, and instructions.
+
+    Agents are reused across runs so the model client and parsed instructions
+    are built once per distinct configuration instead of once per request.
+    """
+
+    def __init__(self, max_agents: int = 128) -> None:
+        self._max_agents = max_agents
+        self._agents: OrderedDict[tuple[ProviderType, str, str], Agent] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def get(
+        self,
+        *,
+        provider: ProviderType,
+        instructions: str | list[str],
+        factory: Callable[[], Agent],
+        variant: str = "",
+    ) -> Agent:
+        """Return the pooled agent for this configuration, creating it on first use."""
+        signature = hashlib.blake2b(repr(instructions).encode(), digest_size=8).hexdigest()
+        key = (provider, variant, signature)
+
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = factory()
+            self._agents[key] = agent
+            if len(self._agents) > self._max_agents:
+                self._agents.popitem(last=False)
+        else:
+            self._agents.move_to_end(key)
+        return agent
+
+    def clear(self) -> None:
+        """Drop all pooled agents."""
+        self._agents.clear()
@@ -1,14 +1,18 @@
 """Research agent for generating Obsidian-ready notes."""
 
+import asyncio
+import json
 import re
-from dataclasses import asdict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from time import perf_counter
-from typing import Any
+from typing import Any, NamedTuple
 
-import yaml
 from agno.agent import Agent, RunOutput
+from agno.run.agent import RunContentEvent
 
+from app.agents.pool import AgentPool
 from app.core.logging import get_logger
 from app.models.providers import ProviderType
 from app.models.research import (
@@ -17,33 +21,98 @@ from app.models.research import (
     ResearchResponse,
     SourceReference,
 )
-from app.services.providers import ProviderManager
+from app.services.providers import ProviderExecutionError, ProviderManager
+from app.services.response_cache import AsyncTTLCache, make_cache_key
+from app.services.semantic_cache import SemanticCache
 
 logger = get_logger(__name__)
 
+_FENCE_RE = re.compile(r"^```(?:markdown|md)?\s*\n(?P<body>[\s\S]*?)\n```$")
+# One pass over the body finds H1 headings (capturing a title when the heading has
+# one) and a Sources heading. H1 matches consume only the "#", so a title lookahead
+# never swallows a following Sources line.
+_BODY_SCAN_RE = re.compile(
+    r"^(?:#(?=\s)(?:(?=\s+(?P<title>.+)$))?|(?P<sources>##\s+Sources\b))", re.MULTILINE
+)
+# Bodies above this size are formatted off the event loop.
+_FORMAT_OFFLOAD_THRESHOLD = 8_192
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z](?:[A-Za-z0-9 _.-]*[A-Za-z0-9_.])?")
+_YAML_NON_PRINTABLE_RE = re.compile("[\x7f-\x9f\u2028\u2029\ufffe\uffff]")
+_YAML_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+STATIC_RESEARCH_INSTRUCTIONS: tuple[str, ...] = (
+    "You are a research analyst producing Obsidian markdown notes.",
+    "Use web search capability to gather current, credible sources.",
+    "Cite claims with links whenever possible.",
+    "Structure output with sections: Overview, Key Points, Details, Sources.",
+    "Use markdown only in your response.",
+)
+
+DEPTH_INSTRUCTIONS: dict[ResearchDepth, str] = {
+    ResearchDepth.QUICK: "Keep the analysis concise. Focus on 3-5 key points.",
+    ResearchDepth.STANDARD: "Provide balanced coverage with clear key points and practical implications.",
+    ResearchDepth.DEEP: "Provide deep analysis with nuanced trade-offs, competing views, and detailed evidence.",
+}
+
+
+def _yaml_scalar(value: str) -> str:
+    """Render a string as a YAML scalar that always loads back as the same string."""
+    if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+        return value
+    # JSON strings are valid YAML double-quoted scalars; escape what YAML rejects as raw text.
+    quoted = json.dumps(value, ensure_ascii=False)
+    return _YAML_NON_PRINTABLE_RE.sub(lambda match: f"\\u{ord(match.group()):04x}", quoted)
+
+
+def _emit_frontmatter(frontmatter: dict[str, str | list[str]]) -> str:
+    """Emit flat frontmatter of strings and string lists as a YAML block."""
+    lines: list[str] = []
+    for key, value in frontmatter.items():
+        if isinstance(value, str):
+            lines.append(f"{key}: {_yaml_scalar(value)}")
+        elif value:
+            lines.append(f"{key}:")
+            lines.extend(f"- {_yaml_scalar(item)}" for item in value)
+        else:
+            lines.append(f"{key}: []")
+    return "\n".join(lines)
+
+
+class _BodyScan(NamedTuple):
+    title: str | None
+    has_h1: bool
+    has_sources: bool
+
+
+@dataclass
+class _CacheProbe:
+    """Outcome of a cache lookup, carrying what is needed to store the result later."""
+
+    semantic_namespace: str
+    cache_key: str | None = None
+    semantic_vector: tuple[float, ...] | None = None
+    hit: ResearchResponse | None = None
+
 
 class ResearchAgent:
     """AI research agent with provider-native web-search support."""
 
-    def __init__(self, provider_manager: ProviderManager) -> None:
+    def __init__(
+        self,
+        provider_manager: ProviderManager,
+        response_cache: AsyncTTLCache[ResearchResponse] | None = None,
+        semantic_cache: SemanticCache[ResearchResponse] | None = None,
+    ) -> None:
         """Initialize research agent."""
         self.provider_manager = provider_manager
+        self.response_cache = response_cache
+        self.semantic_cache = semantic_cache
+        self._agent_pool = AgentPool()
 
     def _build_instructions(self, depth: ResearchDepth, focus_areas: list[str]) -> list[str]:
-        depth_instruction = {
-            ResearchDepth.QUICK: "Keep the analysis concise. Focus on 3-5 key points.",
-            ResearchDepth.STANDARD: "Provide balanced coverage with clear key points and practical implications.",
-            ResearchDepth.DEEP: "Provide deep analysis with nuanced trade-offs, competing views, and detailed evidence.",
-        }[depth]
-
-        instructions = [
-            "You are a research analyst producing Obsidian markdown notes.",
-            "Use web search capability to gather current, credible sources.",
-            "Cite claims with links whenever possible.",
-            "Structure output with sections: Overview, Key Points, Details, Sources.",
-            depth_instruction,
-            "Use markdown only in your response.",
-        ]
+        # Static lines come first so provider-side prefix caching can reuse them;
+        # request-specific guidance is appended after the shared prefix.
+        instructions = [*STATIC_RESEARCH_INSTRUCTIONS, DEPTH_INSTRUCTIONS[depth]]
 
         if focus_areas:
             instructions.append(f"Prioritize these focus areas: {', '.join(focus_areas)}")
@@ -64,7 +133,7 @@ class ResearchAgent:
     def _strip_wrapping_markdown_fence(body: str) -> str:
         """Strip a single wrapping fenced markdown block if present."""
         text = body.strip()
-        fenced_match = re.match(r"^```(?:markdown|md)?\s*\n(?P<body>[\s\S]*?)\n```$", text)
+        fenced_match = _FENCE_RE.match(text)
         if fenced_match:
             return fenced_match.group("body").strip()
         return text
@@ -77,22 +146,16 @@ class ResearchAgent:
         if not urls:
             return []
 
-        deduped: dict[str, SourceReference] = {}
+        seen: set[str] = set()
+        sources: list[SourceReference] = []
         for citation in urls:
-            citation_data = asdict(citation) if hasattr(citation, "__dataclass_fields__") else {}
-            url = citation_data.get("url") or getattr(citation, "url", None)
-            title = citation_data.get("title") or getattr(citation, "title", None)
-            if url and url not in deduped:
-                deduped[url] = SourceReference(url=url, title=title)
-
-        return list(deduped.values())
+            url = getattr(citation, "url", None)
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            sources.append(SourceReference(url=url, title=getattr(citation, "title", None)))
 
-    @staticmethod
-    def _extract_title(topic: str, body: str) -> str:
-        heading_match = re.search(r"^#\s+(.+)$", body, flags=re.MULTILINE)
-        if heading_match:
-            return heading_match.group(1).strip()
-        return topic.strip()
+        return sources
 
     @staticmethod
     def _render_frontmatter(
@@ -104,7 +167,7 @@ class ResearchAgent:
         model: str,
         sources: list[SourceReference],
     ) -> str:
-        frontmatter = {
+        frontmatter: dict[str, str | list[str]] = {
             "title": title,
             "topic": topic,
             "date": datetime.now(UTC).date().isoformat(),
@@ -117,24 +180,35 @@ class ResearchAgent:
             "sources": [source.url for source in sources],
         }
 
-        yaml_block = yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=False).strip()
-        return f"---\n{yaml_block}\n---"
+        return f"---\n{_emit_frontmatter(frontmatter)}\n---"
 
     @staticmethod
-    def _append_sources_if_missing(body: str, sources: list[SourceReference]) -> str:
-        if re.search(r"^##\s+Sources\b", body, flags=re.MULTILINE):
-            return body
+    def _scan_body(body: str) -> _BodyScan:
+        """Find the first H1 title and any Sources heading in a single pass."""
+        title: str | None = None
+        has_h1 = False
+        has_sources = False
+        for match in _BODY_SCAN_RE.finditer(body):
+            if match.group("sources") is not None:
+                has_sources = True
+            else:
+                has_h1 = True
+                if title is None and match.group("title") is not None:
+                    title = match.group("title")
+            if has_sources and title is not None:
+                break
+        return _BodyScan(title=title, has_h1=has_h1, has_sources=has_sources)
 
+    @staticmethod
+    def _render_sources_section(sources: list[SourceReference]) -> str:
         if not sources:
-            return f"{body}\n\n## Sources\n\n- No explicit citations were returned by the provider."
+            return "\n\n## Sources\n\n- No explicit citations were returned by the provider."
 
         lines = []
         for index, source in enumerate(sources, start=1):
             title = source.title if source.title else source.url
             lines.append(f"{index}. [{title}]({source.url})")
-
-        sources_section = "\n".join(lines)
-        return f"{body}\n\n## Sources\n\n{sources_section}"
+        return "\n\n## Sources\n\n" + "\n".join(lines)
 
     def _format_markdown(
         self,
@@ -147,23 +221,43 @@ class ResearchAgent:
         sources: list[SourceReference],
     ) -> str:
         normalized_body = self._strip_wrapping_markdown_fence(body)
-        title = self._extract_title(topic, normalized_body)
-
-        if not re.search(r"^#\s+", normalized_body, flags=re.MULTILINE):
-            normalized_body = f"# {title}\n\n{normalized_body}"
+        scan = self._scan_body(normalized_body)
+        title = (scan.title if scan.title is not None else topic).strip()
 
-        normalized_body = self._append_sources_if_missing(normalized_body, sources)
-        frontmatter = self._render_frontmatter(
-            title=title,
-            topic=topic,
-            depth=depth,
+        parts = [
+            self._render_frontmatter(
+                title=title,
+                topic=topic,
+                depth=depth,
+                provider=provider,
+                model=model,
+                sources=sources,
+            ),
+            "\n\n",
+        ]
+        if not scan.has_h1:
+            parts.append(f"# {title}\n\n")
+        parts.append(normalized_body)
+        if not scan.has_sources:
+            parts.append(self._render_sources_section(sources))
+        parts.append("\n")
+        return "".join(parts)
+
+    def _get_agent(
+        self, *, depth: ResearchDepth, focus_areas: list[str], provider: ProviderType
+    ) -> Agent:
+        instructions = self._build_instructions(depth=depth, focus_areas=focus_areas)
+        return self._agent_pool.get(
             provider=provider,
-            model=model,
-            sources=sources,
+            variant=depth.value,
+            instructions=instructions,
+            factory=lambda: Agent(
+                model=self.provider_manager.get_research_model(provider=provider, depth=depth),
+                instructions=instructions,
+                markdown=True,
+            ),
         )
 
-        return f"{frontmatter}\n\n{normalized_body}\n"
-
     async def _run_research_with_provider(
         self,
         *,
@@ -172,40 +266,93 @@ class ResearchAgent:
         focus_areas: list[str],
         provider: ProviderType,
     ) -> RunOutput:
-        model = self.provider_manager.get_research_model(provider=provider, depth=depth)
-
-        agent = Agent(
-            model=model,
-            instructions=self._build_instructions(depth=depth, focus_areas=focus_areas),
-            markdown=True,
-        )
-
+        agent = self._get_agent(depth=depth, focus_areas=focus_areas, provider=provider)
         return await agent.arun(
             self._build_prompt(topic=topic, depth=depth, focus_areas=focus_areas)
         )
 
-    async def research(
+    async def _probe_caches(
         self,
         *,
         topic: str,
-        depth: ResearchDepth = ResearchDepth.STANDARD,
-        provider: ProviderType | None = None,
-        focus_areas: list[str] | None = None,
-    ) -> ResearchResponse:
-        """Run research and return Obsidian-ready markdown + metadata."""
-        start = perf_counter()
-        focus_areas = focus_areas or []
+        depth: ResearchDepth,
+        provider: ProviderType | None,
+        focus_areas: list[str],
+        start: float,
+    ) -> _CacheProbe:
+        """Look the request up in the exact and semantic caches."""
+        probe = _CacheProbe(
+            semantic_namespace=f"{depth.value}:{provider.value if provider is not None else ''}"
+        )
 
-        run_output, used_provider = await self.provider_manager.run_with_fallback(
-            operation=lambda candidate: self._run_research_with_provider(
-                topic=topic,
-                depth=depth,
-                focus_areas=focus_areas,
-                provider=candidate,
-            ),
-            preferred_provider=provider,
+        if self.response_cache is not None:
+            probe.cache_key = make_cache_key(
+                {
+                    "topic": topic,
+                    "depth": depth.value,
+                    "focus_areas": sorted(focus_areas),
+                    "p": provider.value if provider is not None else None,
+                }
+            )
+            cached = await self.response_cache.get(probe.cache_key)
+            if cached is not None:
+                logger.info(
+                    "Research served from cache",
+                    extra={"topic": topic, "provider": cached.metadata.provider.value},
+                )
+                probe.hit = self._as_cache_hit(cached, start=start)
+                return probe
+
+        if self.semantic_cache is not None:
+            try:
+                probe.semantic_vector = await self.semantic_cache.embed(
+                    f"{topic}|{depth.value}|{','.join(sorted(focus_areas))}"
+                )
+                similar = await self.semantic_cache.search(
+                    probe.semantic_vector, probe.semantic_namespace
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Semantic cache lookup failed", extra={"error": str(exc)})
+                similar = None
+            if similar is not None:
+                logger.info(
+                    "Research served from semantic cache",
+                    extra={"topic": topic, "cached_topic": similar.topic},
+                )
+                # Served as cached: the note's title and frontmatter name the cached
+                # topic, so the response keeps that topic instead of the requested one.
+                probe.hit = self._as_cache_hit(similar, start=start)
+
+        return probe
+
+    @staticmethod
+    def _as_cache_hit(cached: ResearchResponse, *, start: float) -> ResearchResponse:
+        """
+        Copy a cached response for this request.
+
+        Timing reflects this request, and no provider tokens were spent on it, so the
+        response is marked cached with zero tokens and callers skip usage charges.
+        """
+        metadata = cached.metadata.model_copy(
+            update={
+                "duration_seconds": round(perf_counter() - start, 4),
+                "tokens_used": 0,
+                "cached": True,
+            }
         )
+        return cached.model_copy(update={"metadata": metadata})
 
+    async def _finalize(
+        self,
+        *,
+        topic: str,
+        depth: ResearchDepth,
+        run_output: RunOutput,
+        used_provider: ProviderType,
+        probe: _CacheProbe,
+        start: float,
+    ) -> ResearchResponse:
+        """Turn a completed provider run into a formatted, cached response."""
         body = str(run_output.content) if getattr(run_output, "content", None) is not None else ""
         sources = self._extract_sources(run_output)
 
@@ -213,14 +360,18 @@ class ResearchAgent:
             run_output, "model", None
         ) or self.provider_manager.get_research_model_name(provider=used_provider, depth=depth)
 
-        markdown = self._format_markdown(
-            topic=topic,
-            depth=depth,
-            provider=used_provider,
-            model=model_name,
-            body=body,
-            sources=sources,
-        )
+        format_kwargs: dict[str, Any] = {
+            "topic": topic,
+            "depth": depth,
+            "provider": used_provider,
+            "model": model_name,
+            "body": body,
+            "sources": sources,
+        }
+        if len(body) > _FORMAT_OFFLOAD_THRESHOLD:
+            markdown = await asyncio.to_thread(self._format_markdown, **format_kwargs)
+        else:
+            markdown = self._format_markdown(**format_kwargs)
 
         metrics: Any = getattr(run_output, "metrics", None)
         tokens_used = getattr(metrics, "total_tokens", None) if metrics is not None else None
@@ -249,9 +400,132 @@ class ResearchAgent:
             },
         )
 
-        return ResearchResponse(
+        response = ResearchResponse(
             topic=topic,
             markdown=markdown,
             sources=sources,
             metadata=metadata,
         )
+
+        if self.response_cache is not None and probe.cache_key is not None:
+            await self.response_cache.set(probe.cache_key, response)
+        if self.semantic_cache is not None and probe.semantic_vector is not None:
+            await self.semantic_cache.add(probe.semantic_vector, probe.semantic_namespace, response)
+        return response
+
+    async def research(
+        self,
+        *,
+        topic: str,
+        depth: ResearchDepth = ResearchDepth.STANDARD,
+        provider: ProviderType | None = None,
+        focus_areas: list[str] | None = None,
+    ) -> ResearchResponse:
+        """Run research and return Obsidian-ready markdown + metadata."""
+        start = perf_counter()
+        focus_areas = focus_areas or []
+
+        probe = await self._probe_caches(
+            topic=topic, depth=depth, provider=provider, focus_areas=focus_areas, start=start
+        )
+        if probe.hit is not None:
+            return probe.hit
+
+        run_output, used_provider = await self.provider_manager.run_with_fallback(
+            operation=lambda candidate: self._run_research_with_provider(
+                topic=topic,
+                depth=depth,
+                focus_areas=focus_areas,
+                provider=candidate,
+            ),
+            preferred_provider=provider,
+            scope="research",
+            # Identical research requests that miss the caches together share one run.
+            dedup_key=("research", topic, depth, tuple(focus_areas)),
+        )
+
+        return await self._finalize(
+            topic=topic,
+            depth=depth,
+            run_output=run_output,
+            used_provider=used_provider,
+            probe=probe,
+            start=start,
+        )
+
+    async def research_stream(
+        self,
+        *,
+        topic: str,
+        depth: ResearchDepth = ResearchDepth.STANDARD,
+        provider: ProviderType | None = None,
+        focus_areas: list[str] | None = None,
+    ) -> AsyncIterator[str | ResearchResponse]:
+        """
+        Run research, yielding raw content chunks as they arrive.
+
+        The final item is the formatted ResearchResponse. Provider fallback only
+        applies until the first chunk has been yielded; a failure after that is
+        raised to the caller.
+
+        Raises:
+            ProviderExecutionError: If every provider fails before producing output
+            ProviderNotConfiguredError: If no valid providers are configured
+        """
+        start = perf_counter()
+        focus_areas = focus_areas or []
+
+        probe = await self._probe_caches(
+            topic=topic, depth=depth, provider=provider, focus_areas=focus_areas, start=start
+        )
+        if probe.hit is not None:
+            yield probe.hit
+            return
+
+        prompt = self._build_prompt(topic=topic, depth=depth, focus_areas=focus_areas)
+        errors: list[tuple[ProviderType, Exception]] = []
+
+        for candidate in self.provider_manager.get_provider_chain(provider):
+            streamed = False
+            run_output: RunOutput | None = None
+            try:
+                async with self.provider_manager.concurrency_slot(candidate, "research"):
+                    agent = self._get_agent(
+                        depth=depth, focus_areas=focus_areas, provider=candidate
+                    )
+                    async for event in agent.arun(prompt, stream=True, yield_run_output=True):
+                        if isinstance(event, RunOutput):
+                            run_output = event
+                        elif isinstance(event, RunContentEvent) and event.content:
+                            streamed = True
+                            yield str(event.content)
+                if run_output is None:
+                    raise RuntimeError("Stream ended without a final run output")
+            except Exception as exc:
+                if streamed:
+                    raise
+                errors.append((candidate, exc))
+                logger.warning(
+                    "Provider stream failed, trying next provider if available",
+                    extra={"provider": candidate.value, "error": str(exc)},
+                )
+                continue
+
+            yield await self._finalize(
+                topic=topic,
+                depth=depth,
+                run_output=run_output,
+                used_provider=candidate,
+                probe=probe,
+                start=start,
+            )
+            return
+
+        attempted = [candidate for candidate, _ in errors]
+        last_error = errors[-1][1]
+        raise ProviderExecutionError(
+            message="All provider execution attempts failed: "
+            + ", ".join(candidate.value for candidate in attempted),
+            attempted_providers=attempted,
+            last_error=last_error,
+        ) from last_error
@@ -0,0 +1,139 @@
+"""Deferred bookkeeping helpers for route handlers."""
+
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import BackgroundTasks, Request
+
+from app.core.logging import get_logger
+from app.services.history import HistoryService
+
+logger = get_logger(__name__)
+
+
+async def run_bookkeeping(operation: Callable[..., Awaitable[None]], /, **kwargs: Any) -> None:
+    """
+    Run a bookkeeping write, logging failures instead of raising them.
+
+    Intended for use with BackgroundTasks so history and usage writes happen after
+    the response is sent and can never fail a request that already succeeded.
+
+    Args:
+        operation: Async bookkeeping callable (e.g. HistoryService.record_execution)
+        **kwargs: Keyword arguments passed to operation
+    """
+    try:
+        await operation(**kwargs)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(
+            "Bookkeeping write failed",
+            extra={
+                "operation": getattr(operation, "__qualname__", repr(operation)),
+                "error": str(exc),
+            },
+            exc_info=True,
+        )
+
+
+def request_elapsed_seconds(request: Request) -> float | None:
+    """
+    Return seconds elapsed since the request middleware saw this request.
+
+    Args:
+        request: Current request
+
+    Returns:
+        Elapsed seconds, or None if the start time was not captured
+    """
+    start: float | None = getattr(request.state, "start_monotonic", None)
+    if start is None:
+        return None
+    return time.monotonic() - start
+
+
+@dataclass
+class ExecutionRecord:
+    """Execution fields filled in by a handler for the success history entry."""
+
+    provider: str | None = None
+    model: str | None = None
+    duration_seconds: float | None = None
+    tokens_used: int | None = None
+    estimated_cost: float | None = None
+    metadata: dict[str, object] = field(default_factory=dict)
+
+
+@asynccontextmanager
+async def track_execution(
+    history_service: HistoryService | None,
+    *,
+    request_id: str | None,
+    api_key_id: str,
+    agent: str,
+    provider: str | None,
+    metadata: dict[str, object] | None = None,
+    background_tasks: BackgroundTasks | None = None,
+) -> AsyncIterator[ExecutionRecord]:
+    """
+    Record one agent execution in history, whichever way the block exits.
+
+    On an exception a failed entry carrying the requested provider and initial metadata
+    is written before the exception propagates. On clean exit a completed entry is built
+    from the yielded record; it is scheduled on background_tasks when given (so it runs
+    after the response is sent) and written immediately otherwise. Without a history
+    service nothing is written.
+
+    Args:
+        history_service: History service receiving the entry, if history is enabled
+        request_id: Current request ID
+        api_key_id: Authenticated API key ID
+        agent: Agent name
+        provider: Requested provider, if any
+        metadata: Initial execution metadata
+        background_tasks: Response background tasks for deferring the success write
+
+    Yields:
+        Record for the handler to fill in with execution results
+    """
+    record = ExecutionRecord(provider=provider, metadata=dict(metadata or {}))
+    try:
+        yield record
+    except Exception as exc:
+        if history_service is None:
+            raise
+        await history_service.record_execution(
+            request_id=request_id,
+            api_key_id=api_key_id,
+            agent=agent,
+            status="failed",
+            provider=provider,
+            model=None,
+            duration_seconds=None,
+            tokens_used=None,
+            estimated_cost=None,
+            error=str(exc),
+            metadata=metadata,
+        )
+        raise
+
+    if history_service is None:
+        return
+    completed: dict[str, Any] = {
+        "request_id": request_id,
+        "api_key_id": api_key_id,
+        "agent": agent,
+        "status": "completed",
+        "provider": record.provider,
+        "model": record.model,
+        "duration_seconds": record.duration_seconds,
+        "tokens_used": record.tokens_used,
+        "estimated_cost": record.estimated_cost,
+        "metadata": record.metadata,
+    }
+    if background_tasks is not None:
+        background_tasks.add_task(run_bookkeeping, history_service.record_execution, **completed)
+    else:
+        await run_bookkeeping(history_service.record_execution, **completed)
@@ -0,0 +1,47 @@
+"""Dependencies exposing application-scoped services created during startup.
+
+The lifespan sets each service exactly once, so lookups only check for presence and
+trust the stored type instead of re-validating it with isinstance on every request.
+"""
+
+from fastapi import HTTPException, Request
+
+from app.services.history import HistoryService
+from app.services.providers import ProviderManager
+from app.services.rate_limiter import RateLimiter
+
+
+def get_history_service(request: Request) -> HistoryService:
+    """Fetch initialized history service from app state."""
+    service: HistoryService | None = getattr(request.app.state, "history_service", None)
+    if service is None:
+        raise HTTPException(status_code=500, detail="History service is not initialized")
+    return service
+
+
+def get_rate_limiter(request: Request) -> RateLimiter:
+    """Fetch initialized rate limiter from app state."""
+    limiter: RateLimiter | None = getattr(request.app.state, "rate_limiter", None)
+    if limiter is None:
+        raise HTTPException(status_code=500, detail="Rate limiter is not initialized")
+    return limiter
+
+
+def get_optional_history_service(request: Request) -> HistoryService | None:
+    """Fetch the history service if initialized; agent routes skip history without it."""
+    service: HistoryService | None = getattr(request.app.state, "history_service", None)
+    return service
+
+
+def get_optional_rate_limiter(request: Request) -> RateLimiter | None:
+    """Fetch the rate limiter if initialized; agent routes skip usage tracking without it."""
+    limiter: RateLimiter | None = getattr(request.app.state, "rate_limiter", None)
+    return limiter
+
+
+def get_provider_manager(request: Request) -> ProviderManager:
+    """Fetch the provider manager shared by agents and health checks."""
+    manager: ProviderManager | None = getattr(request.app.state, "provider_manager", None)
+    if manager is None:
+        raise HTTPException(status_code=500, detail="Provider manager is not initialized")
+    return manager
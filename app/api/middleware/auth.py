@@ -1,5 +1,6 @@
 """Authentication middleware."""
 
+import logging
 from contextvars import ContextVar
 from datetime import UTC, datetime
 
@@ -17,6 +18,14 @@ api_key_id_context: ContextVar[str] = ContextVar("api_key_id", default="")
 # FastAPI security scheme for API key
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# First path segment -> rate limit scope ("/agents/..." is resolved separately).
+_PATH_RATE_LIMIT_AGENTS: dict[str, str] = {
+    "chat": "chat",
+    "tasks": "tasks",
+    "history": "history",
+    "health": "health",
+}
+
 
 async def get_current_api_key(
     x_api_key: str | None = Header(default=None, alias="X-API-Key"),
@@ -37,12 +46,13 @@ async def get_current_api_key(
     Raises:
         HTTPException: 401 if key is missing or invalid, 403 if revoked
     """
-    settings = get_settings()
+    # Resolve the auth section once; everything below reads from this local.
+    auth = get_settings().auth
     # Prevent leaking key IDs across requests in case of auth failures.
     api_key_id_context.set("")
 
     # Skip authentication if disabled (useful for development)
-    if not settings.auth.enabled:
+    if not auth.enabled:
         logger.debug("Authentication is disabled")
         dev_key = APIKey(
             key_id="dev",
@@ -83,22 +93,17 @@ async def get_current_api_key(
 
     # Find matching key in configuration
     stored_key = None
-    for key_config in settings.auth.api_keys:
-        config_hash = key_config.key_hash
-        if config_hash is None:
-            if key_config.key is None:
-                continue
-            config_hash = hash_api_key(key_config.key)
-
-        if config_hash == key_hash:
-            stored_key = APIKey(
-                key_id=key_config.key_id,
-                name=key_config.name,
-                key_hash=config_hash,
-                status=key_config.status,
-                last_used_at=datetime.now(UTC),
-            )
-            break
+    key_config = auth.key_index.get(key_hash)
+    # The lookup is keyed by the SHA-256 of the provided key, so its timing reveals
+    # nothing usable about the raw key; no separate constant-time comparison is needed.
+    if key_config is not None:
+        stored_key = APIKey(
+            key_id=key_config.key_id,
+            name=key_config.name,
+            key_hash=key_hash,
+            status=key_config.status,
+            last_used_at=datetime.now(UTC),
+        )
 
     if not stored_key:
         logger.warning("API key not found", extra={"key_hash": key_hash[:16]})
@@ -119,10 +124,11 @@ async def get_current_api_key(
             detail="API key has been revoked",
         )
 
-    logger.debug(
-        "API key validated",
-        extra={"key_id": stored_key.key_id, "key_name": stored_key.name},
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "API key validated",
+            extra={"key_id": stored_key.key_id, "key_name": stored_key.name},
+        )
 
     api_key_id_context.set(stored_key.key_id)
 
@@ -174,14 +180,7 @@ async def get_authenticated_api_key(
 
 def _resolve_rate_limit_agent(path: str) -> str:
     """Map request path to agent-specific rate limit scope."""
-    if path.startswith("/chat"):
-        return "chat"
-    if path.startswith("/agents/research"):
-        return "research"
-    if path.startswith("/tasks"):
-        return "tasks"
-    if path.startswith("/history"):
-        return "history"
-    if path.startswith("/health"):
-        return "health"
-    return "default"
+    first_segment = path[1:].partition("/")[0]
+    if first_segment == "agents":
+        return "research" if path.startswith("/agents/research") else "default"
+    return _PATH_RATE_LIMIT_AGENTS.get(first_segment, "default")
@@ -1,11 +1,12 @@
 """Request ID middleware."""
 
+import logging
 import time
 from contextvars import ContextVar
+from typing import Any
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import get_logger
 from app.core.security import generate_request_id
@@ -16,7 +17,7 @@ logger = get_logger(__name__)
 request_id_context: ContextVar[str] = ContextVar("request_id", default="")
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware to add request ID to all requests and responses.
 
@@ -24,107 +25,128 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Response headers (X-Request-ID)
     - Logging context
     - Request state (accessible via request.state.request_id)
+
+    The monotonic start time is stored as request.state.start_monotonic so handlers
+    can report durations without their own timers.
+
+    Implemented as plain ASGI middleware so requests are not wrapped in the extra
+    task and response stream that BaseHTTPMiddleware adds.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
         """
-        Process request and add request ID.
+        Initialize the middleware.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
+            app: The downstream ASGI application
+        """
+        self.app = app
 
-        Returns:
-            Response with X-Request-ID header
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
+        Process request and add request ID.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate or use provided request ID
-        req_id = request.headers.get("X-Request-ID", generate_request_id())
+        req_id = Headers(scope=scope).get("X-Request-ID") or generate_request_id()
 
         # Store in request state
-        request.state.request_id = req_id
+        state: dict[str, Any] = scope.setdefault("state", {})
+        state["request_id"] = req_id
+        state["start_monotonic"] = time.monotonic()
 
         # Store in context variable for logging
         request_id_context.set(req_id)
-        history_service = getattr(request.app.state, "history_service", None)
+        history_service = getattr(scope["app"].state, "history_service", None)
+
+        method: str = scope["method"]
+        path: str = scope["path"]
+        client_addr = scope.get("client")
+        client = client_addr[0] if client_addr else None
 
         # Log request
-        start_time = time.time()
-        logger.info(
-            "Request started",
-            extra={
-                "request_id": req_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client": request.client.host if request.client else None,
-            },
-        )
+        start_ns = time.perf_counter_ns()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request started",
+                extra={"request_id": req_id, "method": method, "path": path, "client": client},
+            )
+
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = req_id
+                rate_limit_headers = state.get("rate_limit_headers")
+                if isinstance(rate_limit_headers, dict):
+                    for header_name, header_value in rate_limit_headers.items():
+                        headers[header_name] = header_value
+            await send(message)
 
         # Process request
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         except Exception as exc:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             # Log error with request ID
             logger.error(
                 "Request failed with exception",
-                extra={
-                    "request_id": req_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "error": str(exc),
-                },
+                extra={"request_id": req_id, "method": method, "path": path, "error": str(exc)},
                 exc_info=True,
             )
 
             if history_service is not None:
                 await history_service.record_request(
                     request_id=req_id,
-                    api_key_id=getattr(request.state, "api_key_id", None),
-                    method=request.method,
-                    path=request.url.path,
+                    api_key_id=state.get("api_key_id"),
+                    method=method,
+                    path=path,
                     status_code=500,
                     duration_ms=duration_ms,
-                    client=request.client.host if request.client else None,
+                    client=client,
                     error=str(exc),
                 )
             raise
 
         # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = req_id
-        rate_limit_headers = getattr(request.state, "rate_limit_headers", None)
-        if isinstance(rate_limit_headers, dict):
-            for header_name, header_value in rate_limit_headers.items():
-                response.headers[header_name] = header_value
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Log response
-        logger.info(
-            "Request completed",
-            extra={
-                "request_id": req_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request completed",
+                extra={
+                    "request_id": req_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "duration_ms": round(duration_ms, 2),
+                },
+            )
 
         if history_service is not None:
             await history_service.record_request(
                 request_id=req_id,
-                api_key_id=getattr(request.state, "api_key_id", None),
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
+                api_key_id=state.get("api_key_id"),
+                method=method,
+                path=path,
+                status_code=status_code,
                 duration_ms=duration_ms,
-                client=request.client.host if request.client else None,
+                client=client,
             )
 
-        return response
-
 
 def get_request_id() -> str:
     """
@@ -0,0 +1,26 @@
+"""Response helpers for route handlers."""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, *, status_code: int = 200) -> Response:
+    """
+    Serialize an already-validated model straight to a JSON response.
+
+    Returning the model itself makes FastAPI validate it against response_model again
+    before serializing; handlers whose models are built server-side can skip that pass.
+    Keep response_model on the route so the OpenAPI schema is unchanged.
+
+    Args:
+        model: Response model instance
+        status_code: HTTP status code
+
+    Returns:
+        JSON response containing the model's serialized fields
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
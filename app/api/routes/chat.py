@@ -1,31 +1,39 @@
 """Chat endpoint for testing provider integration."""
 
-from time import perf_counter
-
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 
 from app.agents.chat import ChatAgent
+from app.api.bookkeeping import request_elapsed_seconds, run_bookkeeping, track_execution
+from app.api.dependencies import get_optional_history_service, get_optional_rate_limiter
 from app.api.middleware import get_authenticated_api_key
-from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.auth import APIKey
 from app.models.chat import ChatRequest, ChatResponse
-from app.services.providers import ProviderManager, ProviderNotConfiguredError
+from app.services.history import HistoryService
+from app.services.providers import ProviderNotConfiguredError
+from app.services.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# Initialize provider manager and chat agent
-settings = get_settings()
-provider_manager = ProviderManager(settings.providers)
-chat_agent = ChatAgent(provider_manager)
+
+def get_chat_agent(request: Request) -> ChatAgent:
+    """Fetch the chat agent created during application startup."""
+    agent: ChatAgent | None = getattr(request.app.state, "chat_agent", None)
+    if agent is None:
+        raise HTTPException(status_code=500, detail="Chat agent is not initialized")
+    return agent
 
 
 @router.post("", response_model=ChatResponse)
 async def chat(
     payload: ChatRequest,
     http_request: Request,
+    background_tasks: BackgroundTasks,
     api_key: APIKey = Depends(get_authenticated_api_key),
+    chat_agent: ChatAgent = Depends(get_chat_agent),
+    history_service: HistoryService | None = Depends(get_optional_history_service),
+    rate_limiter: RateLimiter | None = Depends(get_optional_rate_limiter),
 ) -> ChatResponse:
     """
     Send a message to the chat agent and get a response.
@@ -34,7 +42,11 @@ async def chat(
 
     Args:
         request: Chat request with message and optional provider
+        background_tasks: Tasks run after the response is sent (injected)
         api_key: API key from authentication (injected)
+        chat_agent: Shared chat agent (injected)
+        history_service: Execution history recorder, if initialized (injected)
+        rate_limiter: Usage tracker for rate limiting, if initialized (injected)
 
     Returns:
         Chat response with reply and metadata
@@ -43,72 +55,42 @@ async def chat(
         HTTPException: If provider is not configured or request fails
     """
     try:
-        start = perf_counter()
-        response = await chat_agent.chat(
-            message=payload.message,
+        async with track_execution(
+            history_service,
+            request_id=http_request.state.request_id,
+            api_key_id=api_key.key_id,
+            agent="chat",
             provider=payload.provider,
-        )
-
-        history_service = getattr(http_request.app.state, "history_service", None)
-        if history_service is not None:
-            await history_service.record_execution(
-                request_id=getattr(http_request.state, "request_id", None),
-                api_key_id=api_key.key_id,
-                agent="chat",
-                status="completed",
-                provider=response.provider.value,
-                model=response.model,
-                duration_seconds=round(perf_counter() - start, 4),
-                tokens_used=None,
-                estimated_cost=None,
-            )
-
-        rate_limiter = getattr(http_request.app.state, "rate_limiter", None)
-        if rate_limiter is not None:
-            await rate_limiter.record_usage(
-                api_key_id=api_key.key_id,
-                agent="chat",
-                tokens=None,
-                estimated_cost=None,
+            background_tasks=background_tasks,
+        ) as execution:
+            response = await chat_agent.chat(
+                message=payload.message,
+                provider=payload.provider,
             )
-        return response
+            execution.provider = response.provider
+            execution.model = response.model
+            execution.duration_seconds = request_elapsed_seconds(http_request)
 
     except ProviderNotConfiguredError as e:
-        history_service = getattr(http_request.app.state, "history_service", None)
-        if history_service is not None:
-            await history_service.record_execution(
-                request_id=getattr(http_request.state, "request_id", None),
-                api_key_id=api_key.key_id,
-                agent="chat",
-                status="failed",
-                provider=payload.provider.value if payload.provider is not None else None,
-                model=None,
-                duration_seconds=None,
-                tokens_used=None,
-                estimated_cost=None,
-                error=str(e),
-            )
         logger.error("Provider not configured", extra={"error": str(e)})
         raise HTTPException(status_code=400, detail=str(e)) from e
 
     except Exception as e:
-        history_service = getattr(http_request.app.state, "history_service", None)
-        if history_service is not None:
-            await history_service.record_execution(
-                request_id=getattr(http_request.state, "request_id", None),
-                api_key_id=api_key.key_id,
-                agent="chat",
-                status="failed",
-                provider=payload.provider.value if payload.provider is not None else None,
-                model=None,
-                duration_seconds=None,
-                tokens_used=None,
-                estimated_cost=None,
-                error=str(e),
-            )
         logger.error(
             "Chat request failed",
             extra={"error": str(e)},
             exc_info=True,
         )
         raise HTTPException(status_code=500, detail="Chat request failed") from e
+
+    # Usage bookkeeping runs after the response is sent.
+    if rate_limiter is not None:
+        background_tasks.add_task(
+            run_bookkeeping,
+            rate_limiter.record_usage,
+            api_key_id=api_key.key_id,
+            agent="chat",
+            tokens=None,
+            estimated_cost=None,
+        )
+    return response
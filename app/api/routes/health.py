@@ -1,10 +1,14 @@
 """Health check endpoint."""
 
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
 from pydantic import BaseModel
 
+from app.api.dependencies import get_provider_manager
 from app.api.middleware import get_authenticated_api_key
 from app.core.config import Settings, get_settings
 from app.models.auth import APIKey
@@ -13,6 +17,26 @@ from app.services.providers import ProviderManager
 
 router = APIRouter()
 
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_TIMESTAMP_TTL_SECONDS = 1.0
+_health_timestamp: tuple[float, bytes] = (float("-inf"), b"")
+
+
+@lru_cache(maxsize=8)
+def _health_suffix(service: str, version: str) -> bytes:
+    """Return the pre-serialized tail of the health payload for service/version."""
+    return b'","service":' + orjson.dumps(service) + b',"version":' + orjson.dumps(version) + b"}"
+
+
+def _current_health_timestamp() -> bytes:
+    """Return the ISO timestamp for health responses, refreshed at most once per second."""
+    global _health_timestamp
+    now = time.monotonic()
+    if now - _health_timestamp[0] >= _HEALTH_TIMESTAMP_TTL_SECONDS:
+        # Serialized like the rest of the API: UTC with a "Z" suffix, without the quotes.
+        _health_timestamp = (now, orjson.dumps(datetime.now(UTC), option=orjson.OPT_UTC_Z)[1:-1])
+    return _health_timestamp[1]
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -31,32 +55,48 @@ class ProviderHealthResponse(BaseModel):
     providers: list[ProviderHealth]
 
 
+_HEALTHZ_BODY = b'{"status":"ok"}'
+
+
+@router.get("/healthz", tags=["System"])
+async def liveness_probe() -> Response:
+    """
+    Unauthenticated liveness probe for load balancers and orchestrators.
+
+    Skips API-key validation and rate limiting so probes cost only framework overhead;
+    use /health for authenticated service details.
+    """
+    return Response(content=_HEALTHZ_BODY, media_type="application/json")
+
+
 @router.get("/health", response_model=HealthResponse, tags=["System"])
 async def health_check(
     settings: Settings = Depends(get_settings),
     api_key: APIKey = Depends(get_authenticated_api_key),
-) -> HealthResponse:
+) -> Response:
     """
     Health check endpoint.
 
-    Returns the current status of the service.
+    Returns the current status of the service. The payload is assembled from
+    pre-serialized bytes and a timestamp cached at one-second resolution;
+    HealthResponse documents it in the OpenAPI schema.
 
     Args:
         settings: Application settings (injected)
         api_key: API key from authentication (injected)
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(UTC),
-        service=settings.app_name,
-        version=settings.version,
+    return Response(
+        content=_HEALTH_PREFIX
+        + _current_health_timestamp()
+        + _health_suffix(settings.app_name, settings.version),
+        media_type="application/json",
     )
 
 
 @router.get("/health/providers", response_model=ProviderHealthResponse, tags=["System"])
 async def providers_health_check(
-    settings: Settings = Depends(get_settings),
     api_key: APIKey = Depends(get_authenticated_api_key),
+    provider_manager: ProviderManager = Depends(get_provider_manager),
 ) -> ProviderHealthResponse:
     """
     Provider health check endpoint.
@@ -64,10 +104,9 @@ async def providers_health_check(
     Returns readiness information for configured AI providers.
 
     Args:
-        settings: Application settings (injected)
         api_key: API key from authentication (injected)
+        provider_manager: Shared provider manager (injected)
     """
-    provider_manager = ProviderManager(settings.providers)
     providers = provider_manager.get_providers_health(include_disabled=True)
     enabled_providers = [provider for provider in providers if provider.enabled]
 
@@ -1,132 +1,187 @@
 """Research agent API endpoint."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import PlainTextResponse
+from collections.abc import AsyncIterator
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 
 from app.agents.research import ResearchAgent
+from app.api.bookkeeping import ExecutionRecord, run_bookkeeping, track_execution
+from app.api.dependencies import get_optional_history_service, get_optional_rate_limiter
 from app.api.middleware import get_authenticated_api_key
-from app.core.config import get_settings
+from app.api.responses import model_response
 from app.core.logging import get_logger
 from app.models.auth import APIKey
 from app.models.research import ResearchRequest, ResearchResponse
-from app.services.providers import (
-    ProviderExecutionError,
-    ProviderManager,
-    ProviderNotConfiguredError,
-)
+from app.services.history import HistoryService
+from app.services.providers import ProviderExecutionError, ProviderNotConfiguredError
+from app.services.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/agents", tags=["agents"])
 
-settings = get_settings()
-provider_manager = ProviderManager(settings.providers)
-research_agent = ResearchAgent(provider_manager)
+
+def get_research_agent(request: Request) -> ResearchAgent:
+    """Fetch the research agent created during application startup."""
+    agent: ResearchAgent | None = getattr(request.app.state, "research_agent", None)
+    if agent is None:
+        raise HTTPException(status_code=500, detail="Research agent is not initialized")
+    return agent
 
 
 @router.post("/research", response_model=ResearchResponse)
 async def research(
     payload: ResearchRequest,
     http_request: Request,
+    background_tasks: BackgroundTasks,
     as_markdown: bool = False,
     api_key: APIKey = Depends(get_authenticated_api_key),
-) -> ResearchResponse | PlainTextResponse:
-    """Run synchronous research and return an Obsidian markdown note."""
-    history_service = getattr(http_request.app.state, "history_service", None)
-    request_id = getattr(http_request.state, "request_id", None)
+    research_agent: ResearchAgent = Depends(get_research_agent),
+    history_service: HistoryService | None = Depends(get_optional_history_service),
+    rate_limiter: RateLimiter | None = Depends(get_optional_rate_limiter),
+) -> Response:
+    """
+    Run synchronous research and return an Obsidian markdown note.
 
+    The note's frontmatter, title and sources section depend on the complete body, so
+    this endpoint buffers; use /agents/research/stream for incremental output.
+    """
     try:
-        response = await research_agent.research(
-            topic=payload.topic,
-            depth=payload.depth,
+        async with track_execution(
+            history_service,
+            request_id=http_request.state.request_id,
+            api_key_id=api_key.key_id,
+            agent="research",
             provider=payload.provider,
-            focus_areas=payload.focus_areas,
-        )
-
-        if history_service is not None:
-            await history_service.record_execution(
-                request_id=request_id,
-                api_key_id=api_key.key_id,
-                agent="research",
-                status="completed",
-                provider=response.metadata.provider.value,
-                model=response.metadata.model,
-                duration_seconds=response.metadata.duration_seconds,
-                tokens_used=response.metadata.tokens_used,
-                estimated_cost=None,
-                metadata={
-                    "depth": response.metadata.depth.value,
-                    "sources_count": response.metadata.sources_count,
-                },
-            )
-
-        rate_limiter = getattr(http_request.app.state, "rate_limiter", None)
-        if rate_limiter is not None:
-            await rate_limiter.record_usage(
-                api_key_id=api_key.key_id,
-                agent="research",
-                tokens=response.metadata.tokens_used,
-                estimated_cost=None,
+            metadata={"depth": payload.depth.value},
+            background_tasks=background_tasks,
+        ) as execution:
+            response = await research_agent.research(
+                topic=payload.topic,
+                depth=payload.depth,
+                provider=payload.provider,
+                focus_areas=payload.focus_areas,
             )
-
-        if as_markdown:
-            return PlainTextResponse(content=response.markdown, media_type="text/markdown")
-        return response
+            _fill_execution(execution, response)
     except ProviderNotConfiguredError as exc:
-        if history_service is not None:
-            await history_service.record_execution(
-                request_id=request_id,
-                api_key_id=api_key.key_id,
-                agent="research",
-                status="failed",
-                provider=payload.provider.value if payload.provider is not None else None,
-                model=None,
-                duration_seconds=None,
-                tokens_used=None,
-                estimated_cost=None,
-                error=str(exc),
-                metadata={"depth": payload.depth.value},
-            )
         logger.error("Research provider not configured", extra={"error": str(exc)})
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ProviderExecutionError as exc:
-        if history_service is not None:
-            await history_service.record_execution(
-                request_id=request_id,
-                api_key_id=api_key.key_id,
-                agent="research",
-                status="failed",
-                provider=payload.provider.value if payload.provider is not None else None,
-                model=None,
-                duration_seconds=None,
-                tokens_used=None,
-                estimated_cost=None,
-                error=str(exc),
-                metadata={"depth": payload.depth.value},
-            )
         logger.error(
             "Research execution failed across providers",
             extra={
                 "error": str(exc),
-                "attempted_providers": [provider.value for provider in exc.attempted_providers],
+                "attempted_providers": exc.attempted_providers,
             },
         )
         raise HTTPException(
             status_code=502, detail="All configured providers failed to execute research"
         ) from exc
     except Exception as exc:
-        if history_service is not None:
-            await history_service.record_execution(
+        logger.error("Research request failed", extra={"error": str(exc)}, exc_info=True)
+        raise HTTPException(status_code=500, detail="Research request failed") from exc
+
+    # Usage bookkeeping runs after the response is sent; cache hits cost no tokens.
+    if rate_limiter is not None and not response.metadata.cached:
+        background_tasks.add_task(
+            run_bookkeeping,
+            rate_limiter.record_usage,
+            api_key_id=api_key.key_id,
+            agent="research",
+            tokens=response.metadata.tokens_used,
+            estimated_cost=None,
+        )
+
+    if as_markdown:
+        return PlainTextResponse(content=response.markdown, media_type="text/markdown")
+    return model_response(response)
+
+
+def _fill_execution(execution: ExecutionRecord, response: ResearchResponse) -> None:
+    """Copy a research result's metadata into its history record."""
+    execution.provider = response.metadata.provider
+    execution.model = response.metadata.model
+    execution.duration_seconds = response.metadata.duration_seconds
+    execution.tokens_used = response.metadata.tokens_used
+    execution.metadata["sources_count"] = response.metadata.sources_count
+    if response.metadata.cached:
+        execution.metadata["cached"] = True
+
+
+def _sse(event: str, data: object) -> bytes:
+    """Encode one server-sent event frame."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.post("/research/stream")
+async def research_stream(
+    payload: ResearchRequest,
+    http_request: Request,
+    api_key: APIKey = Depends(get_authenticated_api_key),
+    research_agent: ResearchAgent = Depends(get_research_agent),
+    history_service: HistoryService | None = Depends(get_optional_history_service),
+    rate_limiter: RateLimiter | None = Depends(get_optional_rate_limiter),
+) -> StreamingResponse:
+    """
+    Run research and stream the raw note body as server-sent events.
+
+    Emits `delta` events with content chunks as the provider generates them, then a
+    single `result` event carrying the full ResearchResponse (formatted markdown,
+    sources, metadata), or an `error` event if the run fails.
+    """
+    request_id: str = http_request.state.request_id
+
+    async def events() -> AsyncIterator[bytes]:
+        result: ResearchResponse | None = None
+        try:
+            async with track_execution(
+                history_service,
                 request_id=request_id,
                 api_key_id=api_key.key_id,
                 agent="research",
-                status="failed",
-                provider=payload.provider.value if payload.provider is not None else None,
-                model=None,
-                duration_seconds=None,
-                tokens_used=None,
-                estimated_cost=None,
-                error=str(exc),
-                metadata={"depth": payload.depth.value},
-            )
-        logger.error("Research request failed", extra={"error": str(exc)}, exc_info=True)
-        raise HTTPException(status_code=500, detail="Research request failed") from exc
+                provider=payload.provider,
+                metadata={"depth": payload.depth.value, "streamed": True},
+            ) as execution:
+                async for item in research_agent.research_stream(
+                    topic=payload.topic,
+                    depth=payload.depth,
+                    provider=payload.provider,
+                    focus_areas=payload.focus_areas,
+                ):
+                    if isinstance(item, str):
+                        yield _sse("delta", {"content": item})
+                        continue
+
+                    # Charge usage and complete the history entry before the result is
+                    # sent: a client disconnecting at that yield raises GeneratorExit, which
+                    # would otherwise skip both.
+                    result = item
+                    _fill_execution(execution, item)
+                    if rate_limiter is not None and not item.metadata.cached:
+                        await run_bookkeeping(
+                            rate_limiter.record_usage,
+                            api_key_id=api_key.key_id,
+                            agent="research",
+                            tokens=item.metadata.tokens_used,
+                            estimated_cost=None,
+                        )
+        except Exception as exc:
+            if isinstance(exc, ProviderNotConfiguredError):
+                detail = str(exc)
+            elif isinstance(exc, ProviderExecutionError):
+                detail = "All configured providers failed to execute research"
+            else:
+                detail = "Research request failed"
+            logger.error("Research stream failed", extra={"error": str(exc)}, exc_info=True)
+            yield _sse("error", {"detail": detail})
+            return
+
+        if result is not None:
+            yield _sse("result", result.model_dump(mode="json"))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
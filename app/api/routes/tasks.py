@@ -1,27 +1,29 @@
 """Task management API endpoints."""
 
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, Response
 
 from app.agents.chat import ChatAgent
 from app.agents.research import ResearchAgent
 from app.api.middleware import get_authenticated_api_key
-from app.core.config import Settings
+from app.api.responses import model_response
 from app.core.logging import get_logger
 from app.models.auth import APIKey
+from app.models.chat import ChatResponse
+from app.models.research import ResearchResponse
 from app.models.tasks import (
-    AgentType,
     ChatTaskRequest,
     ResearchTaskRequest,
+    TaskListFilters,
     TaskListResponse,
     TaskRequest,
     TaskResultResponse,
-    TaskStatus,
     TaskStatusResponse,
     TaskSubmissionResponse,
 )
-from app.services.providers import ProviderManager
 from app.services.tasks import (
     TaskCancellationError,
     TaskExecutor,
@@ -34,38 +36,54 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
-def create_task_executor(settings: Settings) -> TaskExecutor:
-    """Create task executor callable for background workers."""
-    provider_manager = ProviderManager(settings.providers)
-    chat_agent = ChatAgent(provider_manager)
-    research_agent = ResearchAgent(provider_manager)
+TaskHandler = Callable[[Any, ChatAgent, ResearchAgent], Awaitable[bytes]]
 
-    async def execute(task_request: TaskRequest) -> dict[str, Any]:
-        if isinstance(task_request, ChatTaskRequest):
-            chat_result = await chat_agent.chat(
-                message=task_request.message,
-                provider=task_request.provider,
-            )
-            return chat_result.model_dump(mode="json")
 
-        if isinstance(task_request, ResearchTaskRequest):
-            research_result = await research_agent.research(
-                topic=task_request.topic,
-                depth=task_request.depth,
-                provider=task_request.provider,
-                focus_areas=task_request.focus_areas,
-            )
-            return research_result.model_dump(mode="json")
+async def _run_chat_task(
+    task_request: ChatTaskRequest, chat_agent: ChatAgent, research_agent: ResearchAgent
+) -> bytes:
+    chat_result = await chat_agent.chat(
+        message=task_request.message,
+        provider=task_request.provider,
+    )
+    return ChatResponse.__pydantic_serializer__.to_json(chat_result)
+
+
+async def _run_research_task(
+    task_request: ResearchTaskRequest, chat_agent: ChatAgent, research_agent: ResearchAgent
+) -> bytes:
+    research_result = await research_agent.research(
+        topic=task_request.topic,
+        depth=task_request.depth,
+        provider=task_request.provider,
+        focus_areas=task_request.focus_areas,
+    )
+    return ResearchResponse.__pydantic_serializer__.to_json(research_result)
+
 
-        raise ValueError(f"Unsupported task request type: {type(task_request)!r}")
+# Exact request type -> handler; add an entry here to support a new task type.
+TASK_HANDLERS: dict[type[ChatTaskRequest | ResearchTaskRequest], TaskHandler] = {
+    ChatTaskRequest: _run_chat_task,
+    ResearchTaskRequest: _run_research_task,
+}
+
+
+def create_task_executor(chat_agent: ChatAgent, research_agent: ResearchAgent) -> TaskExecutor:
+    """Create task executor callable for background workers, sharing the app's agents."""
+
+    async def execute(task_request: TaskRequest) -> bytes:
+        handler = TASK_HANDLERS.get(type(task_request))
+        if handler is None:
+            raise ValueError(f"Unsupported task request type: {type(task_request)!r}")
+        return await handler(task_request, chat_agent, research_agent)
 
     return execute
 
 
 def get_task_manager(request: Request) -> TaskManager:
     """Fetch the initialized task manager from app state."""
-    manager = getattr(request.app.state, "task_manager", None)
-    if not isinstance(manager, TaskManager):
+    manager: TaskManager | None = getattr(request.app.state, "task_manager", None)
+    if manager is None:
         raise HTTPException(status_code=500, detail="Task manager is not initialized")
     return manager
 
@@ -75,27 +93,40 @@ async def submit_task(
     request: TaskRequest,
     api_key: APIKey = Depends(get_authenticated_api_key),
     task_manager: TaskManager = Depends(get_task_manager),
-) -> TaskSubmissionResponse:
+) -> ORJSONResponse:
     """Submit a task for asynchronous processing."""
     task = await task_manager.submit_task(request=request, api_key_id=api_key.key_id)
-    return TaskSubmissionResponse(
-        task_id=task.task_id,
-        status=task.status,
-        status_url=f"/tasks/{task.task_id}",
+    # Server-generated fields need no egress validation; the model documents the schema.
+    return ORJSONResponse(
+        {
+            "task_id": task.task_id,
+            "status": task.status,
+            "status_url": f"/tasks/{task.task_id}",
+        },
+        status_code=status.HTTP_202_ACCEPTED,
     )
 
 
 @router.get("/{task_id}", response_model=TaskStatusResponse)
 async def get_task_status(
     task_id: str,
+    wait_seconds: float = Query(
+        default=0.0,
+        ge=0.0,
+        le=30.0,
+        description="Wait up to this many seconds for an unfinished task's status to change",
+    ),
     api_key: APIKey = Depends(get_authenticated_api_key),
     task_manager: TaskManager = Depends(get_task_manager),
-) -> TaskStatusResponse:
-    """Get task status."""
+) -> Response:
+    """Get task status, optionally long-polling for the next status change."""
     try:
-        return await task_manager.get_task(task_id=task_id, api_key_id=api_key.key_id)
+        task_status = await task_manager.get_task(
+            task_id=task_id, api_key_id=api_key.key_id, wait_seconds=wait_seconds
+        )
     except TaskNotFoundError as exc:
         raise HTTPException(status_code=404, detail="Task not found") from exc
+    return model_response(task_status)
 
 
 @router.get("/{task_id}/result", response_model=TaskResultResponse)
@@ -103,14 +134,15 @@ async def get_task_result(
     task_id: str,
     api_key: APIKey = Depends(get_authenticated_api_key),
     task_manager: TaskManager = Depends(get_task_manager),
-) -> TaskResultResponse:
+) -> Response:
     """Get completed task result."""
     try:
-        return await task_manager.get_task_result(task_id=task_id, api_key_id=api_key.key_id)
+        result_json = await task_manager.get_task_result(task_id=task_id, api_key_id=api_key.key_id)
     except TaskNotFoundError as exc:
         raise HTTPException(status_code=404, detail="Task not found") from exc
     except TaskNotReadyError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return Response(content=result_json, media_type="application/json")
 
 
 @router.delete("/{task_id}", response_model=TaskStatusResponse)
@@ -118,31 +150,31 @@ async def cancel_task(
     task_id: str,
     api_key: APIKey = Depends(get_authenticated_api_key),
     task_manager: TaskManager = Depends(get_task_manager),
-) -> TaskStatusResponse:
+) -> Response:
     """Cancel a task if still pending/processing."""
     try:
-        return await task_manager.cancel_task(task_id=task_id, api_key_id=api_key.key_id)
+        task_status = await task_manager.cancel_task(task_id=task_id, api_key_id=api_key.key_id)
     except TaskNotFoundError as exc:
         raise HTTPException(status_code=404, detail="Task not found") from exc
     except TaskCancellationError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return model_response(task_status)
 
 
 @router.get("", response_model=TaskListResponse)
 async def list_tasks(
-    status_filter: TaskStatus | None = Query(default=None, alias="status"),
-    agent: AgentType | None = Query(default=None),
-    limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    filters: Annotated[TaskListFilters, Query()],
     api_key: APIKey = Depends(get_authenticated_api_key),
     task_manager: TaskManager = Depends(get_task_manager),
-) -> TaskListResponse:
+) -> Response:
     """List tasks owned by API key with filtering and pagination."""
     tasks, total = await task_manager.list_tasks(
         api_key_id=api_key.key_id,
-        status=status_filter,
-        agent=agent,
-        limit=limit,
-        offset=offset,
+        status=filters.status,
+        agent=filters.agent,
+        limit=filters.limit,
+        offset=filters.offset,
+    )
+    return model_response(
+        TaskListResponse(total=total, limit=filters.limit, offset=filters.offset, tasks=tasks)
     )
-    return TaskListResponse(total=total, limit=limit, offset=offset, tasks=tasks)
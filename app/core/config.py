@@ -1,16 +1,22 @@
 """Configuration management."""
 
-import os
-from functools import lru_cache
+import copy
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.core.security import hash_api_key
 from app.models.auth import APIKeyConfig
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class ProviderConfig(BaseModel):
     """Configuration for an AI provider."""
@@ -19,6 +25,14 @@ class ProviderConfig(BaseModel):
     model: str = Field(description="Default model to use")
     timeout_seconds: int = Field(default=60, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum number of retries")
+    max_concurrency: int = Field(
+        default=32, ge=1, description="Maximum concurrent chat calls to this provider"
+    )
+    research_max_concurrency: int = Field(
+        default=8, ge=1, description="Maximum concurrent research calls to this provider"
+    )
+
+    model_config = ConfigDict(frozen=True)
 
 
 class ProvidersConfig(BaseModel):
@@ -27,6 +41,11 @@ class ProvidersConfig(BaseModel):
     openai: ProviderConfig | None = Field(default=None, description="OpenAI configuration")
     xai: ProviderConfig | None = Field(default=None, description="XAI configuration")
     default_provider: str = Field(default="openai", description="Default provider to use")
+    hedge_delay_ms: int | None = Field(
+        default=None,
+        ge=0,
+        description="Start the next provider if the first has not finished by then (None: off)",
+    )
 
 
 class AuthConfig(BaseModel):
@@ -35,6 +54,22 @@ class AuthConfig(BaseModel):
     enabled: bool = Field(default=True, description="Whether authentication is enabled")
     api_keys: list[APIKeyConfig] = Field(default_factory=list, description="List of valid API keys")
 
+    model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def key_index(self) -> dict[str, APIKeyConfig]:
+        """Configured keys indexed by key hash, built on first lookup."""
+        index: dict[str, APIKeyConfig] = {}
+        for key_config in self.api_keys:
+            key_hash = key_config.key_hash
+            if key_hash is None:
+                if key_config.key is None:
+                    continue
+                key_hash = hash_api_key(key_config.key)
+            # First entry wins, matching the previous first-match scan order.
+            index.setdefault(key_hash, key_config)
+        return index
+
 
 class HistoryConfig(BaseModel):
     """Request/execution history configuration."""
@@ -44,6 +79,47 @@ class HistoryConfig(BaseModel):
         default="data/history", description="Directory for history JSONL files"
     )
     retention_days: int = Field(default=30, description="Retention window for history files")
+    batch_size: int = Field(default=100, ge=1, description="Maximum records written per flush")
+    flush_interval_ms: int = Field(
+        default=50, ge=0, description="Maximum time a record waits in the write buffer"
+    )
+    queue_max_size: int = Field(
+        default=10_000, ge=1, description="Buffered records before writes fall back to inline"
+    )
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ResponseCacheConfig(BaseModel):
+    """Exact-match agent response cache configuration."""
+
+    enabled: bool = Field(default=False, description="Whether agent responses are cached")
+    max_entries: int = Field(default=1024, ge=1, description="Maximum cached responses")
+    ttl_seconds: float = Field(default=1800.0, gt=0.0, description="Cache entry lifetime")
+
+
+class SemanticCacheConfig(BaseModel):
+    """Embedding-based research cache configuration."""
+
+    enabled: bool = Field(default=False, description="Whether the semantic cache is enabled")
+    embedding_model: str = Field(
+        default="text-embedding-3-small", description="OpenAI embedding model"
+    )
+    similarity_threshold: float = Field(
+        default=0.92, ge=0.0, le=1.0, description="Minimum cosine similarity for a hit"
+    )
+    max_entries: int = Field(default=512, ge=1, description="Maximum cached responses")
+    ttl_seconds: float = Field(default=86400.0, gt=0.0, description="Cache entry lifetime")
+
+
+class CompressionConfig(BaseModel):
+    """Response compression configuration."""
+
+    enabled: bool = Field(default=True, description="Whether responses are gzip-compressed")
+    minimum_size: int = Field(
+        default=1024, ge=0, description="Smallest response body (bytes) that is compressed"
+    )
+    compresslevel: int = Field(default=5, ge=1, le=9, description="gzip compression level")
 
 
 class RateLimitPolicy(BaseModel):
@@ -61,9 +137,15 @@ class RateLimitPolicy(BaseModel):
     cost_per_hour: float | None = Field(default=None, ge=0.0)
     cost_per_day: float | None = Field(default=None, ge=0.0)
 
+    model_config = ConfigDict(frozen=True)
+
 
 class RateLimitsConfig(BaseModel):
-    """Global and per-agent rate limiting configuration."""
+    """Global and per-agent rate limiting configuration.
+
+    Frozen, like the other sections services derive caches from (e.g. the rate
+    limiter's per-agent limit tables), so those caches cannot go stale.
+    """
 
     enabled: bool = Field(default=True, description="Whether rate limiting is enabled")
     default: RateLimitPolicy = Field(
@@ -86,6 +168,20 @@ class RateLimitsConfig(BaseModel):
         description="Interval for in-memory counter cleanup",
     )
 
+    model_config = ConfigDict(frozen=True)
+
+
+# Top-level YAML key -> model for that settings section; add new sections here.
+_SECTION_MODELS: dict[str, type[BaseModel]] = {
+    "providers": ProvidersConfig,
+    "auth": AuthConfig,
+    "history": HistoryConfig,
+    "rate_limits": RateLimitsConfig,
+    "response_cache": ResponseCacheConfig,
+    "semantic_cache": SemanticCacheConfig,
+    "compression": CompressionConfig,
+}
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -119,6 +215,23 @@ class Settings(BaseSettings):
         default_factory=HistoryConfig, description="Request/execution history configuration"
     )
 
+    # Response caching
+    response_cache: ResponseCacheConfig = Field(
+        default_factory=ResponseCacheConfig,
+        description="Agent response cache configuration",
+    )
+
+    semantic_cache: SemanticCacheConfig = Field(
+        default_factory=SemanticCacheConfig,
+        description="Semantic research cache configuration",
+    )
+
+    # Response compression
+    compression: CompressionConfig = Field(
+        default_factory=CompressionConfig,
+        description="Response compression configuration",
+    )
+
     # Rate limiting
     rate_limits: RateLimitsConfig = Field(
         default_factory=RateLimitsConfig,
@@ -147,29 +260,35 @@ class Settings(BaseSettings):
             Configuration dictionary
         """
         config_path = Path(self.config_file)
-        if not config_path.exists():
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return {}
 
-        with open(config_path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        # Callers may mutate the result, so hand out a copy of the cached parse.
+        return copy.deepcopy(_load_yaml_cached(str(config_path), mtime_ns))
 
     def merge_yaml_config(self) -> None:
         """Merge YAML configuration into settings."""
         yaml_config = self.load_yaml_config()
 
         for key, value in yaml_config.items():
-            if hasattr(self, key):
-                # Handle nested configurations for Pydantic models
-                if key == "providers" and isinstance(value, dict):
-                    self.providers = ProvidersConfig(**value)
-                elif key == "auth" and isinstance(value, dict):
-                    self.auth = AuthConfig(**value)
-                elif key == "history" and isinstance(value, dict):
-                    self.history = HistoryConfig(**value)
-                elif key == "rate_limits" and isinstance(value, dict):
-                    self.rate_limits = RateLimitsConfig(**value)
-                else:
-                    setattr(self, key, value)
+            if not hasattr(self, key):
+                continue
+            # Nested sections are validated into their Pydantic models
+            section_model = _SECTION_MODELS.get(key)
+            if section_model is not None and isinstance(value, dict):
+                setattr(self, key, section_model.model_validate(value))
+            else:
+                setattr(self, key, value)
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file once per (path, mtime) so unchanged files are not re-tokenized."""
+    # Hand libyaml one contiguous buffer rather than a stream it reads in chunks.
+    data: dict[str, Any] | None = yaml.load(Path(path).read_bytes(), Loader=_YamlLoader)
+    return data or {}
 
 
 @lru_cache
@@ -182,8 +301,7 @@ def get_settings() -> Settings:
     """
     settings = Settings()
 
-    # Merge YAML config if file exists
-    if os.path.exists(settings.config_file):
-        settings.merge_yaml_config()
+    # A missing config file merges as empty, so no separate existence check is needed
+    settings.merge_yaml_config()
 
     return settings
@@ -1,17 +1,69 @@
 """Logging configuration."""
 
-import json
 import logging
 import sys
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Final
+
+import orjson
 
 from app.core.config import Settings
 
+# LogRecord attributes that are not user-supplied `extra` fields.
+_BUILTIN_RECORD_FIELDS: Final = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "request_id",
+    }
+)
+
+# (epoch milliseconds, ISO timestamp) of the last formatted record; bursts of records
+# within the same millisecond reuse the string.
+_last_timestamp: tuple[int, str] = (0, "")
+
+
+def _log_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with millisecond precision."""
+    global _last_timestamp
+    now_ms = time.time_ns() // 1_000_000
+    cached_ms, cached = _last_timestamp
+    if now_ms == cached_ms:
+        return cached
+    timestamp = datetime.fromtimestamp(now_ms / 1000, UTC).isoformat(timespec="milliseconds")
+    _last_timestamp = (now_ms, timestamp)
+    return timestamp
+
 
 class RequestIDFilter(logging.Filter):
     """Filter to inject request ID into log records."""
 
+    def __init__(self, name: str = "") -> None:
+        """Initialize filter; the request ID getter is resolved on first use."""
+        super().__init__(name)
+        self._get_request_id: Callable[[], str] | None = None
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Add request ID to log record if available.
@@ -22,12 +74,14 @@ class RequestIDFilter(logging.Filter):
         Returns:
             True to allow the record to be logged
         """
-        # Import here to avoid circular dependency
-        from app.api.middleware.request_id import get_request_id
-
         # Add request_id to record if not already present
         if not hasattr(record, "request_id"):
-            request_id = get_request_id()
+            if self._get_request_id is None:
+                # Imported lazily to avoid a circular dependency, then cached
+                from app.api.middleware.request_id import get_request_id
+
+                self._get_request_id = get_request_id
+            request_id = self._get_request_id()
             record.request_id = request_id if request_id else None
 
         return True
@@ -47,7 +101,7 @@ class JSONFormatter(logging.Formatter):
             JSON formatted log string
         """
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": _log_timestamp(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -63,33 +117,10 @@ class JSONFormatter(logging.Formatter):
 
         # Add any extra fields (excluding built-in attributes)
         for key, value in record.__dict__.items():
-            if key not in {
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "request_id",
-            }:
+            if key not in _BUILTIN_RECORD_FIELDS:
                 log_data[key] = value
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str).decode()
 
 
 class TextFormatter(logging.Formatter):
@@ -126,14 +157,15 @@ def setup_logging(settings: Settings) -> None:
     Args:
         settings: Application settings
     """
+    level = logging.getLevelNamesMapping().get(settings.log_level.upper(), logging.INFO)
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, settings.log_level.upper()))
+    root_logger.setLevel(level)
 
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, settings.log_level.upper()))
+    console_handler.setLevel(level)
 
     # Add request ID filter to automatically inject request IDs
     request_id_filter = RequestIDFilter()
@@ -1,14 +1,28 @@
 """Security utilities for API key management."""
 
 import hashlib
+import hmac
+import re
 import secrets
+from functools import lru_cache
 from typing import Final
 
 from app.models.auth import APIKey, APIKeyStatus
 
-# API key format: oea_<32 random hex characters>
+# API key format: oea_<22 URL-safe base64 characters> (128 random bits).
+# Keys issued before the switch use oea_<32 hex characters> and remain valid.
 API_KEY_PREFIX: Final = "oea_"
-API_KEY_LENGTH: Final = 32  # Length of random part (hex chars)
+API_KEY_BYTES: Final = 16  # Random bytes per key
+API_KEY_LENGTH: Final = 22  # Length of random part (URL-safe base64 chars)
+LEGACY_API_KEY_LENGTH: Final = 32  # Length of random part of legacy hex keys
+_API_KEY_PATTERN: Final = re.compile(
+    rf"{re.escape(API_KEY_PREFIX)}"
+    rf"(?:[A-Za-z0-9_-]{{{API_KEY_LENGTH}}}|[0-9a-fA-F]{{{LEGACY_API_KEY_LENGTH}}})",
+    re.ASCII,
+)
+
+# Only well-formed-length keys are memoized so oversized input cannot pin memory.
+_MAX_CACHED_KEY_LENGTH: Final = len(API_KEY_PREFIX) + LEGACY_API_KEY_LENGTH
 
 
 def generate_api_key() -> str:
@@ -16,48 +30,54 @@ def generate_api_key() -> str:
     Generate a new API key.
 
     Returns:
-        A new API key in format: oea_<32 hex chars>
+        A new API key in format: oea_<22 URL-safe base64 chars>
     """
-    random_part = secrets.token_hex(API_KEY_LENGTH // 2)  # hex returns 2 chars per byte
-    return f"{API_KEY_PREFIX}{random_part}"
+    return f"{API_KEY_PREFIX}{secrets.token_urlsafe(API_KEY_BYTES)}"
 
 
 def hash_api_key(api_key: str) -> str:
     """
     Hash an API key using SHA-256.
 
+    Results for recently seen keys are memoized; call clear_api_key_hash_cache()
+    after rotating keys to drop retired plain-text keys from memory.
+
     Args:
         api_key: Plain text API key
 
     Returns:
         Hashed API key (hex digest)
     """
+    if len(api_key) > _MAX_CACHED_KEY_LENGTH:
+        return _sha256_hex(api_key)
+    return _cached_sha256_hex(api_key)
+
+
+def clear_api_key_hash_cache() -> None:
+    """Drop all memoized API key hashes."""
+    _cached_sha256_hex.cache_clear()
+
+
+def _sha256_hex(api_key: str) -> str:
     return hashlib.sha256(api_key.encode()).hexdigest()
 
 
+_cached_sha256_hex = lru_cache(maxsize=1024)(_sha256_hex)
+
+
 def validate_api_key_format(api_key: str) -> bool:
     """
     Validate API key format.
 
+    Accepts both current URL-safe keys and legacy hex keys.
+
     Args:
         api_key: API key to validate
 
     Returns:
         True if format is valid, False otherwise
     """
-    if not api_key.startswith(API_KEY_PREFIX):
-        return False
-
-    key_part = api_key[len(API_KEY_PREFIX) :]
-    if len(key_part) != API_KEY_LENGTH:
-        return False
-
-    # Check if it's valid hex
-    try:
-        int(key_part, 16)
-        return True
-    except ValueError:
-        return False
+    return _API_KEY_PATTERN.fullmatch(api_key) is not None
 
 
 def verify_api_key(api_key: str, stored_key: APIKey) -> bool:
@@ -77,7 +97,7 @@ def verify_api_key(api_key: str, stored_key: APIKey) -> bool:
 
     # Verify hash
     key_hash = hash_api_key(api_key)
-    return key_hash == stored_key.key_hash
+    return hmac.compare_digest(key_hash, stored_key.key_hash)
 
 
 def generate_request_id() -> str:
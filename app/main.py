@@ -2,21 +2,27 @@
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.agents.chat import ChatAgent
+from app.agents.research import ResearchAgent
 from app.api.middleware import RequestIDMiddleware
 from app.api.routes import chat_router, health_router, history_router, research_router, tasks_router
 from app.api.routes.tasks import create_task_executor
 from app.core.config import get_settings
 from app.core.logging import get_logger, setup_logging
 from app.services.history import HistoryService
+from app.services.providers import ProviderManager
 from app.services.rate_limiter import RateLimiter
+from app.services.response_cache import create_response_cache
+from app.services.semantic_cache import create_semantic_cache
 from app.services.tasks import TaskManager
 
-settings = get_settings()
-setup_logging(settings)
 logger = get_logger(__name__)
 
 
@@ -28,6 +34,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     Handles startup and shutdown events.
     """
     # Startup
+    settings = get_settings()
     logger.info(
         "Starting ObsidianEcho-AI service",
         extra={"version": settings.version, "debug": settings.debug},
@@ -37,14 +44,34 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         enabled=settings.history.enabled,
         storage_dir=settings.history.storage_dir,
         retention_days=settings.history.retention_days,
+        batch_size=settings.history.batch_size,
+        flush_interval_ms=settings.history.flush_interval_ms,
+        queue_max_size=settings.history.queue_max_size,
     )
     await history_service.cleanup_old_files()
+    await history_service.start()
     app.state.history_service = history_service
 
     app.state.rate_limiter = RateLimiter(settings.rate_limits)
 
+    # One provider manager and one set of agents serve routes and background tasks alike.
+    provider_manager = ProviderManager(settings.providers)
+    provider_manager.preload_models()
+    chat_agent = ChatAgent(
+        provider_manager,
+        response_cache=create_response_cache(settings.response_cache),
+    )
+    research_agent = ResearchAgent(
+        provider_manager,
+        response_cache=create_response_cache(settings.response_cache),
+        semantic_cache=create_semantic_cache(settings.semantic_cache),
+    )
+    app.state.provider_manager = provider_manager
+    app.state.chat_agent = chat_agent
+    app.state.research_agent = research_agent
+
     task_manager = TaskManager(
-        executor=create_task_executor(settings),
+        executor=create_task_executor(chat_agent, research_agent),
         max_workers=2,
         task_ttl_seconds=3600,
         cleanup_interval_seconds=30,
@@ -55,6 +82,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     yield
     # Shutdown
     await app.state.task_manager.shutdown()
+    await app.state.history_service.aclose()
+    await app.state.provider_manager.aclose()
     logger.info("Shutting down ObsidianEcho-AI service")
 
 
@@ -65,6 +94,7 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance
     """
+    settings = get_settings()
     app = FastAPI(
         title=settings.app_name,
         description="AI-powered agents for generating Obsidian markdown notes",
@@ -73,6 +103,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         lifespan=lifespan,
         debug=settings.debug,
+        default_response_class=ORJSONResponse,
     )
 
     # Add Request ID middleware (should be first to track all requests)
@@ -87,6 +118,14 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress large JSON/markdown bodies (SSE streams are skipped by the middleware)
+    if settings.compression.enabled:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=settings.compression.minimum_size,
+            compresslevel=settings.compression.compresslevel,
+        )
+
     app.include_router(health_router)
     app.include_router(history_router)
     app.include_router(chat_router)
@@ -98,16 +137,27 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+def __getattr__(name: str) -> Any:
+    # `app` is built on first access (e.g. by uvicorn's "app.main:app" lookup) so
+    # importing this module does not load settings or reconfigure logging.
+    if name == "app":
+        setup_logging(get_settings())
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
+        loop="uvloop",
+        http="httptools",
         reload=settings.debug,
         log_level=settings.log_level.lower(),
     )
@@ -1,34 +1,83 @@
-"""Data models for the application."""
-
-from app.models.auth import APIKey, APIKeyConfig, APIKeyStatus
-from app.models.history import (
-    ExecutionHistoryEntry,
-    ExecutionHistoryListResponse,
-    HistoryStatsResponse,
-    RequestHistoryEntry,
-    RequestHistoryListResponse,
-)
-from app.models.providers import (
-    AgentResponse,
-    ProviderType,
-)
-from app.models.research import (
-    ResearchDepth,
-    ResearchMetadata,
-    ResearchRequest,
-    ResearchResponse,
-    SourceReference,
-)
-from app.models.tasks import (
-    AgentType,
-    ChatTaskRequest,
-    ResearchTaskRequest,
-    TaskListResponse,
-    TaskResultResponse,
-    TaskStatus,
-    TaskStatusResponse,
-    TaskSubmissionResponse,
-)
+"""Data models for the application.
+
+Re-exports are resolved lazily (PEP 562) so importing one model module does not build
+the Pydantic schemas of every other module in the package.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.models.auth import APIKey, APIKeyConfig, APIKeyStatus
+    from app.models.history import (
+        ExecutionHistoryEntry,
+        ExecutionHistoryListResponse,
+        HistoryStatsResponse,
+        RequestHistoryEntry,
+        RequestHistoryListResponse,
+    )
+    from app.models.providers import (
+        AgentResponse,
+        ProviderType,
+    )
+    from app.models.research import (
+        ResearchDepth,
+        ResearchMetadata,
+        ResearchRequest,
+        ResearchResponse,
+        SourceReference,
+    )
+    from app.models.tasks import (
+        AgentType,
+        ChatTaskRequest,
+        ResearchTaskRequest,
+        TaskListResponse,
+        TaskResultResponse,
+        TaskStatus,
+        TaskStatusResponse,
+        TaskSubmissionResponse,
+    )
+
+# Exported name -> defining module
+_LAZY_EXPORTS = {
+    "APIKey": "app.models.auth",
+    "APIKeyConfig": "app.models.auth",
+    "APIKeyStatus": "app.models.auth",
+    "ExecutionHistoryEntry": "app.models.history",
+    "ExecutionHistoryListResponse": "app.models.history",
+    "HistoryStatsResponse": "app.models.history",
+    "RequestHistoryEntry": "app.models.history",
+    "RequestHistoryListResponse": "app.models.history",
+    "AgentResponse": "app.models.providers",
+    "ProviderType": "app.models.providers",
+    "ResearchDepth": "app.models.research",
+    "ResearchMetadata": "app.models.research",
+    "ResearchRequest": "app.models.research",
+    "ResearchResponse": "app.models.research",
+    "SourceReference": "app.models.research",
+    "AgentType": "app.models.tasks",
+    "ChatTaskRequest": "app.models.tasks",
+    "ResearchTaskRequest": "app.models.tasks",
+    "TaskListResponse": "app.models.tasks",
+    "TaskResultResponse": "app.models.tasks",
+    "TaskStatus": "app.models.tasks",
+    "TaskStatusResponse": "app.models.tasks",
+    "TaskSubmissionResponse": "app.models.tasks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
 
 __all__ = [
     "AgentResponse",
@@ -1,10 +1,13 @@
 """Authentication models."""
 
+import re
 from datetime import UTC, datetime
 from enum import StrEnum
 
 from pydantic import BaseModel, Field, model_validator
 
+_SHA256_HEX_PATTERN = re.compile(r"[0-9a-f]{64}", re.ASCII)
+
 
 class APIKeyStatus(StrEnum):
     """API key status."""
@@ -56,7 +59,7 @@ class APIKeyConfig(BaseModel):
 
         if self.key_hash:
             key_hash = self.key_hash.lower()
-            if len(key_hash) != 64 or any(c not in "0123456789abcdef" for c in key_hash):
+            if _SHA256_HEX_PATTERN.fullmatch(key_hash) is None:
                 raise ValueError("'key_hash' must be a 64-character hexadecimal SHA-256 hash")
             self.key_hash = key_hash
 
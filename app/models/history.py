@@ -39,6 +39,32 @@ class ExecutionHistoryEntry(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Extra execution metadata")
 
 
+class HistoryDateRange(BaseModel):
+    """Inclusive date range query parameters."""
+
+    start_date: date | None = Field(default=None, description="First day to include")
+    end_date: date | None = Field(default=None, description="Last day to include")
+
+
+class RequestHistoryFilters(HistoryDateRange):
+    """Query parameters for listing request history."""
+
+    method: str | None = Field(default=None, description="HTTP method")
+    path_contains: str | None = Field(default=None, description="Path substring")
+    status_code: int | None = Field(default=None, description="HTTP status code")
+    limit: int = Field(default=50, ge=1, le=200)
+    offset: int = Field(default=0, ge=0)
+
+
+class ExecutionHistoryFilters(HistoryDateRange):
+    """Query parameters for listing execution history."""
+
+    agent: str | None = Field(default=None, description="Agent name")
+    status: str | None = Field(default=None, description="Execution status")
+    limit: int = Field(default=50, ge=1, le=200)
+    offset: int = Field(default=0, ge=0)
+
+
 class RequestHistoryListResponse(BaseModel):
     """Paginated request history response."""
 
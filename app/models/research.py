@@ -46,6 +46,7 @@ class ResearchMetadata(BaseModel):
     duration_seconds: float = Field(description="Execution duration in seconds")
     tokens_used: int | None = Field(default=None, description="Total tokens used if available")
     sources_count: int = Field(description="Number of extracted sources")
+    cached: bool = Field(default=False, description="Whether the response was served from a cache")
 
 
 class ResearchResponse(BaseModel):
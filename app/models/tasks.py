@@ -87,6 +87,15 @@ class TaskResultResponse(TaskStatusResponse):
     result: dict[str, Any] | None = None
 
 
+class TaskListFilters(BaseModel):
+    """Query parameters for listing tasks."""
+
+    status: TaskStatus | None = Field(default=None, description="Task status")
+    agent: AgentType | None = Field(default=None, description="Agent type")
+    limit: int = Field(default=20, ge=1, le=100)
+    offset: int = Field(default=0, ge=0)
+
+
 class TaskListResponse(BaseModel):
     """Paginated task list payload."""
 
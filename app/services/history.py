@@ -1,10 +1,18 @@
 """JSONL-based request and execution history service."""
 
-import json
+import asyncio
+import heapq
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, TypeVar
 
+import orjson
 from pydantic import BaseModel
 
 from app.core.logging import get_logger
@@ -13,28 +21,136 @@ from app.models.history import ExecutionHistoryEntry, HistoryStatsResponse, Requ
 logger = get_logger(__name__)
 ModelT = TypeVar("ModelT", bound=BaseModel)
 
+# Totals kept per API key in each history file's stats sidecar.
+_STATS_FIELDS = (
+    "count",
+    "error_count",
+    "duration_ms",
+    "success_count",
+    "failure_count",
+    "tokens_used",
+    "estimated_cost",
+)
+
+
+@dataclass
+class _FileIndex:
+    """Per-API-key totals and (offset, length) line spans for one history file."""
+
+    offset: int = 0
+    totals: dict[str, dict[str, float]] = field(default_factory=dict)
+    spans: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+
+
+@dataclass
+class _CachedRecords:
+    """Decoded records read so far from one API key's spans in one history file."""
+
+    spans: list[tuple[int, int]]
+    consumed: int = 0
+    records: list[dict[str, Any]] = field(default_factory=list)
+
+
+# Decoded (file, API key) record lists kept in memory, least recently used evicted first.
+_RECORD_CACHE_MAX_ENTRIES = 128
+
+# A directory modified this close to a scan may change again within the same mtime tick,
+# so such a listing is rescanned next time instead of trusted.
+_LISTING_MTIME_SLACK_NS = 2_000_000_000
+
+# Queue item: (target file, serialized JSONL line), a flush marker the writer resolves
+# once every record queued before it has been written, or None to stop the writer after
+# writing everything queued before it.
+_PendingRecord = tuple[Path, bytes] | asyncio.Future[None] | None
+
 
 class HistoryService:
     """File-backed history storage with query and stats helpers."""
 
-    def __init__(self, *, enabled: bool, storage_dir: str, retention_days: int = 30) -> None:
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        storage_dir: str,
+        retention_days: int = 30,
+        batch_size: int = 100,
+        flush_interval_ms: int = 50,
+        queue_max_size: int = 10_000,
+    ) -> None:
         self.enabled = enabled
         self.storage_dir = Path(storage_dir)
         self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_ms / 1000
+        self.queue_max_size = queue_max_size
+        self._queue: asyncio.Queue[_PendingRecord] | None = None
+        self._writer: asyncio.Task[None] | None = None
+        self._indexes: dict[Path, _FileIndex] = {}
+        self._record_cache: dict[tuple[Path, str], _CachedRecords] = {}
+        self._listing: dict[str, list[tuple[date, Path]]] = {}
+        self._listing_mtime_ns: int | None = None
+        # Queries read files in worker threads; this guards the in-memory indexes,
+        # record cache and directory listing they share.
+        self._index_lock = threading.Lock()
 
         if self.enabled:
             self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+    async def start(self) -> None:
+        """
+        Start the background writer that appends buffered records in batches.
+
+        Until started (or after aclose), records are written inline.
+        """
+        if not self.enabled or self._writer is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_max_size)
+        self._writer = asyncio.create_task(self._run_writer(self._queue), name="history-writer")
+
+    async def aclose(self) -> None:
+        """Write buffered records and stop the background writer."""
+        if self._writer is None or self._queue is None:
+            return
+        # Records arriving from here on are written inline; the writer drains everything
+        # queued before the stop marker, then returns on its own.
+        queue, writer = self._queue, self._writer
+        self._queue = None
+        self._writer = None
+        await queue.put(None)
+        await asyncio.gather(writer, return_exceptions=True)
+
+        # A flush that was blocked on a full queue may have landed behind the stop marker.
+        while not queue.empty():
+            item = queue.get_nowait()
+            if isinstance(item, asyncio.Future) and not item.done():
+                item.set_result(None)
+
+    async def flush(self) -> None:
+        """Wait until every record buffered before this call has been written."""
+        if self._queue is None:
+            return
+        flushed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await self._queue.put(flushed)
+        await flushed
+
     async def cleanup_old_files(self) -> None:
         """Delete history files older than retention window."""
         if not self.enabled:
             return
 
         cutoff = datetime.now(UTC).date() - timedelta(days=self.retention_days)
-        for history_file in self.storage_dir.glob("*.jsonl"):
-            file_date = self._extract_date_from_file_name(history_file)
-            if file_date is not None and file_date < cutoff:
-                history_file.unlink(missing_ok=True)
+        await asyncio.to_thread(self._remove_files_before, cutoff)
+
+    def _remove_files_before(self, cutoff: date) -> None:
+        with self._index_lock:
+            for history_file in self.storage_dir.glob("*.jsonl"):
+                file_date = self._extract_date_from_file_name(history_file)
+                if file_date is not None and file_date < cutoff:
+                    history_file.unlink(missing_ok=True)
+                    self._index_path(history_file).unlink(missing_ok=True)
+                    self._indexes.pop(history_file, None)
+                    for cache_key in [key for key in self._record_cache if key[0] == history_file]:
+                        del self._record_cache[cache_key]
 
     async def record_request(
         self,
@@ -63,7 +179,7 @@ class HistoryService:
             client=client,
             error=error,
         )
-        self._append_jsonl("requests", entry.model_dump(mode="json"))
+        self._enqueue("requests", self._serialize(entry), entry.timestamp)
 
     async def record_execution(
         self,
@@ -98,7 +214,7 @@ class HistoryService:
             error=error,
             metadata=dict(metadata) if metadata is not None else {},
         )
-        self._append_jsonl("executions", entry.model_dump(mode="json"))
+        self._enqueue("executions", self._serialize(entry), entry.timestamp)
 
     async def query_requests(
         self,
@@ -113,24 +229,25 @@ class HistoryService:
         end_date: date | None = None,
     ) -> tuple[list[RequestHistoryEntry], int]:
         """Query request history with filtering and pagination."""
-        entries = self._read_entries(
+        await self.flush()
+        method_lower = method.lower() if method is not None else None
+
+        def matches(raw: dict[str, Any]) -> bool:
+            return (
+                (method_lower is None or raw["method"].lower() == method_lower)
+                and (path_contains is None or path_contains in raw["path"])
+                and (status_code is None or raw["status_code"] == status_code)
+            )
+
+        records = await asyncio.to_thread(
+            self._matching_records,
             prefix="requests",
-            model_cls=RequestHistoryEntry,
+            api_key_id=api_key_id,
             start_date=start_date,
             end_date=end_date,
+            predicate=matches,
         )
-
-        filtered = [entry for entry in entries if entry.api_key_id == api_key_id]
-        if method is not None:
-            filtered = [entry for entry in filtered if entry.method.lower() == method.lower()]
-        if path_contains is not None:
-            filtered = [entry for entry in filtered if path_contains in entry.path]
-        if status_code is not None:
-            filtered = [entry for entry in filtered if entry.status_code == status_code]
-
-        filtered.sort(key=lambda entry: entry.timestamp, reverse=True)
-        total = len(filtered)
-        return filtered[offset : offset + limit], total
+        return self._newest_page(records, RequestHistoryEntry, limit=limit, offset=offset)
 
     async def query_executions(
         self,
@@ -144,22 +261,22 @@ class HistoryService:
         end_date: date | None = None,
     ) -> tuple[list[ExecutionHistoryEntry], int]:
         """Query execution history with filtering and pagination."""
-        entries = self._read_entries(
+        await self.flush()
+
+        def matches(raw: dict[str, Any]) -> bool:
+            return (agent is None or raw["agent"] == agent) and (
+                status is None or raw["status"] == status
+            )
+
+        records = await asyncio.to_thread(
+            self._matching_records,
             prefix="executions",
-            model_cls=ExecutionHistoryEntry,
+            api_key_id=api_key_id,
             start_date=start_date,
             end_date=end_date,
+            predicate=matches,
         )
-
-        filtered = [entry for entry in entries if entry.api_key_id == api_key_id]
-        if agent is not None:
-            filtered = [entry for entry in filtered if entry.agent == agent]
-        if status is not None:
-            filtered = [entry for entry in filtered if entry.status == status]
-
-        filtered.sort(key=lambda entry: entry.timestamp, reverse=True)
-        total = len(filtered)
-        return filtered[offset : offset + limit], total
+        return self._newest_page(records, ExecutionHistoryEntry, limit=limit, offset=offset)
 
     async def get_stats(
         self,
@@ -168,110 +285,380 @@ class HistoryService:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> HistoryStatsResponse:
-        """Aggregate request and execution metrics."""
-        requests = self._read_entries(
+        """Aggregate request and execution metrics from per-file history indexes."""
+        await self.flush()
+        requests = await asyncio.to_thread(
+            self._sum_stats,
             prefix="requests",
-            model_cls=RequestHistoryEntry,
+            api_key_id=api_key_id,
             start_date=start_date,
             end_date=end_date,
         )
-        requests = [entry for entry in requests if entry.api_key_id == api_key_id]
-
-        executions = self._read_entries(
+        executions = await asyncio.to_thread(
+            self._sum_stats,
             prefix="executions",
-            model_cls=ExecutionHistoryEntry,
+            api_key_id=api_key_id,
             start_date=start_date,
             end_date=end_date,
         )
-        executions = [entry for entry in executions if entry.api_key_id == api_key_id]
-
-        request_count = len(requests)
-        request_error_count = len([entry for entry in requests if entry.status_code >= 400])
-        avg_duration = (
-            sum(entry.duration_ms for entry in requests) / request_count
-            if request_count > 0
-            else 0.0
-        )
-
-        execution_count = len(executions)
-        execution_success_count = len(
-            [entry for entry in executions if entry.status == "completed"]
-        )
-        execution_failure_count = len([entry for entry in executions if entry.status == "failed"])
 
-        total_tokens_used = sum(entry.tokens_used or 0 for entry in executions)
-        total_estimated_cost = round(sum(entry.estimated_cost or 0.0 for entry in executions), 6)
+        request_count = int(requests["count"])
+        avg_duration = requests["duration_ms"] / request_count if request_count > 0 else 0.0
 
         return HistoryStatsResponse(
             api_key_id=api_key_id,
             start_date=start_date,
             end_date=end_date,
             request_count=request_count,
-            request_error_count=request_error_count,
+            request_error_count=int(requests["error_count"]),
             average_request_duration_ms=round(avg_duration, 2),
-            execution_count=execution_count,
-            execution_success_count=execution_success_count,
-            execution_failure_count=execution_failure_count,
-            total_tokens_used=total_tokens_used,
-            total_estimated_cost=total_estimated_cost,
+            execution_count=int(executions["count"]),
+            execution_success_count=int(executions["success_count"]),
+            execution_failure_count=int(executions["failure_count"]),
+            total_tokens_used=int(executions["tokens_used"]),
+            total_estimated_cost=round(executions["estimated_cost"], 6),
         )
 
-    def _append_jsonl(self, prefix: str, payload: dict[str, object]) -> None:
+    @staticmethod
+    def _serialize(entry: BaseModel) -> bytes:
+        # orjson renders datetimes natively; metadata values it cannot encode fall back to str.
+        return orjson.dumps(
+            entry.model_dump(),
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_UTC_Z,
+        )
+
+    def _enqueue(self, prefix: str, line: bytes, timestamp: datetime) -> None:
+        # The target file follows the record's own timestamp, so a record never lands in
+        # a different day's file than its timestamp says, queued or not.
+        file_path = self.storage_dir / f"{prefix}-{timestamp.date().isoformat()}.jsonl"
+        if self._queue is None:
+            self._write_records([(file_path, line)])
+            return
+        try:
+            self._queue.put_nowait((file_path, line))
+        except asyncio.QueueFull:
+            logger.warning("History buffer full, writing record inline")
+            self._write_records([(file_path, line)])
+
+    async def _run_writer(self, queue: asyncio.Queue[_PendingRecord]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.flush_interval_seconds
+
+            # Collect until the batch is full, the window closes, or a flush or stop is
+            # requested.
+            while (
+                batch[-1] is not None
+                and not isinstance(batch[-1], asyncio.Future)
+                and len(batch) < self.batch_size
+            ):
+                try:
+                    batch.append(queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+                except TimeoutError:
+                    break
+
+            records = [record for record in batch if isinstance(record, tuple)]
+            try:
+                if records:
+                    await asyncio.to_thread(self._write_records, records)
+            except Exception as exc:  # noqa: BLE001
+                logger.error(
+                    "Failed to write history batch",
+                    extra={"records": len(records), "error": str(exc)},
+                )
+            finally:
+                # Records queued ahead of a flush marker are all in this or earlier batches.
+                for item in batch:
+                    if isinstance(item, asyncio.Future) and not item.done():
+                        item.set_result(None)
+            if batch[-1] is None:
+                return
+
+    def _write_records(self, records: list[tuple[Path, bytes]]) -> None:
+        """Append newline-terminated records, opening each target file once per batch."""
+        lines_by_file: dict[Path, list[bytes]] = {}
+        for file_path, line in records:
+            lines_by_file.setdefault(file_path, []).append(line)
+
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        file_path = self.storage_dir / f"{prefix}-{datetime.now(UTC).date().isoformat()}.jsonl"
-        with file_path.open("a", encoding="utf-8") as history_file:
-            history_file.write(json.dumps(payload, ensure_ascii=True))
-            history_file.write("\n")
+        for file_path, lines in lines_by_file.items():
+            with file_path.open("ab") as history_file:
+                history_file.write(b"".join(lines))
 
-    def _read_entries(
+    def _matching_records(
         self,
         *,
         prefix: str,
-        model_cls: type[ModelT],
+        api_key_id: str,
         start_date: date | None,
         end_date: date | None,
-    ) -> list[ModelT]:
+        predicate: Callable[[dict[str, Any]], bool],
+    ) -> list[dict[str, Any]]:
+        """Decoded records of one API key that satisfy the predicate."""
         if not self.enabled:
             return []
 
-        entries = []
-        for file_path in self._list_files(prefix=prefix, start_date=start_date, end_date=end_date):
-            with file_path.open(encoding="utf-8") as history_file:
-                for line in history_file:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        raw = json.loads(line)
-                        entries.append(model_cls.model_validate(raw))
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning(
-                            "Skipping malformed history record",
-                            extra={"file": str(file_path), "error": str(exc)},
-                        )
-        return entries
+        with self._index_lock:
+            return [
+                raw
+                for file_path in self._list_files(
+                    prefix=prefix, start_date=start_date, end_date=end_date
+                )
+                for raw in self._key_records(file_path, prefix=prefix, api_key_id=api_key_id)
+                if predicate(raw)
+            ]
 
-    def _list_files(
+    @staticmethod
+    def _newest_page(
+        records: list[dict[str, Any]], model_cls: type[ModelT], *, limit: int, offset: int
+    ) -> tuple[list[ModelT], int]:
+        """
+        Build entries for one page of records, newest first, plus the total match count.
+
+        Only the page is selected (without sorting every match) and turned into models.
+        Records were validated before being written, so they are rebuilt without
+        re-validating.
+        """
+        newest = heapq.nlargest(offset + limit, records, key=itemgetter("timestamp"))
+        return [model_cls.model_construct(**raw) for raw in newest[offset:]], len(records)
+
+    def _key_records(
+        self, file_path: Path, *, prefix: str, api_key_id: str
+    ) -> list[dict[str, Any]]:
+        """
+        Decoded records of one API key in one file, cached across queries.
+
+        Only lines the index added since the cached read are parsed, so closed days are
+        decoded once and today's file only pays for new records.
+        """
+        spans = self._file_index(file_path, prefix=prefix).spans.get(api_key_id)
+        if not spans:
+            return []
+
+        cache_key = (file_path, api_key_id)
+        cached = self._record_cache.pop(cache_key, None)
+        if cached is None or cached.spans is not spans:
+            # A rebuilt index starts new span lists, invalidating what was read before.
+            cached = _CachedRecords(spans=spans)
+        self._record_cache[cache_key] = cached
+        while len(self._record_cache) > _RECORD_CACHE_MAX_ENTRIES:
+            self._record_cache.pop(next(iter(self._record_cache)))
+
+        if cached.consumed == len(spans):
+            return cached.records
+
+        # One read covering every new span; lines are then decoded straight from the buffer.
+        new_spans = spans[cached.consumed :]
+        start = new_spans[0][0]
+        end = new_spans[-1][0] + new_spans[-1][1]
+        with file_path.open("rb") as history_file:
+            history_file.seek(start)
+            buffer = memoryview(history_file.read(end - start))
+
+        for offset, length in new_spans:
+            line = buffer[offset - start : offset - start + length]
+            try:
+                raw = orjson.loads(line)
+                raw["timestamp"] = datetime.fromisoformat(raw["timestamp"])
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Skipping malformed history record",
+                    extra={"file": str(file_path), "error": str(exc)},
+                )
+                continue
+            cached.records.append(raw)
+        cached.consumed = len(spans)
+        return cached.records
+
+    def _sum_stats(
         self,
         *,
         prefix: str,
+        api_key_id: str,
         start_date: date | None,
         end_date: date | None,
-    ) -> list[Path]:
-        all_files = sorted(self.storage_dir.glob(f"{prefix}-*.jsonl"))
-        selected_files: list[Path] = []
-
-        for file_path in all_files:
-            file_date = self._extract_date_from_file_name(file_path)
-            if file_date is None:
-                continue
-            if start_date is not None and file_date < start_date:
+    ) -> dict[str, float]:
+        totals = dict.fromkeys(_STATS_FIELDS, 0.0)
+        if not self.enabled:
+            return totals
+
+        with self._index_lock:
+            for file_path in self._list_files(
+                prefix=prefix, start_date=start_date, end_date=end_date
+            ):
+                key_totals = self._file_index(file_path, prefix=prefix).totals.get(api_key_id)
+                if key_totals is not None:
+                    for field_name, value in key_totals.items():
+                        totals[field_name] += value
+        return totals
+
+    def _file_index(self, file_path: Path, *, prefix: str) -> _FileIndex:
+        """
+        Per-API-key totals and line spans for one JSONL file.
+
+        The index is cached in memory and persisted in a sidecar next to the file. It
+        records how many bytes it has folded in, so only lines appended since the last
+        call are parsed. A missing, unreadable or stale index (file shorter than the
+        recorded offset) is rebuilt from the start of the file.
+
+        Called from worker threads with the index lock held.
+        """
+        index = self._indexes.get(file_path)
+        if index is None:
+            index = self._load_index(file_path)
+
+        with file_path.open("rb") as history_file:
+            size = history_file.seek(0, os.SEEK_END)
+            if index.offset > size:
+                index = _FileIndex()
+            if index.offset == size:
+                self._indexes[file_path] = index
+                return index
+            history_file.seek(index.offset)
+            data = history_file.read(size - index.offset)
+
+        # Stop at the last complete line; a partially written record is picked up next time.
+        complete = data.rfind(b"\n") + 1
+        position = 0
+        while position < complete:
+            line_end = data.index(b"\n", position) + 1
+            line = data[position:line_end]
+            line_offset = index.offset + position
+            position = line_end
+            if not line.strip():
                 continue
-            if end_date is not None and file_date > end_date:
+            try:
+                raw = orjson.loads(line)
+                api_key_id = raw.get("api_key_id")
+                if not isinstance(api_key_id, str):
+                    continue
+                self._accumulate_stats(index.totals, prefix=prefix, raw=raw)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Skipping malformed history record",
+                    extra={"file": str(file_path), "error": str(exc)},
+                )
                 continue
-            selected_files.append(file_path)
+            index.spans.setdefault(api_key_id, []).append((line_offset, len(line)))
+
+        index.offset += complete
+        self._save_index(file_path, index)
+        self._indexes[file_path] = index
+        return index
+
+    def _save_index(self, file_path: Path, index: _FileIndex) -> None:
+        # Write a temporary file and swap it in, so a crash mid-write never leaves a
+        # truncated sidecar behind.
+        index_path = self._index_path(file_path)
+        temp_path = index_path.with_suffix(".tmp")
+        temp_path.write_bytes(
+            orjson.dumps({"offset": index.offset, "totals": index.totals, "spans": index.spans})
+        )
+        os.replace(temp_path, index_path)
+
+    def _load_index(self, file_path: Path) -> _FileIndex:
+        index_path = self._index_path(file_path)
+        try:
+            stored = orjson.loads(index_path.read_bytes())
+            return _FileIndex(
+                offset=int(stored["offset"]),
+                totals=dict(stored["totals"]),
+                spans={
+                    key: [(offset, length) for offset, length in spans]
+                    for key, spans in stored["spans"].items()
+                },
+            )
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            logger.warning(
+                "Rebuilding unreadable history index",
+                extra={"file": str(index_path), "error": str(exc)},
+            )
+        return _FileIndex()
+
+    @staticmethod
+    def _accumulate_stats(
+        totals: dict[str, dict[str, float]], *, prefix: str, raw: dict[str, Any]
+    ) -> None:
+        # Read every field before touching the totals so a malformed record adds nothing.
+        if prefix == "requests":
+            deltas = {
+                "count": 1,
+                "error_count": raw["status_code"] >= 400,
+                "duration_ms": raw["duration_ms"],
+            }
+        else:
+            deltas = {
+                "count": 1,
+                "success_count": raw["status"] == "completed",
+                "failure_count": raw["status"] == "failed",
+                "tokens_used": raw.get("tokens_used") or 0,
+                "estimated_cost": raw.get("estimated_cost") or 0.0,
+            }
+
+        bucket = totals.setdefault(raw["api_key_id"], dict.fromkeys(_STATS_FIELDS, 0.0))
+        for field_name, delta in deltas.items():
+            bucket[field_name] += delta
+
+    @staticmethod
+    def _index_path(file_path: Path) -> Path:
+        return file_path.with_suffix(".index.json")
 
-        return selected_files
+    def _list_files(
+        self,
+        *,
+        prefix: str,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> list[Path]:
+        return [
+            file_path
+            for file_date, file_path in self._dated_files().get(prefix, [])
+            if (start_date is None or file_date >= start_date)
+            and (end_date is None or file_date <= end_date)
+        ]
+
+    def _dated_files(self) -> dict[str, list[tuple[date, Path]]]:
+        """
+        History files in the storage directory, grouped by prefix and sorted by date.
+
+        The listing is reused until the directory's mtime changes, which only happens
+        when a file is created or deleted (a new day's file, retention cleanup).
+        """
+        mtime_ns = self.storage_dir.stat().st_mtime_ns
+        if mtime_ns == self._listing_mtime_ns:
+            return self._listing
+
+        scanned_at = time.time_ns()
+        listing: dict[str, list[tuple[date, Path]]] = {}
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl"):
+                    continue
+                prefix, _, suffix = entry.name.removesuffix(".jsonl").partition("-")
+                try:
+                    file_date = date.fromisoformat(suffix)
+                except ValueError:
+                    continue
+                listing.setdefault(prefix, []).append((file_date, Path(entry.path)))
+        for files in listing.values():
+            files.sort()
+
+        self._listing = listing
+        recent = scanned_at - mtime_ns < _LISTING_MTIME_SLACK_NS
+        self._listing_mtime_ns = None if recent else mtime_ns
+        return listing
 
     @staticmethod
     def _extract_date_from_file_name(file_path: Path) -> date | None:
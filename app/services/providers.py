@@ -1,18 +1,27 @@
 """Provider management and agno integration."""
 
+import asyncio
+import contextlib
 import os
-from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
-from agno.models.openai import OpenAIChat
-from agno.models.openai.responses import OpenAIResponses
-from agno.models.xai import xAI
+import httpx
+from agno.models.base import Model
 
-from app.core.config import ProvidersConfig
+from app.core.config import ProviderConfig, ProvidersConfig
 from app.core.logging import get_logger
 from app.models.providers import ProviderHealth, ProviderType
 from app.models.research import ResearchDepth
 
+# Model classes are imported where models are built; the provider SDKs are slow to load.
+if TYPE_CHECKING:
+    from agno.models.openai import OpenAIChat
+    from agno.models.openai.responses import OpenAIResponses
+    from agno.models.xai import xAI
+
 logger = get_logger(__name__)
 
 
@@ -43,6 +52,61 @@ class ProviderExecutionError(ProviderError):
 
 
 T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=Model)
+ConcurrencyScope = Literal["chat", "research"]
+
+
+@dataclass(frozen=True)
+class _ProviderMeta:
+    """Static facts about a provider: where its config lives and how it is reported."""
+
+    config_attr: str
+    env_var: str
+    not_configured: str
+
+
+_PROVIDER_META = {
+    ProviderType.OPENAI: _ProviderMeta(
+        config_attr="openai",
+        env_var="OPENAI_API_KEY",
+        not_configured="OpenAI provider is not configured or enabled",
+    ),
+    ProviderType.XAI: _ProviderMeta(
+        config_attr="xai",
+        env_var="XAI_API_KEY",
+        not_configured="XAI provider is not configured or enabled",
+    ),
+}
+
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client used for provider API calls.
+
+    A single client keeps TCP/TLS connections alive across requests and models
+    instead of paying a fresh handshake per call. The client is created on first use
+    and again after close_shared_http_client (e.g. in a later application lifespan).
+
+    Returns:
+        Shared async HTTP client
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client, if one was created, without creating a new one."""
+    global _shared_http_client
+    client, _shared_http_client = _shared_http_client, None
+    if client is not None:
+        await client.aclose()
 
 
 class ProviderManager:
@@ -54,38 +118,147 @@ class ProviderManager:
     at a higher level.
     """
 
-    def __init__(self, config: ProvidersConfig) -> None:
+    def __init__(
+        self, config: ProvidersConfig, http_client: httpx.AsyncClient | None = None
+    ) -> None:
         """
         Initialize the provider manager.
 
         Args:
             config: Provider configuration
+            http_client: HTTP client for provider calls (None for the shared client)
         """
         self.config = config
+        self._http_client = http_client
         self._validate_config()
+        # Built models with the HTTP client they were built around, keyed by
+        # (provider, kind, variant).
+        self._models: dict[tuple[ProviderType, str, str], tuple[httpx.AsyncClient, Model]] = {}
+
+        # Per-provider gates so request bursts cannot exceed upstream concurrency limits.
+        self._semaphores: dict[tuple[ProviderType, ConcurrencyScope], asyncio.Semaphore] = {}
+        for provider, meta in _PROVIDER_META.items():
+            provider_config = getattr(self.config, meta.config_attr)
+            if provider_config is None:
+                continue
+            self._semaphores[(provider, "chat")] = asyncio.Semaphore(
+                provider_config.max_concurrency
+            )
+            self._semaphores[(provider, "research")] = asyncio.Semaphore(
+                provider_config.research_max_concurrency
+            )
+
+        # Model builders per provider, for get_model and get_research_model.
+        self._model_factories: dict[ProviderType, Callable[[], OpenAIChat | xAI]] = {
+            ProviderType.OPENAI: self._get_openai_model,
+            ProviderType.XAI: self._get_xai_model,
+        }
+        self._research_model_factories: dict[
+            ProviderType, Callable[[ResearchDepth], OpenAIResponses | xAI]
+        ] = {
+            ProviderType.OPENAI: self._get_openai_research_model,
+            ProviderType.XAI: lambda depth: self._get_xai_research_model(),
+        }
+
+        # Shared runs of run_with_fallback calls that passed a dedup_key, while in flight.
+        self._inflight: dict[Hashable, asyncio.Task[tuple[Any, ProviderType]]] = {}
+
+        # Health report fields that only depend on the (immutable) configuration.
+        self._health_templates: dict[ProviderType, dict[str, Any]] = {}
+        for provider, meta in _PROVIDER_META.items():
+            provider_config = getattr(self.config, meta.config_attr)
+            self._health_templates[provider] = {
+                "provider": provider,
+                "enabled": provider_config is not None and provider_config.enabled,
+                "model": provider_config.model if provider_config is not None else None,
+            }
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client injected into every model this manager creates."""
+        if self._http_client is not None:
+            return self._http_client
+        return get_shared_http_client()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        else:
+            await close_shared_http_client()
+
+    def _enabled_config(self, provider: ProviderType) -> ProviderConfig:
+        """Get a provider's config, raising unless it is configured and enabled."""
+        meta = _PROVIDER_META.get(provider)
+        if meta is None:
+            raise ProviderNotConfiguredError(f"Unsupported provider: {provider.value}")
+        config: ProviderConfig | None = getattr(self.config, meta.config_attr)
+        if config is None or not config.enabled:
+            raise ProviderNotConfiguredError(meta.not_configured)
+        return config
+
+    def _cached_model(
+        self,
+        key: tuple[ProviderType, str, str],
+        build: Callable[[httpx.AsyncClient], ModelT],
+    ) -> ModelT:
+        """
+        Return the model built for this key, building it on first use.
+
+        Agno models keep no per-run state, so one instance can back every agent of
+        the same configuration. A model is rebuilt if the HTTP client it holds has
+        since been replaced (e.g. the shared client was closed and recreated).
+        """
+        client = self.http_client
+        cached = self._models.get(key)
+        if cached is not None and cached[0] is client:
+            return cast(ModelT, cached[1])
+        model = build(client)
+        self._models[key] = (client, model)
+        return model
 
     def _validate_config(self) -> None:
-        """Validate that at least one provider is configured."""
-        has_provider = False
+        """
+        Validate that at least one provider is configured.
+
+        Also resolves the enabled providers and the default provider once, since the
+        configuration does not change after the manager is created.
+        """
+        available: list[ProviderType] = []
 
         if self.config.openai and self.config.openai.enabled:
-            has_provider = True
+            available.append(ProviderType.OPENAI)
             logger.info(
                 "OpenAI provider configured",
                 extra={"model": self.config.openai.model},
             )
 
         if self.config.xai and self.config.xai.enabled:
-            has_provider = True
+            available.append(ProviderType.XAI)
             logger.info(
                 "XAI provider configured",
                 extra={"model": self.config.xai.model},
             )
 
-        if not has_provider:
+        self._available = tuple(available)
+        self._default: ProviderType | None = None
+        if not available:
             logger.warning("No AI providers are configured and enabled")
+            return
+
+        self._default = ProviderType(self.config.default_provider)
+        if self._default not in available:
+            # Fallback to first available provider
+            self._default = available[0]
+            logger.warning(
+                "Default provider not available, using fallback",
+                extra={
+                    "requested": self.config.default_provider,
+                    "fallback": self._default.value,
+                },
+            )
 
-    def get_model(self, provider: ProviderType | None = None) -> OpenAIChat | xAI:
+    def get_model(self, provider: ProviderType | None = None) -> "OpenAIChat | xAI":
         """
         Get a model instance for the specified provider.
 
@@ -114,14 +287,12 @@ class ProviderManager:
         if provider is None:
             provider = self.get_default_provider()
 
-        if provider == ProviderType.OPENAI:
-            return self._get_openai_model()
-        elif provider == ProviderType.XAI:
-            return self._get_xai_model()
-        else:
+        factory = self._model_factories.get(provider)
+        if factory is None:
             raise ProviderNotConfiguredError(f"Unsupported provider: {provider.value}")
+        return factory()
 
-    def _get_openai_model(self) -> OpenAIChat:
+    def _get_openai_model(self) -> "OpenAIChat":
         """
         Get OpenAI model instance.
 
@@ -133,46 +304,56 @@ class ProviderManager:
         Raises:
             ProviderNotConfiguredError: If OpenAI is not configured
         """
-        if not self.config.openai or not self.config.openai.enabled:
-            raise ProviderNotConfiguredError("OpenAI provider is not configured or enabled")
-
-        config = self.config.openai
-        return OpenAIChat(
-            id=config.model,
-            timeout=config.timeout_seconds,
-            max_retries=config.max_retries,
-            retries=config.max_retries,
-            delay_between_retries=1,
-            exponential_backoff=True,
+        config = self._enabled_config(ProviderType.OPENAI)
+
+        from agno.models.openai import OpenAIChat
+
+        return self._cached_model(
+            (ProviderType.OPENAI, "chat", ""),
+            lambda http_client: OpenAIChat(
+                id=config.model,
+                timeout=config.timeout_seconds,
+                max_retries=config.max_retries,
+                retries=config.max_retries,
+                delay_between_retries=1,
+                exponential_backoff=True,
+                http_client=http_client,
+            ),
         )
 
-    def _get_openai_research_model(self, depth: ResearchDepth) -> OpenAIResponses:
+    def _get_openai_research_model(self, depth: ResearchDepth) -> "OpenAIResponses":
         """
         Get OpenAI Responses API model configured for research workflows.
 
-        Uses native web-search tool integration.
+        Uses native web-search tool integration. The model does not vary with depth, so
+        one instance serves every depth.
         """
-        if not self.config.openai or not self.config.openai.enabled:
-            raise ProviderNotConfiguredError("OpenAI provider is not configured or enabled")
+        _ = depth
+        config = self._enabled_config(ProviderType.OPENAI)
+
+        from agno.models.openai.responses import OpenAIResponses
 
-        config = self.config.openai
         request_params: dict[str, list[dict[str, str]]] = {}
 
         # For non deep-research models, explicitly attach web_search_preview.
         if "deep-research" not in config.model:
             request_params["tools"] = [{"type": "web_search_preview"}]
 
-        return OpenAIResponses(
-            id=config.model,
-            timeout=config.timeout_seconds,
-            max_retries=config.max_retries,
-            retries=config.max_retries,
-            delay_between_retries=1,
-            exponential_backoff=True,
-            request_params=request_params or None,
+        return self._cached_model(
+            (ProviderType.OPENAI, "research", ""),
+            lambda http_client: OpenAIResponses(
+                id=config.model,
+                timeout=config.timeout_seconds,
+                max_retries=config.max_retries,
+                retries=config.max_retries,
+                delay_between_retries=1,
+                exponential_backoff=True,
+                http_client=http_client,
+                request_params=request_params or None,
+            ),
         )
 
-    def _get_xai_model(self) -> xAI:
+    def _get_xai_model(self) -> "xAI":
         """
         Get xAI model instance.
 
@@ -184,37 +365,45 @@ class ProviderManager:
         Raises:
             ProviderNotConfiguredError: If XAI is not configured
         """
-        if not self.config.xai or not self.config.xai.enabled:
-            raise ProviderNotConfiguredError("XAI provider is not configured or enabled")
-
-        config = self.config.xai
-        return xAI(
-            id=config.model,
-            timeout=config.timeout_seconds,
-            max_retries=config.max_retries,
-            retries=config.max_retries,
-            delay_between_retries=1,
-            exponential_backoff=True,
+        config = self._enabled_config(ProviderType.XAI)
+
+        from agno.models.xai import xAI
+
+        return self._cached_model(
+            (ProviderType.XAI, "chat", ""),
+            lambda http_client: xAI(
+                id=config.model,
+                timeout=config.timeout_seconds,
+                max_retries=config.max_retries,
+                retries=config.max_retries,
+                delay_between_retries=1,
+                exponential_backoff=True,
+                http_client=http_client,
+            ),
         )
 
-    def _get_xai_research_model(self) -> xAI:
+    def _get_xai_research_model(self) -> "xAI":
         """
         Get xAI model configured for research workflows.
 
         Enables provider-native live search parameters.
         """
-        if not self.config.xai or not self.config.xai.enabled:
-            raise ProviderNotConfiguredError("XAI provider is not configured or enabled")
-
-        config = self.config.xai
-        return xAI(
-            id=config.model,
-            timeout=config.timeout_seconds,
-            max_retries=config.max_retries,
-            retries=config.max_retries,
-            delay_between_retries=1,
-            exponential_backoff=True,
-            search_parameters={"mode": "on"},
+        config = self._enabled_config(ProviderType.XAI)
+
+        from agno.models.xai import xAI
+
+        return self._cached_model(
+            (ProviderType.XAI, "research", ""),
+            lambda http_client: xAI(
+                id=config.model,
+                timeout=config.timeout_seconds,
+                max_retries=config.max_retries,
+                retries=config.max_retries,
+                delay_between_retries=1,
+                exponential_backoff=True,
+                http_client=http_client,
+                search_parameters={"mode": "on"},
+            ),
         )
 
     def get_available_providers(self) -> list[ProviderType]:
@@ -224,40 +413,24 @@ class ProviderManager:
         Returns:
             List of available provider types
         """
-        providers = []
-        if self.config.openai and self.config.openai.enabled:
-            providers.append(ProviderType.OPENAI)
-        if self.config.xai and self.config.xai.enabled:
-            providers.append(ProviderType.XAI)
-        return providers
+        return list(self._available)
 
     def get_default_provider(self) -> ProviderType:
         """
         Get the default provider type.
 
+        Falls back to the first available provider when the configured default is
+        not enabled.
+
         Returns:
             Default provider type
 
         Raises:
-            ProviderNotConfiguredError: If default provider is not available
+            ProviderNotConfiguredError: If no provider is available
         """
-        default = ProviderType(self.config.default_provider)
-        available = self.get_available_providers()
-
-        if default not in available:
-            if not available:
-                raise ProviderNotConfiguredError("No providers are configured")
-            # Fallback to first available provider
-            default = available[0]
-            logger.warning(
-                "Default provider not available, using fallback",
-                extra={
-                    "requested": self.config.default_provider,
-                    "fallback": default.value,
-                },
-            )
-
-        return default
+        if self._default is None:
+            raise ProviderNotConfiguredError("No providers are configured")
+        return self._default
 
     def get_model_name(self, provider: ProviderType) -> str:
         """
@@ -272,20 +445,11 @@ class ProviderManager:
         Raises:
             ProviderNotConfiguredError: If the provider is not configured
         """
-        if provider == ProviderType.OPENAI:
-            if not self.config.openai or not self.config.openai.enabled:
-                raise ProviderNotConfiguredError("OpenAI provider is not configured or enabled")
-            return self.config.openai.model
-        elif provider == ProviderType.XAI:
-            if not self.config.xai or not self.config.xai.enabled:
-                raise ProviderNotConfiguredError("XAI provider is not configured or enabled")
-            return self.config.xai.model
-        else:
-            raise ProviderNotConfiguredError(f"Unsupported provider: {provider.value}")
+        return self._enabled_config(provider).model
 
     def get_research_model(
         self, provider: ProviderType | None = None, depth: ResearchDepth = ResearchDepth.STANDARD
-    ) -> OpenAIResponses | xAI:
+    ) -> "OpenAIResponses | xAI":
         """
         Get a research-configured model with native web-search capabilities.
 
@@ -296,12 +460,10 @@ class ProviderManager:
         if provider is None:
             provider = self.get_default_provider()
 
-        if provider == ProviderType.OPENAI:
-            return self._get_openai_research_model(depth=depth)
-        elif provider == ProviderType.XAI:
-            return self._get_xai_research_model()
-        else:
+        factory = self._research_model_factories.get(provider)
+        if factory is None:
             raise ProviderNotConfiguredError(f"Unsupported provider: {provider.value}")
+        return factory(depth)
 
     def get_research_model_name(self, provider: ProviderType, depth: ResearchDepth) -> str:
         """
@@ -323,66 +485,49 @@ class ProviderManager:
         - provider API key exists in the environment
         - model instance can be created
         """
-        if provider == ProviderType.OPENAI:
-            config = self.config.openai
-            env_var = "OPENAI_API_KEY"
-        elif provider == ProviderType.XAI:
-            config = self.config.xai
-            env_var = "XAI_API_KEY"
-        else:
+        template = self._health_templates.get(provider)
+        if template is None:
             raise ProviderNotConfiguredError(f"Unsupported provider: {provider.value}")
 
-        if config is None:
-            return ProviderHealth(
-                provider=provider,
-                enabled=False,
-                model=None,
-                api_key_present=False,
-                healthy=False,
-                reason="Provider not configured",
-            )
-
-        api_key_present = bool(os.getenv(env_var))
-        if not config.enabled:
-            return ProviderHealth(
-                provider=provider,
-                enabled=False,
-                model=config.model,
-                api_key_present=api_key_present,
-                healthy=False,
-                reason="Provider disabled",
-            )
-
-        if not api_key_present:
-            return ProviderHealth(
-                provider=provider,
-                enabled=True,
-                model=config.model,
-                api_key_present=False,
-                healthy=False,
-                reason=f"Missing environment variable: {env_var}",
-            )
+        env_var = _PROVIDER_META[provider].env_var
+        api_key_present = False
+        healthy = False
+        if template["model"] is None:
+            reason = "Provider not configured"
+        else:
+            api_key_present = bool(os.getenv(env_var))
+            if not template["enabled"]:
+                reason = "Provider disabled"
+            elif not api_key_present:
+                reason = f"Missing environment variable: {env_var}"
+            else:
+                try:
+                    self.get_model(provider)
+                except Exception as exc:  # noqa: BLE001
+                    reason = f"Model initialization failed: {exc}"
+                else:
+                    healthy = True
+                    reason = "Provider is ready"
+
+        # Every field is a config value or a plain bool/str from above, so the report is
+        # built without re-running validation on each poll.
+        return ProviderHealth.model_construct(
+            **template, api_key_present=api_key_present, healthy=healthy, reason=reason
+        )
 
-        try:
-            self.get_model(provider)
-        except Exception as exc:  # noqa: BLE001
-            return ProviderHealth(
-                provider=provider,
-                enabled=True,
-                model=config.model,
-                api_key_present=True,
-                healthy=False,
-                reason=f"Model initialization failed: {exc}",
-            )
+    def preload_models(self) -> None:
+        """
+        Build the chat model of every enabled provider whose API key is set.
 
-        return ProviderHealth(
-            provider=provider,
-            enabled=True,
-            model=config.model,
-            api_key_present=True,
-            healthy=True,
-            reason="Provider is ready",
-        )
+        Called once at startup, so provider SDKs are imported and models built before the
+        first request or health check needs them. Failures are left for health checks to
+        report.
+        """
+        for provider in self.get_available_providers():
+            if not os.getenv(_PROVIDER_META[provider].env_var):
+                continue
+            with contextlib.suppress(Exception):
+                self.get_model(provider)
 
     def get_providers_health(self, include_disabled: bool = True) -> list[ProviderHealth]:
         """
@@ -394,8 +539,7 @@ class ProviderManager:
         Returns:
             Provider health statuses
         """
-        providers = [ProviderType.OPENAI, ProviderType.XAI]
-        health = [self.check_provider_health(provider) for provider in providers]
+        health = [self.check_provider_health(provider) for provider in self._health_templates]
         if include_disabled:
             return health
         return [status for status in health if status.enabled]
@@ -417,30 +561,63 @@ class ProviderManager:
         Raises:
             ProviderNotConfiguredError: If no providers are available
         """
-        available = self.get_available_providers()
-        if not available:
+        if not self._available:
             raise ProviderNotConfiguredError("No providers are configured")
 
         first = (
             preferred_provider if preferred_provider is not None else self.get_default_provider()
         )
 
-        if first not in available:
+        if first not in self._available:
             raise ProviderNotConfiguredError(f"{first.value} provider is not configured or enabled")
 
-        return [first, *[provider for provider in available if provider != first]]
+        return [first, *[provider for provider in self._available if provider != first]]
+
+    def concurrency_slot(
+        self, provider: ProviderType, scope: ConcurrencyScope = "chat"
+    ) -> AbstractAsyncContextManager[object]:
+        """
+        Get the concurrency gate for a provider and scope.
+
+        Use this to hold a slot for work that cannot go through run_with_fallback,
+        such as streaming runs.
+
+        Args:
+            provider: Provider the work runs against
+            scope: Concurrency limit bucket the work counts against
+
+        Returns:
+            Async context manager that holds a slot while entered
+        """
+        semaphore = self._semaphores.get((provider, scope))
+        if semaphore is None:
+            return contextlib.nullcontext()
+        return semaphore
 
     async def run_with_fallback(
         self,
         operation: Callable[[ProviderType], Awaitable[T]],
         preferred_provider: ProviderType | None = None,
+        scope: ConcurrencyScope = "chat",
+        dedup_key: Hashable | None = None,
+        hedge_delay: float | None = None,
     ) -> tuple[T, ProviderType]:
         """
         Execute an async provider operation with fallback to other providers.
 
+        Concurrent calls that pass the same dedup_key (with the same preferred provider
+        and scope) share a single execution and all receive its result or error. Only
+        pass a key when any call with that key would produce an equivalent result.
+
         Args:
             operation: Async callable that executes work for a given provider
             preferred_provider: Provider to try first, or None for default
+            scope: Concurrency limit bucket the operation counts against
+            dedup_key: Identity of the work for collapsing duplicate concurrent calls,
+                or None to always execute
+            hedge_delay: Seconds after which the next provider is started alongside the
+                first, taking whichever succeeds first (None for the configured
+                hedge_delay_ms)
 
         Returns:
             Tuple of operation result and provider used
@@ -449,12 +626,50 @@ class ProviderManager:
             ProviderExecutionError: If all providers fail during execution
             ProviderNotConfiguredError: If no valid providers are configured
         """
+        if hedge_delay is None and self.config.hedge_delay_ms is not None:
+            hedge_delay = self.config.hedge_delay_ms / 1000
+        if dedup_key is None:
+            return await self._run_chain(operation, preferred_provider, scope, hedge_delay)
+
+        key = (dedup_key, preferred_provider, scope)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._run_chain(operation, preferred_provider, scope, hedge_delay)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        # Shielded so one caller being cancelled does not cancel the run for the others.
+        return cast(tuple[T, ProviderType], await asyncio.shield(task))
+
+    def _forget_inflight(self, key: Hashable, task: asyncio.Task[tuple[Any, ProviderType]]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error as retrieved in case every caller was cancelled before it.
+        if not task.cancelled():
+            task.exception()
+
+    async def _run_chain(
+        self,
+        operation: Callable[[ProviderType], Awaitable[T]],
+        preferred_provider: ProviderType | None,
+        scope: ConcurrencyScope,
+        hedge_delay: float | None,
+    ) -> tuple[T, ProviderType]:
         chain = self.get_provider_chain(preferred_provider)
         errors: list[tuple[ProviderType, Exception]] = []
 
+        if hedge_delay is not None and len(chain) > 1:
+            hedged = await self._run_hedged(operation, chain[:2], scope, hedge_delay, errors)
+            if hedged is not None:
+                return hedged
+            attempted = {provider for provider, _ in errors}
+            chain = [provider for provider in chain if provider not in attempted]
+
         for provider in chain:
             try:
-                result = await operation(provider)
+                async with self.concurrency_slot(provider, scope):
+                    result = await operation(provider)
                 return result, provider
             except Exception as exc:  # noqa: BLE001
                 errors.append((provider, exc))
@@ -463,11 +678,63 @@ class ProviderManager:
                     extra={"provider": provider.value, "error": str(exc)},
                 )
 
-        attempted = [provider for provider, _ in errors]
+        attempted_providers = [provider for provider, _ in errors]
         last_error = errors[-1][1]
-        attempted_str = ", ".join(provider.value for provider in attempted)
+        attempted_str = ", ".join(provider.value for provider in attempted_providers)
         raise ProviderExecutionError(
             message=f"All provider execution attempts failed: {attempted_str}",
-            attempted_providers=attempted,
+            attempted_providers=attempted_providers,
             last_error=last_error,
         ) from last_error
+
+    async def _run_hedged(
+        self,
+        operation: Callable[[ProviderType], Awaitable[T]],
+        pair: list[ProviderType],
+        scope: ConcurrencyScope,
+        hedge_delay: float,
+        errors: list[tuple[ProviderType, Exception]],
+    ) -> tuple[T, ProviderType] | None:
+        """
+        Run the first provider, adding the second if the first is still running after
+        hedge_delay seconds.
+
+        Returns the first successful result, cancelling the other attempt, or None once
+        every started attempt has failed (their errors are appended to errors).
+        """
+
+        async def attempt(provider: ProviderType) -> T:
+            async with self.concurrency_slot(provider, scope):
+                return await operation(provider)
+
+        primary, secondary = pair
+        tasks = {asyncio.create_task(attempt(primary)): primary}
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                logger.info(
+                    "Provider slow to respond, hedging with next provider",
+                    extra={"provider": primary.value, "hedge": secondary.value},
+                )
+                tasks[asyncio.create_task(attempt(secondary))] = secondary
+                pending = set(tasks)
+
+            while True:
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        return task.result(), tasks[task]
+                    if not isinstance(exc, Exception):
+                        raise exc
+                    errors.append((tasks[task], exc))
+                    logger.warning(
+                        "Provider execution failed, trying next provider if available",
+                        extra={"provider": tasks[task].value, "error": str(exc)},
+                    )
+                if not pending:
+                    return None
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -20,6 +20,8 @@ WINDOW_SECONDS: dict[WindowName, int] = {
 }
 DIMENSIONS: tuple[DimensionName, DimensionName, DimensionName] = ("requests", "tokens", "cost")
 
+LimitTable = dict[DimensionName, list[tuple[WindowName, int, float]]]
+
 
 @dataclass(frozen=True)
 class CounterKey:
@@ -56,6 +58,7 @@ class RateLimiter:
         self._lock = asyncio.Lock()
         self._last_cleanup_monotonic = time.monotonic()
         self._max_window_seconds = max(WINDOW_SECONDS.values())
+        self._limit_tables: dict[str, LimitTable] = {}
 
     @property
     def enabled(self) -> bool:
@@ -74,7 +77,7 @@ class RateLimiter:
         async with self._lock:
             now = time.time()
             self._cleanup_if_needed(now=now)
-            policy = self._resolve_policy(agent)
+            limits = self._limit_table(agent)
 
             # Validate all dimensions before mutating counters.
             for dimension in DIMENSIONS:
@@ -82,7 +85,7 @@ class RateLimiter:
                 exceeded = self._first_exceeded_limit(
                     api_key_id=api_key_id,
                     agent=agent,
-                    policy=policy,
+                    limits=limits[dimension],
                     dimension=dimension,
                     increment=increment,
                     now=now,
@@ -91,10 +94,7 @@ class RateLimiter:
                     return exceeded
 
             # Consume request counters across all configured request windows.
-            for _window_name, window_seconds, _limit in self._iter_limits(
-                policy=policy,
-                dimension="requests",
-            ):
+            for _window_name, window_seconds, _limit in limits["requests"]:
                 key = self._counter_key(
                     api_key_id=api_key_id,
                     agent=agent,
@@ -107,7 +107,7 @@ class RateLimiter:
             return self._build_primary_request_decision(
                 api_key_id=api_key_id,
                 agent=agent,
-                policy=policy,
+                limits=limits["requests"],
                 now=now,
             )
 
@@ -131,13 +131,13 @@ class RateLimiter:
         async with self._lock:
             now = time.time()
             self._cleanup_if_needed(now=now)
-            policy = self._resolve_policy(agent)
+            limits = self._limit_table(agent)
 
             if token_increment > 0.0:
                 self._increment_dimension(
                     api_key_id=api_key_id,
                     agent=agent,
-                    policy=policy,
+                    limits=limits["tokens"],
                     dimension="tokens",
                     amount=token_increment,
                     now=now,
@@ -146,7 +146,7 @@ class RateLimiter:
                 self._increment_dimension(
                     api_key_id=api_key_id,
                     agent=agent,
-                    policy=policy,
+                    limits=limits["cost"],
                     dimension="cost",
                     amount=cost_increment,
                     now=now,
@@ -169,6 +169,18 @@ class RateLimiter:
             headers["Retry-After"] = str(decision.retry_after_seconds)
         return headers
 
+    def _limit_table(self, agent: str) -> LimitTable:
+        """Return the agent's configured limits per dimension, resolved once per agent."""
+        table = self._limit_tables.get(agent)
+        if table is None:
+            policy = self._resolve_policy(agent)
+            table = {
+                dimension: self._iter_limits(policy=policy, dimension=dimension)
+                for dimension in DIMENSIONS
+            }
+            self._limit_tables[agent] = table
+        return table
+
     def _resolve_policy(self, agent: str) -> RateLimitPolicy:
         base = self._config.default
         override = self._config.agents.get(agent)
@@ -224,14 +236,12 @@ class RateLimiter:
         *,
         api_key_id: str,
         agent: str,
-        policy: RateLimitPolicy,
+        limits: list[tuple[WindowName, int, float]],
         dimension: DimensionName,
         increment: float,
         now: float,
     ) -> RateLimitDecision | None:
-        for window_name, window_seconds, limit in self._iter_limits(
-            policy=policy, dimension=dimension
-        ):
+        for window_name, window_seconds, limit in limits:
             key = self._counter_key(
                 api_key_id=api_key_id,
                 agent=agent,
@@ -265,16 +275,13 @@ class RateLimiter:
         *,
         api_key_id: str,
         agent: str,
-        policy: RateLimitPolicy,
+        limits: list[tuple[WindowName, int, float]],
         now: float,
     ) -> RateLimitDecision | None:
         best: RateLimitDecision | None = None
         best_score = float("inf")
 
-        for window_name, window_seconds, limit in self._iter_limits(
-            policy=policy,
-            dimension="requests",
-        ):
+        for window_name, window_seconds, limit in limits:
             key = self._counter_key(
                 api_key_id=api_key_id,
                 agent=agent,
@@ -308,14 +315,12 @@ class RateLimiter:
         *,
         api_key_id: str,
         agent: str,
-        policy: RateLimitPolicy,
+        limits: list[tuple[WindowName, int, float]],
         dimension: DimensionName,
         amount: float,
         now: float,
     ) -> None:
-        for _window_name, window_seconds, _limit in self._iter_limits(
-            policy=policy, dimension=dimension
-        ):
+        for _window_name, window_seconds, _limit in limits:
             key = self._counter_key(
                 api_key_id=api_key_id,
                 agent=agent,
@@ -0,0 +1,74 @@
+"""In-memory exact-match cache for agent responses."""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+from app.core.config import ResponseCacheConfig
+
+
+def make_cache_key(parts: dict[str, Any]) -> str:
+    """
+    Build a stable cache key from request parts.
+
+    Args:
+        parts: JSON-serializable values identifying a request
+
+    Returns:
+        Hex digest uniquely identifying the request parts
+    """
+    payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+
+class AsyncTTLCache[V]:
+    """Bounded LRU cache with per-entry expiry, safe for concurrent coroutines."""
+
+    def __init__(self, *, max_entries: int = 1024, ttl_seconds: float = 1800.0) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> V | None:
+        """Return cached value for key, or None on miss/expiry."""
+        async with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: V, ttl: float | None = None) -> None:
+        """Store value for key, evicting least recently used entries if full."""
+        expires_at = time.monotonic() + (ttl if ttl is not None else self._ttl_seconds)
+        async with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Drop all cached entries."""
+        async with self._lock:
+            self._entries.clear()
+
+
+def create_response_cache(config: ResponseCacheConfig) -> AsyncTTLCache[Any] | None:
+    """Create a response cache from configuration, or None if caching is disabled."""
+    if not config.enabled:
+        return None
+    return AsyncTTLCache(max_entries=config.max_entries, ttl_seconds=config.ttl_seconds)
@@ -0,0 +1,131 @@
+"""Embedding-based cache for paraphrased agent requests."""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from app.core.config import SemanticCacheConfig
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class Embedder(Protocol):
+    """Async text embedding backend."""
+
+    async def aembed(self, text: str) -> list[float]:
+        """Return an embedding vector for text."""
+        ...
+
+
+class OpenAIEmbedder:
+    """Embedder backed by the OpenAI embeddings API via agno."""
+
+    def __init__(self, model: str) -> None:
+        from agno.knowledge.embedder.openai import OpenAIEmbedder as AgnoOpenAIEmbedder
+
+        self._embedder = AgnoOpenAIEmbedder(id=model)
+
+    async def aembed(self, text: str) -> list[float]:
+        """Return an embedding vector for text."""
+        return list(await self._embedder.async_get_embedding(text))
+
+
+@dataclass
+class _Entry[V]:
+    namespace: str
+    vector: tuple[float, ...]
+    expires_at: float
+    value: V
+
+
+def _normalize(vector: list[float]) -> tuple[float, ...]:
+    norm = math.hypot(*vector)
+    if norm == 0.0:
+        return tuple(vector)
+    return tuple(component / norm for component in vector)
+
+
+class SemanticCache[V]:
+    """
+    Nearest-neighbour cache over normalized embeddings.
+
+    Entries are compared by inner product (cosine similarity on unit vectors) and
+    only match within the same namespace, so exact request parameters such as
+    depth or provider never bleed across entries.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 512,
+        ttl_seconds: float = 86400.0,
+    ) -> None:
+        self._embedder = embedder
+        self._threshold = similarity_threshold
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: list[_Entry[V]] = []
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def embed(self, text: str) -> tuple[float, ...]:
+        """Embed and normalize text for lookup/storage."""
+        return _normalize(await self._embedder.aembed(text))
+
+    async def search(self, vector: tuple[float, ...], namespace: str) -> V | None:
+        """Return the most similar cached value above threshold, or None."""
+        now = time.monotonic()
+        best_value: V | None = None
+        best_score = self._threshold
+
+        async with self._lock:
+            self._entries = [entry for entry in self._entries if entry.expires_at > now]
+            for entry in self._entries:
+                if entry.namespace != namespace or len(entry.vector) != len(vector):
+                    continue
+                score = math.sumprod(entry.vector, vector)
+                if score >= best_score:
+                    best_score = score
+                    best_value = entry.value
+
+        return best_value
+
+    async def add(self, vector: tuple[float, ...], namespace: str, value: V) -> None:
+        """Store value under vector, evicting the oldest entries when full."""
+        entry = _Entry(
+            namespace=namespace,
+            vector=vector,
+            expires_at=time.monotonic() + self._ttl_seconds,
+            value=value,
+        )
+        async with self._lock:
+            self._entries.append(entry)
+            if len(self._entries) > self._max_entries:
+                del self._entries[: len(self._entries) - self._max_entries]
+
+
+def create_semantic_cache(config: SemanticCacheConfig) -> SemanticCache[Any] | None:
+    """Create a semantic cache from configuration, or None if disabled."""
+    if not config.enabled:
+        return None
+
+    logger.info(
+        "Semantic cache enabled",
+        extra={
+            "embedding_model": config.embedding_model,
+            "similarity_threshold": config.similarity_threshold,
+        },
+    )
+    return SemanticCache(
+        OpenAIEmbedder(config.embedding_model),
+        similarity_threshold=config.similarity_threshold,
+        max_entries=config.max_entries,
+        ttl_seconds=config.ttl_seconds,
+    )
@@ -2,7 +2,7 @@
 
 import asyncio
 from collections.abc import Callable, Coroutine
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from itertools import count
 from typing import Any
@@ -14,14 +14,14 @@ from app.models.tasks import (
     ChatTaskRequest,
     ResearchTaskRequest,
     TaskRequest,
-    TaskResultResponse,
     TaskStatus,
     TaskStatusResponse,
 )
 
 logger = get_logger(__name__)
 
-TaskExecutor = Callable[[TaskRequest], Coroutine[Any, Any, dict[str, Any]]]
+# Executors return the task result already serialized as JSON bytes.
+TaskExecutor = Callable[[TaskRequest], Coroutine[Any, Any, bytes]]
 TERMINAL_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
 
 
@@ -56,8 +56,9 @@ class StoredTask:
     completed_at: datetime | None = None
     expires_at: datetime | None = None
     error: str | None = None
-    result: dict[str, Any] | None = None
+    result: bytes | None = None
     cancel_requested: bool = False
+    status_changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
 
 
 class TaskManager:
@@ -78,7 +79,7 @@ class TaskManager:
 
         self._tasks: dict[str, StoredTask] = {}
         self._queue: asyncio.PriorityQueue[tuple[int, int, str]] = asyncio.PriorityQueue()
-        self._active_executions: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._active_executions: dict[str, asyncio.Task[bytes]] = {}
 
         self._sequence = count()
         self._lock = asyncio.Lock()
@@ -156,13 +157,36 @@ class TaskManager:
 
         return self._to_status_response(task)
 
-    async def get_task(self, task_id: str, api_key_id: str) -> TaskStatusResponse:
-        """Get task status for owner."""
+    async def get_task(
+        self, task_id: str, api_key_id: str, wait_seconds: float = 0.0
+    ) -> TaskStatusResponse:
+        """
+        Get task status for owner.
+
+        Args:
+            task_id: Task identifier
+            api_key_id: Owning API key identifier
+            wait_seconds: If the task is unfinished, wait up to this long for its status
+                to change before answering (long polling)
+
+        Returns:
+            Current task status
+        """
         task = await self._get_task_for_owner(task_id, api_key_id)
+        if wait_seconds > 0 and task.status not in TERMINAL_STATUSES:
+            try:
+                await asyncio.wait_for(task.status_changed.wait(), timeout=wait_seconds)
+            except TimeoutError:
+                pass
         return self._to_status_response(task)
 
-    async def get_task_result(self, task_id: str, api_key_id: str) -> TaskResultResponse:
-        """Get completed task result for owner."""
+    async def get_task_result(self, task_id: str, api_key_id: str) -> bytes:
+        """
+        Get completed task result for owner.
+
+        Returns:
+            TaskResultResponse JSON, with the stored result bytes spliced in unparsed
+        """
         task = await self._get_task_for_owner(task_id, api_key_id)
 
         if task.status != TaskStatus.COMPLETED:
@@ -245,6 +269,7 @@ class TaskManager:
 
             task.status = TaskStatus.PROCESSING
             task.started_at = datetime.now(UTC)
+            self._notify_status_changed(task)
 
         logger.info("Task processing started", extra={"task_id": task_id, "worker": worker_id})
 
@@ -323,13 +348,20 @@ class TaskManager:
                 raise TaskNotFoundError(f"Task {task_id} not found")
             return task
 
-    def _mark_completed(self, task: StoredTask, result: dict[str, Any]) -> None:
+    @staticmethod
+    def _notify_status_changed(task: StoredTask) -> None:
+        """Wake long-polling readers and arm a fresh event for the next change."""
+        task.status_changed.set()
+        task.status_changed = asyncio.Event()
+
+    def _mark_completed(self, task: StoredTask, result: bytes) -> None:
         now = datetime.now(UTC)
         task.status = TaskStatus.COMPLETED
         task.result = result
         task.error = None
         task.completed_at = now
         task.expires_at = now + timedelta(seconds=self._task_ttl_seconds)
+        self._notify_status_changed(task)
 
     def _mark_failed(self, task: StoredTask, error: str) -> None:
         now = datetime.now(UTC)
@@ -338,6 +370,7 @@ class TaskManager:
         task.error = error
         task.completed_at = now
         task.expires_at = now + timedelta(seconds=self._task_ttl_seconds)
+        self._notify_status_changed(task)
 
     def _mark_cancelled(self, task: StoredTask) -> None:
         now = datetime.now(UTC)
@@ -346,6 +379,7 @@ class TaskManager:
         task.error = None
         task.completed_at = now
         task.expires_at = now + timedelta(seconds=self._task_ttl_seconds)
+        self._notify_status_changed(task)
 
     @staticmethod
     def _to_status_response(task: StoredTask) -> TaskStatusResponse:
@@ -361,17 +395,7 @@ class TaskManager:
             error=task.error,
         )
 
-    @staticmethod
-    def _to_result_response(task: StoredTask) -> TaskResultResponse:
-        return TaskResultResponse(
-            task_id=task.task_id,
-            agent=task.agent,
-            status=task.status,
-            priority=task.priority,
-            created_at=task.created_at,
-            started_at=task.started_at,
-            completed_at=task.completed_at,
-            expires_at=task.expires_at,
-            error=task.error,
-            result=task.result,
-        )
+    @classmethod
+    def _to_result_response(cls, task: StoredTask) -> bytes:
+        status_json = cls._to_status_response(task).model_dump_json().encode()
+        return status_json[:-1] + b',"result":' + (task.result or b"null") + b"}"
@@ -6,13 +6,25 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
-from app.core.config import AuthConfig, Settings
+from app.core.config import AuthConfig, Settings, get_settings
 from app.main import app
 from app.models.auth import APIKeyConfig, APIKeyStatus
 
 TEST_API_KEY = "oea_0123456789abcdef0123456789abcdef"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_history(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep history written by test apps out of the repository's data/ directory."""
+    app_settings = get_settings()
+    original = app_settings.history
+    app_settings.history = original.model_copy(
+        update={"storage_dir": str(tmp_path_factory.mktemp("history"))}
+    )
+    yield
+    app_settings.history = original
+
+
 @pytest.fixture(autouse=True)
 def test_settings(monkeypatch: pytest.MonkeyPatch) -> None:
     """
@@ -0,0 +1,42 @@
+"""Tests for pooled agno agents."""
+
+from pytest_mock import MockerFixture
+
+from app.agents.pool import AgentPool
+from app.models.providers import ProviderType
+
+
+def test_same_configuration_reuses_agent(mocker: MockerFixture) -> None:
+    factory = mocker.MagicMock(side_effect=lambda: object())
+    pool = AgentPool()
+
+    first = pool.get(provider=ProviderType.OPENAI, instructions="be brief", factory=factory)
+    second = pool.get(provider=ProviderType.OPENAI, instructions="be brief", factory=factory)
+
+    assert first is second
+    assert factory.call_count == 1
+
+
+def test_distinct_configurations_get_distinct_agents(mocker: MockerFixture) -> None:
+    factory = mocker.MagicMock(side_effect=lambda: object())
+    pool = AgentPool()
+
+    openai = pool.get(provider=ProviderType.OPENAI, instructions=["a"], factory=factory)
+    xai = pool.get(provider=ProviderType.XAI, instructions=["a"], factory=factory)
+    deep = pool.get(
+        provider=ProviderType.OPENAI, instructions=["a"], factory=factory, variant="deep"
+    )
+
+    assert len({id(openai), id(xai), id(deep)}) == 3
+
+
+def test_pool_evicts_least_recently_used(mocker: MockerFixture) -> None:
+    factory = mocker.MagicMock(side_effect=lambda: object())
+    pool = AgentPool(max_agents=1)
+
+    pool.get(provider=ProviderType.OPENAI, instructions="a", factory=factory)
+    pool.get(provider=ProviderType.OPENAI, instructions="b", factory=factory)
+    pool.get(provider=ProviderType.OPENAI, instructions="a", factory=factory)
+
+    assert len(pool) == 1
+    assert factory.call_count == 3
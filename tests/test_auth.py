@@ -5,7 +5,7 @@ from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
-from app.api.middleware.auth import get_current_api_key
+from app.api.middleware.auth import _resolve_rate_limit_agent, get_current_api_key
 from app.core.config import AuthConfig, Settings
 from app.core.security import generate_api_key, hash_api_key
 from app.main import create_app
@@ -101,6 +101,20 @@ class TestAuthenticationMiddleware:
         assert result.name == "Test Key Hashed"
         assert result.status == APIKeyStatus.ACTIVE
 
+    @pytest.mark.asyncio
+    async def test_configured_keys_hashed_once(self, mocker, test_api_key, auth_config):
+        """Test configured keys are indexed once instead of rehashed per request."""
+        settings = Settings()
+        settings.auth = auth_config
+        mocker.patch("app.api.middleware.auth.get_settings", return_value=settings)
+
+        await get_current_api_key(x_api_key=test_api_key)
+        config_hash = mocker.patch("app.core.config.hash_api_key")
+        result = await get_current_api_key(x_api_key=test_api_key)
+
+        assert result.key_id == "test-key-1"
+        config_hash.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_valid_api_key_authorization_header(self, mocker, test_api_key, auth_config):
         """Test authentication with valid API key in Authorization header."""
@@ -262,6 +276,12 @@ class TestAPIKeyConfigValidation:
         assert config.key is None
         assert config.key_hash == "a" * 64
 
+    @pytest.mark.parametrize("key_hash", ["a" * 63, "a" * 65, "g" * 64, "a" * 63 + "\n"])
+    def test_rejects_malformed_key_hash(self, key_hash: str) -> None:
+        """APIKeyConfig should reject key hashes that are not 64 hex characters."""
+        with pytest.raises(ValidationError):
+            APIKeyConfig(key_id="bad", name="Bad", key_hash=key_hash)
+
     def test_rejects_missing_key_material(self) -> None:
         """APIKeyConfig should reject entries with no key material."""
         with pytest.raises(ValidationError):
@@ -281,3 +301,23 @@ class TestAPIKeyConfigValidation:
                 key_hash="a" * 64,
                 status=APIKeyStatus.ACTIVE,
             )
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/chat", "chat"),
+        ("/chat/", "chat"),
+        ("/agents/research", "research"),
+        ("/agents/research/abc", "research"),
+        ("/agents/other", "default"),
+        ("/tasks/123", "tasks"),
+        ("/history", "history"),
+        ("/health/providers", "health"),
+        ("/", "default"),
+        ("/docs", "default"),
+    ],
+)
+def test_resolve_rate_limit_agent(path: str, expected: str) -> None:
+    """Test request paths map to the expected rate limit scope."""
+    assert _resolve_rate_limit_agent(path) == expected
@@ -0,0 +1,79 @@
+"""Tests for deferred bookkeeping helpers."""
+
+import pytest
+from fastapi import BackgroundTasks
+from pytest_mock import MockerFixture
+
+from app.api.bookkeeping import run_bookkeeping, track_execution
+
+
+@pytest.mark.asyncio
+async def test_run_bookkeeping_passes_kwargs(mocker: MockerFixture) -> None:
+    """Bookkeeping operations receive the keyword arguments they were scheduled with."""
+    operation = mocker.AsyncMock()
+
+    await run_bookkeeping(operation, api_key_id="key-1", agent="chat")
+
+    operation.assert_awaited_once_with(api_key_id="key-1", agent="chat")
+
+
+@pytest.mark.asyncio
+async def test_run_bookkeeping_swallows_failures(mocker: MockerFixture) -> None:
+    """A failing bookkeeping write is logged, not raised."""
+    operation = mocker.AsyncMock(side_effect=OSError("disk full"))
+    warning = mocker.patch("app.api.bookkeeping.logger.warning")
+
+    await run_bookkeeping(operation, agent="research")
+
+    warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_track_execution_records_failure_and_reraises(mocker: MockerFixture) -> None:
+    """An exception inside the block writes a failed entry before propagating."""
+    history_service = mocker.Mock()
+    history_service.record_execution = mocker.AsyncMock()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with track_execution(
+            history_service,
+            request_id="req-1",
+            api_key_id="key-1",
+            agent="research",
+            provider="openai",
+            metadata={"depth": "quick"},
+        ):
+            raise RuntimeError("boom")
+
+    kwargs = history_service.record_execution.await_args.kwargs
+    assert kwargs["status"] == "failed"
+    assert kwargs["provider"] == "openai"
+    assert kwargs["error"] == "boom"
+    assert kwargs["metadata"] == {"depth": "quick"}
+
+
+@pytest.mark.asyncio
+async def test_track_execution_defers_success_entry(mocker: MockerFixture) -> None:
+    """A clean exit schedules the completed entry with the handler's fields."""
+    history_service = mocker.Mock()
+    history_service.record_execution = mocker.AsyncMock()
+    background_tasks = BackgroundTasks()
+
+    async with track_execution(
+        history_service,
+        request_id="req-1",
+        api_key_id="key-1",
+        agent="chat",
+        provider=None,
+        background_tasks=background_tasks,
+    ) as execution:
+        execution.provider = "openai"
+        execution.model = "gpt-4o"
+
+    history_service.record_execution.assert_not_awaited()
+    await background_tasks()
+
+    kwargs = history_service.record_execution.await_args.kwargs
+    assert kwargs["status"] == "completed"
+    assert kwargs["provider"] == "openai"
+    assert kwargs["model"] == "gpt-4o"
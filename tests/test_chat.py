@@ -1,5 +1,7 @@
 """Tests for chat functionality."""
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
@@ -173,14 +175,22 @@ class TestChatEndpoint:
     """Test chat API endpoint."""
 
     @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
+    def client(self) -> Iterator[TestClient]:
+        """Create test client with the application lifespan running."""
         app = create_app()
-        return TestClient(app)
+        with TestClient(app) as client:
+            yield client
+
+    def test_agents_share_one_provider_manager(self, client: TestClient) -> None:
+        """Startup creates one provider manager shared by the route agents."""
+        state = client.app.state
+
+        assert state.chat_agent.provider_manager is state.provider_manager
+        assert state.research_agent.provider_manager is state.provider_manager
 
     def test_chat_endpoint_success(self, client: TestClient, mocker: MockerFixture) -> None:
         """Test successful chat request."""
-        mock_chat = mocker.patch("app.api.routes.chat.chat_agent.chat")
+        mock_chat = mocker.patch("app.agents.chat.ChatAgent.chat")
         mock_chat.return_value = ChatResponse(
             reply="Hello! I'm here to help.",
             provider=ProviderType.OPENAI,
@@ -201,7 +211,7 @@ class TestChatEndpoint:
 
     def test_chat_endpoint_with_provider(self, client: TestClient, mocker: MockerFixture) -> None:
         """Test chat request with specific provider."""
-        mock_chat = mocker.patch("app.api.routes.chat.chat_agent.chat")
+        mock_chat = mocker.patch("app.agents.chat.ChatAgent.chat")
         mock_chat.return_value = ChatResponse(
             reply="Response",
             provider=ProviderType.OPENAI,
@@ -231,7 +241,7 @@ class TestChatEndpoint:
         """Test chat request when provider fails."""
         from app.services.providers import ProviderNotConfiguredError
 
-        mock_chat = mocker.patch("app.api.routes.chat.chat_agent.chat")
+        mock_chat = mocker.patch("app.agents.chat.ChatAgent.chat")
         mock_chat.side_effect = ProviderNotConfiguredError("Provider not available")
 
         response = client.post(
@@ -245,7 +255,7 @@ class TestChatEndpoint:
 
     def test_chat_endpoint_server_error(self, client: TestClient, mocker: MockerFixture) -> None:
         """Test chat request when server error occurs."""
-        mock_chat = mocker.patch("app.api.routes.chat.chat_agent.chat")
+        mock_chat = mocker.patch("app.agents.chat.ChatAgent.chat")
         mock_chat.side_effect = Exception("Something went wrong")
 
         response = client.post(
@@ -263,3 +273,24 @@ class TestChatEndpoint:
 
         assert response.status_code == 401
         assert "API key is required" in response.json()["detail"]
+
+    def test_chat_endpoint_without_bookkeeping_services(
+        self, client: TestClient, mocker: MockerFixture
+    ) -> None:
+        """Chat still answers when history and rate limiting are not initialized."""
+        mocker.patch(
+            "app.agents.chat.ChatAgent.chat",
+            return_value=ChatResponse(reply="Hi", provider=ProviderType.OPENAI, model="gpt-4o"),
+        )
+        state = client.app.state
+        mocker.patch.object(state, "history_service", None)
+        mocker.patch.object(state, "rate_limiter", None)
+
+        response = client.post(
+            "/chat",
+            json={"message": "Hello"},
+            headers={"X-API-Key": "oea_0123456789abcdef0123456789abcdef"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["reply"] == "Hi"
@@ -0,0 +1,56 @@
+"""Tests for configuration loading."""
+
+import os
+from pathlib import Path
+
+from app.core.config import CompressionConfig, Settings, _load_yaml_cached
+
+
+class TestYamlConfigLoading:
+    """Tests for YAML config parsing and caching."""
+
+    def test_missing_file_returns_empty_dict(self, tmp_path: Path):
+        """A missing config file should load as an empty mapping."""
+        settings = Settings(config_file=str(tmp_path / "missing.yaml"))
+        assert settings.load_yaml_config() == {}
+
+    def test_parse_is_cached_until_file_changes(self, tmp_path: Path):
+        """Unchanged files should be parsed once; a new mtime should trigger a reparse."""
+        config_file = tmp_path / "main.yaml"
+        config_file.write_text("app_name: first\n", encoding="utf-8")
+        settings = Settings(config_file=str(config_file))
+        _load_yaml_cached.cache_clear()
+
+        assert settings.load_yaml_config() == {"app_name": "first"}
+        assert settings.load_yaml_config() == {"app_name": "first"}
+        assert _load_yaml_cached.cache_info().hits == 1
+
+        config_file.write_text("app_name: second\n", encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert settings.load_yaml_config() == {"app_name": "second"}
+
+    def test_returned_config_is_a_copy(self, tmp_path: Path):
+        """Mutating a loaded config should not leak into later loads."""
+        config_file = tmp_path / "main.yaml"
+        config_file.write_text("auth:\n  enabled: true\n", encoding="utf-8")
+        settings = Settings(config_file=str(config_file))
+
+        settings.load_yaml_config()["auth"]["enabled"] = False
+
+        assert settings.load_yaml_config() == {"auth": {"enabled": True}}
+
+    def test_merge_validates_sections_into_models(self, tmp_path: Path):
+        """Known sections should become config models; scalar keys are set as-is."""
+        config_file = tmp_path / "main.yaml"
+        config_file.write_text(
+            "app_name: merged\ncompression:\n  minimum_size: 2048\n", encoding="utf-8"
+        )
+        settings = Settings(config_file=str(config_file))
+
+        settings.merge_yaml_config()
+
+        assert settings.app_name == "merged"
+        assert isinstance(settings.compression, CompressionConfig)
+        assert settings.compression.minimum_size == 2048
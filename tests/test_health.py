@@ -4,7 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
-from app.core.config import Settings
+from app.api.routes import health as health_routes
 from app.models.providers import ProviderHealth, ProviderType
 
 
@@ -73,15 +73,44 @@ def test_health_check_response_schema(test_app: TestClient) -> None:
     # Check field types
     assert isinstance(data["status"], str)
     assert isinstance(data["timestamp"], str)
+    assert data["timestamp"].endswith("Z")
     assert isinstance(data["service"], str)
     assert isinstance(data["version"], str)
 
+    # Payload matches the documented model even though it bypasses egress validation
+    health_routes.HealthResponse.model_validate(data)
+    schema = test_app.get("/openapi.json").json()
+    response_schema = schema["paths"]["/health"]["get"]["responses"]["200"]
+    assert response_schema["content"]["application/json"]["schema"]["$ref"].endswith(
+        "/HealthResponse"
+    )
+
+
+def test_health_check_reuses_timestamp_within_a_second(test_app: TestClient) -> None:
+    """Consecutive probes within the cache window share one serialized timestamp."""
+    headers = {"X-API-Key": "oea_0123456789abcdef0123456789abcdef"}
+
+    first = test_app.get("/health", headers=headers)
+    second = test_app.get("/health", headers=headers)
+
+    assert first.headers["content-type"] == "application/json"
+    assert first.content == second.content
+    health_routes.HealthResponse.model_validate_json(first.content)
+
+
+def test_healthz_requires_no_api_key(test_app: TestClient) -> None:
+    """Liveness probe answers without authentication."""
+    response = test_app.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert "X-RateLimit-Limit" not in response.headers
+
 
 def test_providers_health_check_healthy(test_app: TestClient, mocker) -> None:
     """Test provider health endpoint returns healthy when enabled providers are healthy."""
-    mocker.patch("app.api.routes.health.get_settings", return_value=Settings())
     mocker.patch(
-        "app.api.routes.health.ProviderManager.get_providers_health",
+        "app.services.providers.ProviderManager.get_providers_health",
         return_value=[
             ProviderHealth(
                 provider=ProviderType.OPENAI,
@@ -115,9 +144,8 @@ def test_providers_health_check_healthy(test_app: TestClient, mocker) -> None:
 
 def test_providers_health_check_degraded(test_app: TestClient, mocker) -> None:
     """Test provider health endpoint returns degraded when enabled provider is unhealthy."""
-    mocker.patch("app.api.routes.health.get_settings", return_value=Settings())
     mocker.patch(
-        "app.api.routes.health.ProviderManager.get_providers_health",
+        "app.services.providers.ProviderManager.get_providers_health",
         return_value=[
             ProviderHealth(
                 provider=ProviderType.OPENAI,
@@ -138,3 +166,22 @@ def test_providers_health_check_degraded(test_app: TestClient, mocker) -> None:
     data = response.json()
     assert data["status"] == "degraded"
     assert len(data["providers"]) == 1
+
+
+def test_providers_health_uses_app_provider_manager(test_app: TestClient, mocker) -> None:
+    """Test provider health checks use the manager the agents share, not a new one."""
+    probe = mocker.patch(
+        "app.services.providers.ProviderManager.get_providers_health",
+        autospec=True,
+        return_value=[],
+    )
+    init = mocker.spy(health_routes.ProviderManager, "__init__")
+
+    for _ in range(3):
+        response = test_app.get(
+            "/health/providers", headers={"X-API-Key": "oea_0123456789abcdef0123456789abcdef"}
+        )
+        assert response.status_code == 200
+
+    assert init.call_count == 0
+    assert all(call.args[0] is test_app.app.state.provider_manager for call in probe.call_args_list)
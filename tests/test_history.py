@@ -1,15 +1,20 @@
 """Tests for request history and execution tracking."""
 
+import asyncio
+import os
 from collections.abc import Iterator
+from datetime import UTC, date, datetime
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
+from app.core.config import get_settings
 from app.main import create_app
-from app.main import settings as app_settings
 from app.models.chat import ChatResponse
 from app.models.providers import ProviderType
+from app.services.history import HistoryService
 
 TEST_HEADERS = {"X-API-Key": "oea_0123456789abcdef0123456789abcdef"}
 
@@ -17,21 +22,21 @@ TEST_HEADERS = {"X-API-Key": "oea_0123456789abcdef0123456789abcdef"}
 @pytest.fixture
 def history_client(tmp_path) -> Iterator[TestClient]:
     """Create test client with isolated history storage."""
-    original_enabled = app_settings.history.enabled
-    original_storage = app_settings.history.storage_dir
-    original_retention = app_settings.history.retention_days
-
-    app_settings.history.enabled = True
-    app_settings.history.storage_dir = str(tmp_path / "history")
-    app_settings.history.retention_days = 14
+    app_settings = get_settings()
+    original_history = app_settings.history
+    app_settings.history = original_history.model_copy(
+        update={
+            "enabled": True,
+            "storage_dir": str(tmp_path / "history"),
+            "retention_days": 14,
+        }
+    )
 
     app = create_app()
     with TestClient(app) as client:
         yield client
 
-    app_settings.history.enabled = original_enabled
-    app_settings.history.storage_dir = original_storage
-    app_settings.history.retention_days = original_retention
+    app_settings.history = original_history
 
 
 def test_history_records_requests(history_client: TestClient) -> None:
@@ -53,7 +58,7 @@ def test_history_records_requests(history_client: TestClient) -> None:
 
 def test_history_records_chat_execution(history_client: TestClient, mocker: MockerFixture) -> None:
     """Chat endpoint should record execution history entries."""
-    mock_chat = mocker.patch("app.api.routes.chat.chat_agent.chat")
+    mock_chat = mocker.patch("app.agents.chat.ChatAgent.chat")
     mock_chat.return_value = ChatResponse(
         reply="hi",
         provider=ProviderType.OPENAI,
@@ -82,7 +87,7 @@ def test_history_records_chat_execution(history_client: TestClient, mocker: Mock
 
 def test_history_stats_aggregates(history_client: TestClient, mocker: MockerFixture) -> None:
     """Stats endpoint should aggregate request and execution metrics."""
-    mock_chat = mocker.patch("app.api.routes.chat.chat_agent.chat")
+    mock_chat = mocker.patch("app.agents.chat.ChatAgent.chat")
     mock_chat.return_value = ChatResponse(
         reply="hi",
         provider=ProviderType.OPENAI,
@@ -103,3 +108,336 @@ def test_history_stats_aggregates(history_client: TestClient, mocker: MockerFixt
     assert payload["request_count"] >= 2
     assert payload["execution_count"] >= 1
     assert payload["execution_success_count"] >= 1
+
+
+async def test_history_service_batches_buffered_writes(tmp_path, mocker: MockerFixture) -> None:
+    """Started service should append buffered records in one batch and flush before reads."""
+    service = HistoryService(
+        enabled=True,
+        storage_dir=str(tmp_path / "history"),
+        batch_size=50,
+        flush_interval_ms=1_000,
+    )
+    await service.start()
+    write_spy = mocker.spy(service, "_write_records")
+
+    for index in range(5):
+        await service.record_request(
+            request_id=f"req-{index}",
+            api_key_id="key-1",
+            method="GET",
+            path="/health",
+            status_code=200,
+            duration_ms=1.0,
+            client=None,
+        )
+
+    items, total = await service.query_requests(api_key_id="key-1", limit=10, offset=0)
+    assert total == 5
+    assert len(items) == 5
+    assert write_spy.call_count == 1
+    assert len(write_spy.call_args.args[0]) == 5
+
+    await service.aclose()
+
+
+async def test_history_service_aclose_keeps_records_written_during_shutdown(tmp_path) -> None:
+    """Records arriving while the service shuts down should all reach disk."""
+    service = HistoryService(
+        enabled=True, storage_dir=str(tmp_path / "history"), flush_interval_ms=1_000
+    )
+    await service.start()
+    closed = asyncio.Event()
+    produced = 0
+
+    async def produce() -> None:
+        nonlocal produced
+        while not closed.is_set():
+            await service.record_request(
+                request_id=f"req-{produced}",
+                api_key_id="key-1",
+                method="GET",
+                path="/health",
+                status_code=200,
+                duration_ms=1.0,
+                client=None,
+            )
+            produced += 1
+            await asyncio.sleep(0)
+
+    producer = asyncio.create_task(produce())
+    await asyncio.sleep(0.01)
+    await service.aclose()
+    closed.set()
+    await producer
+
+    history_file = next((tmp_path / "history").glob("requests-*.jsonl"))
+    assert len(history_file.read_bytes().splitlines()) == produced
+
+
+async def test_history_service_flush_returns_under_sustained_writes(tmp_path) -> None:
+    """Flush should wait for records queued before it, not for the queue to go idle."""
+    service = HistoryService(
+        enabled=True, storage_dir=str(tmp_path / "history"), flush_interval_ms=1
+    )
+    await service.start()
+    stop = asyncio.Event()
+
+    async def produce() -> None:
+        index = 0
+        while not stop.is_set():
+            await service.record_request(
+                request_id=f"req-{index}",
+                api_key_id="key-1",
+                method="GET",
+                path="/health",
+                status_code=200,
+                duration_ms=1.0,
+                client=None,
+            )
+            index += 1
+            await asyncio.sleep(0)
+
+    producer = asyncio.create_task(produce())
+    await service.record_request(
+        request_id="before-flush",
+        api_key_id="key-2",
+        method="GET",
+        path="/health",
+        status_code=200,
+        duration_ms=1.0,
+        client=None,
+    )
+    await asyncio.wait_for(service.flush(), timeout=2)
+    stop.set()
+    await producer
+
+    history_file = next((tmp_path / "history").glob("requests-*.jsonl"))
+    assert b"before-flush" in history_file.read_bytes()
+
+    await service.aclose()
+
+
+async def test_history_service_round_trips_unicode_and_metadata(tmp_path) -> None:
+    """Records should survive the JSONL round trip, with unknown metadata types as strings."""
+    service = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+
+    await service.record_execution(
+        request_id="req-1",
+        api_key_id="key-1",
+        agent="research",
+        status="completed",
+        provider="openai",
+        model="gpt-4o",
+        duration_seconds=1.5,
+        tokens_used=42,
+        estimated_cost=0.01,
+        metadata={"topic": "Überblick", "output_dir": tmp_path},
+    )
+
+    items, total = await service.query_executions(api_key_id="key-1", limit=10, offset=0)
+    assert total == 1
+    assert items[0].metadata == {"topic": "Überblick", "output_dir": str(tmp_path)}
+    assert items[0].timestamp.tzinfo is not None
+
+
+async def test_history_service_skips_malformed_records(tmp_path) -> None:
+    """Unparseable lines should be skipped without hiding the valid records around them."""
+    service = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+    await service.record_request(
+        request_id="req-1",
+        api_key_id="key-1",
+        method="GET",
+        path="/health",
+        status_code=200,
+        duration_ms=1.0,
+        client=None,
+    )
+    (history_file,) = (tmp_path / "history").glob("requests-*.jsonl")
+    with history_file.open("ab") as handle:
+        handle.write(b'not json\n{"api_key_id": "key-1"}\n')
+
+    items, total = await service.query_requests(api_key_id="key-1", limit=10, offset=0)
+    assert total == 1
+    assert items[0].request_id == "req-1"
+    assert (await service.get_stats(api_key_id="key-1")).request_count == 1
+
+
+async def test_history_index_folds_in_new_records(tmp_path, mocker: MockerFixture) -> None:
+    """Stats and queries should use the file index and only parse newly appended lines."""
+    service = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+
+    async def record(status_code: int, api_key_id: str = "key-1") -> None:
+        await service.record_request(
+            request_id=None,
+            api_key_id=api_key_id,
+            method="GET",
+            path="/health",
+            status_code=status_code,
+            duration_ms=10.0,
+            client=None,
+        )
+
+    await record(200)
+    await record(500)
+    await record(200, api_key_id="key-2")
+    first = await service.get_stats(api_key_id="key-1")
+    assert (first.request_count, first.request_error_count) == (2, 1)
+    assert first.average_request_duration_ms == 10.0
+
+    accumulate = mocker.spy(HistoryService, "_accumulate_stats")
+    await record(404)
+    second = await service.get_stats(api_key_id="key-1")
+    assert (second.request_count, second.request_error_count) == (3, 2)
+    assert accumulate.call_count == 1
+
+    (index_file,) = (tmp_path / "history").glob("requests-*.index.json")
+    assert not list((tmp_path / "history").glob("*.tmp"))
+    index_file.write_bytes(b"corrupt")
+    restarted = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+    rebuilt = await restarted.get_stats(api_key_id="key-1")
+    assert rebuilt.request_count == 3
+    items, total = await restarted.query_requests(api_key_id="key-2", limit=10, offset=0)
+    assert total == 1
+    assert items[0].api_key_id == "key-2"
+
+
+async def test_history_query_filters_records_while_reading(tmp_path) -> None:
+    """Query filters should apply during the read, with case-insensitive methods."""
+    service = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+    for method, path, status_code in [
+        ("GET", "/health", 200),
+        ("POST", "/chat", 500),
+        ("GET", "/history/stats", 500),
+    ]:
+        await service.record_request(
+            request_id=None,
+            api_key_id="key-1",
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=1.0,
+            client=None,
+        )
+
+    items, total = await service.query_requests(
+        api_key_id="key-1", limit=10, offset=0, method="get", status_code=500
+    )
+    assert total == 1
+    assert items[0].path == "/history/stats"
+
+
+async def test_history_query_reuses_decoded_records(tmp_path, mocker: MockerFixture) -> None:
+    """Repeated queries should only decode records appended since the previous query."""
+    service = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+
+    async def record(request_id: str) -> None:
+        await service.record_request(
+            request_id=request_id,
+            api_key_id="key-1",
+            method="GET",
+            path="/health",
+            status_code=200,
+            duration_ms=1.0,
+            client=None,
+        )
+
+    await record("req-1")
+    await record("req-2")
+    await service.query_requests(api_key_id="key-1", limit=10, offset=0)
+
+    loads = mocker.spy(orjson, "loads")
+    _, total = await service.query_requests(api_key_id="key-1", limit=10, offset=0)
+    assert total == 2
+    assert loads.call_count == 0
+
+    await record("req-3")
+    items, total = await service.query_requests(api_key_id="key-1", limit=10, offset=0)
+    assert total == 3
+    assert items[0].request_id == "req-3"
+    assert loads.call_count == 2  # one line for the index, one for the record cache
+
+
+async def test_history_query_pages_newest_first(tmp_path) -> None:
+    """Pagination should count every match but return only the requested newest-first page."""
+    service = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+    for index in range(5):
+        await service.record_execution(
+            request_id=f"req-{index}",
+            api_key_id="key-1",
+            agent="chat",
+            status="completed",
+            provider=None,
+            model=None,
+            duration_seconds=None,
+            tokens_used=None,
+            estimated_cost=None,
+        )
+
+    items, total = await service.query_executions(api_key_id="key-1", limit=2, offset=1)
+
+    assert total == 5
+    assert [item.request_id for item in items] == ["req-3", "req-2"]
+
+
+def test_history_filters_validate_as_one_model(history_client: TestClient) -> None:
+    """Query filters are validated together and reject out-of-range values."""
+    response = history_client.get(
+        "/history/executions",
+        params={"agent": "chat", "limit": 500},
+        headers=TEST_HEADERS,
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "limit"]
+
+
+async def test_history_file_date_follows_record_timestamp(tmp_path, mocker: MockerFixture) -> None:
+    """A record is filed under its own timestamp's date, read from the clock once."""
+    service = HistoryService(enabled=True, storage_dir=str(tmp_path / "history"))
+    clock = mocker.patch("app.services.history.datetime", wraps=datetime)
+    clock.now.return_value = datetime(2026, 1, 1, 23, 59, 59, 999_999, tzinfo=UTC)
+
+    await service.record_request(
+        request_id="req-1",
+        api_key_id="key-1",
+        method="GET",
+        path="/health",
+        status_code=200,
+        duration_ms=1.0,
+        client=None,
+    )
+
+    assert clock.now.call_count == 1
+    assert (tmp_path / "history" / "requests-2026-01-01.jsonl").exists()
+
+
+async def test_history_reuses_directory_listing(tmp_path, mocker: MockerFixture) -> None:
+    """History files are listed again only after the storage directory changes."""
+    storage_dir = tmp_path / "history"
+    service = HistoryService(enabled=True, storage_dir=str(storage_dir))
+    clock = mocker.patch("app.services.history.datetime", wraps=datetime)
+
+    async def record(day: int) -> int:
+        clock.now.return_value = datetime(2026, 1, day, tzinfo=UTC)
+        await service.record_request(
+            request_id=None,
+            api_key_id="key-1",
+            method="GET",
+            path="/health",
+            status_code=200,
+            duration_ms=1.0,
+            client=None,
+        )
+        stats = await service.get_stats(api_key_id="key-1", start_date=date(2026, 1, day))
+        # Backdate the directory so the listing is not treated as racily fresh.
+        os.utime(storage_dir, ns=(day, day))
+        return stats.request_count
+
+    assert await record(1) == 1
+    scandir = mocker.spy(os, "scandir")
+    assert (await service.get_stats(api_key_id="key-1")).request_count == 1
+    assert (await service.get_stats(api_key_id="key-1")).request_count == 1
+    assert scandir.call_count == 1
+
+    assert await record(2) == 1
+    assert scandir.call_count > 1
@@ -2,11 +2,12 @@
 
 import json
 import logging
+from pathlib import Path
 
 from fastapi.testclient import TestClient
 
 from app.api.middleware.request_id import request_id_context
-from app.core.logging import JSONFormatter, RequestIDFilter, TextFormatter
+from app.core.logging import JSONFormatter, RequestIDFilter, TextFormatter, _log_timestamp
 from app.main import create_app
 
 
@@ -92,6 +93,41 @@ class TestJSONFormatter:
         assert log_data["message"] == "Test message"
         assert log_data["logger"] == "test.logger"
 
+    def test_timestamp_is_reused_within_a_millisecond(self, mocker):
+        """Test that records formatted in the same millisecond share one timestamp string."""
+        time_ns = mocker.patch(
+            "app.core.logging.time.time_ns", return_value=1_700_000_000_123_456_789
+        )
+
+        first = _log_timestamp()
+        time_ns.return_value += 500_000
+        second = _log_timestamp()
+        time_ns.return_value += 1_000_000
+        third = _log_timestamp()
+
+        assert first == "2023-11-14T22:13:20.123+00:00"
+        assert second is first
+        assert third == "2023-11-14T22:13:20.124+00:00"
+
+    def test_format_stringifies_non_json_extras(self):
+        """Test that extras without a JSON representation are rendered via str()."""
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.storage_dir = Path("data/history")
+        record.attempts = 3
+
+        log_data = json.loads(JSONFormatter().format(record))
+
+        assert log_data["storage_dir"] == "data/history"
+        assert log_data["attempts"] == 3
+
     def test_format_without_request_id(self):
         """Test that JSON formatter works without request ID."""
         # Create a log record without request_id
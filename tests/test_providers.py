@@ -1,10 +1,14 @@
 """Tests for provider management."""
 
+import asyncio
+
 import pytest
 from agno.models.xai import xAI
 
 from app.core.config import ProviderConfig, ProvidersConfig
-from app.models.providers import ProviderType
+from app.models.providers import ProviderHealth, ProviderType
+from app.models.research import ResearchDepth
+from app.services import providers as providers_module
 from app.services.providers import (
     ProviderExecutionError,
     ProviderManager,
@@ -61,10 +65,9 @@ def providers_config_xai_disabled(
     openai_config: ProviderConfig, xai_config: ProviderConfig
 ) -> ProvidersConfig:
     """Create providers config with XAI disabled."""
-    xai_config.enabled = False
     return ProvidersConfig(
         openai=openai_config,
-        xai=xai_config,
+        xai=xai_config.model_copy(update={"enabled": False}),
         default_provider="openai",
     )
 
@@ -123,7 +126,7 @@ class TestGetModel:
     ) -> None:
         """Test OpenAI model creation uses timeout/retry configuration."""
         manager = ProviderManager(providers_config_openai_only)
-        mock_openai = mocker.patch("app.services.providers.OpenAIChat")
+        mock_openai = mocker.patch("agno.models.openai.OpenAIChat")
         sentinel_model = object()
         mock_openai.return_value = sentinel_model
 
@@ -137,6 +140,7 @@ class TestGetModel:
             retries=2,
             delay_between_retries=1,
             exponential_backoff=True,
+            http_client=manager.http_client,
         )
 
     def test_get_xai_model(self, providers_config_both: ProvidersConfig) -> None:
@@ -154,7 +158,7 @@ class TestGetModel:
     ) -> None:
         """Test XAI model creation uses timeout/retry configuration."""
         manager = ProviderManager(providers_config_both)
-        mock_xai = mocker.patch("app.services.providers.xAI")
+        mock_xai = mocker.patch("agno.models.xai.xAI")
         sentinel_model = object()
         mock_xai.return_value = sentinel_model
 
@@ -168,8 +172,56 @@ class TestGetModel:
             retries=2,
             delay_between_retries=1,
             exponential_backoff=True,
+            http_client=manager.http_client,
         )
 
+    def test_models_share_one_http_client(self, providers_config_both: ProvidersConfig) -> None:
+        """Test all models and managers reuse the same pooled HTTP client."""
+        manager = ProviderManager(providers_config_both)
+        other_manager = ProviderManager(providers_config_both)
+
+        openai_model = manager.get_model(ProviderType.OPENAI)
+        xai_model = other_manager.get_research_model(ProviderType.XAI)
+
+        assert openai_model.http_client is manager.http_client
+        assert xai_model.http_client is manager.http_client
+
+    async def test_aclose_recreates_shared_client_on_next_use(
+        self, providers_config_both: ProvidersConfig
+    ) -> None:
+        """Test closing the shared client does not break later managers."""
+        manager = ProviderManager(providers_config_both)
+        client = manager.http_client
+
+        await manager.aclose()
+        await manager.aclose()
+
+        assert client.is_closed
+        assert providers_module._shared_http_client is None
+        assert manager.http_client is not client
+        assert not manager.http_client.is_closed
+
+    async def test_models_are_reused_until_client_changes(
+        self, providers_config_both: ProvidersConfig
+    ) -> None:
+        """Test each model configuration is built once per HTTP client."""
+        manager = ProviderManager(providers_config_both)
+
+        chat_model = manager.get_model(ProviderType.OPENAI)
+        assert manager.get_model(ProviderType.OPENAI) is chat_model
+        assert manager.get_research_model(ProviderType.OPENAI) is not chat_model
+        assert manager.get_research_model(
+            ProviderType.OPENAI, ResearchDepth.QUICK
+        ) is manager.get_research_model(ProviderType.OPENAI, ResearchDepth.DEEP)
+        assert manager.get_model(ProviderType.XAI) is not manager.get_research_model(
+            ProviderType.XAI
+        )
+
+        await manager.aclose()
+        rebuilt = manager.get_model(ProviderType.OPENAI)
+        assert rebuilt is not chat_model
+        assert rebuilt.http_client is manager.http_client
+
     def test_get_default_provider_model(
         self, providers_config_openai_only: ProvidersConfig
     ) -> None:
@@ -211,13 +263,28 @@ class TestDefaultProvider:
         # Set default to XAI but disable it
         providers_config_both.default_provider = "xai"
         assert providers_config_both.xai is not None
-        providers_config_both.xai.enabled = False
+        providers_config_both.xai = providers_config_both.xai.model_copy(update={"enabled": False})
 
         manager = ProviderManager(providers_config_both)
         default = manager.get_default_provider()
         # Should fallback to OpenAI (the only available one)
         assert default == ProviderType.OPENAI
 
+    def test_default_provider_resolved_once(
+        self, providers_config_both: ProvidersConfig, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test the fallback is resolved and logged at init, not on every lookup."""
+        providers_config_both.default_provider = "xai"
+        assert providers_config_both.xai is not None
+        providers_config_both.xai = providers_config_both.xai.model_copy(update={"enabled": False})
+
+        manager = ProviderManager(providers_config_both)
+        for _ in range(3):
+            assert manager.get_provider_chain() == [ProviderType.OPENAI]
+
+        fallbacks = [r for r in caplog.records if r.getMessage().startswith("Default provider")]
+        assert len(fallbacks) == 1
+
     def test_default_provider_no_providers_available(self) -> None:
         """Test error when no providers are available."""
         config = ProvidersConfig(
@@ -306,6 +373,132 @@ class TestProviderFallback:
         assert error.attempted_providers == [ProviderType.OPENAI, ProviderType.XAI]
         assert isinstance(error.last_error, RuntimeError)
 
+    @pytest.mark.asyncio
+    async def test_run_with_fallback_bounds_concurrency_per_provider(self) -> None:
+        """Test concurrent operations never exceed the provider's configured limit."""
+        manager = ProviderManager(
+            ProvidersConfig(
+                openai=ProviderConfig(enabled=True, model="gpt-4o", max_concurrency=2),
+                default_provider="openai",
+            )
+        )
+        in_flight = 0
+        peak = 0
+
+        async def operation(provider: ProviderType) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return provider.value
+
+        await asyncio.gather(*(manager.run_with_fallback(operation=operation) for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_with_fallback_collapses_duplicate_keys(
+        self, providers_config_both: ProvidersConfig
+    ) -> None:
+        """Test concurrent calls with one dedup key share a single execution."""
+        manager = ProviderManager(providers_config_both)
+        calls: list[str] = []
+
+        async def operation(provider: ProviderType) -> str:
+            calls.append(provider.value)
+            result = f"result-{len(calls)}"
+            await asyncio.sleep(0.01)
+            return result
+
+        results = await asyncio.gather(
+            manager.run_with_fallback(operation=operation, dedup_key="same"),
+            manager.run_with_fallback(operation=operation, dedup_key="same"),
+            manager.run_with_fallback(operation=operation, dedup_key="other"),
+            manager.run_with_fallback(operation=operation),
+        )
+
+        assert len(calls) == 3
+        assert results[0] == results[1]
+        assert len({result for result, _ in results}) == 3
+        assert manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_run_with_fallback_shares_failures_of_collapsed_calls(
+        self, providers_config_openai_only: ProvidersConfig
+    ) -> None:
+        """Test every caller sharing a dedup key receives the execution error."""
+        manager = ProviderManager(providers_config_openai_only)
+
+        async def operation(provider: ProviderType) -> str:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(manager.run_with_fallback(operation=operation, dedup_key="key") for _ in range(2)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ProviderExecutionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_run_with_fallback_hedges_slow_primary(
+        self, providers_config_both: ProvidersConfig
+    ) -> None:
+        """Test a slow primary is raced against the next provider and then cancelled."""
+        manager = ProviderManager(providers_config_both)
+        cancelled: list[ProviderType] = []
+
+        async def operation(provider: ProviderType) -> str:
+            try:
+                await asyncio.sleep(1 if provider == ProviderType.OPENAI else 0)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+            return provider.value
+
+        result, used_provider = await manager.run_with_fallback(
+            operation=operation, hedge_delay=0.01
+        )
+
+        assert (result, used_provider) == ("xai", ProviderType.XAI)
+        assert cancelled == [ProviderType.OPENAI]
+
+    @pytest.mark.asyncio
+    async def test_run_with_fallback_hedging_skips_fast_primary(
+        self, providers_config_both: ProvidersConfig
+    ) -> None:
+        """Test the next provider is not started when the primary answers in time."""
+        manager = ProviderManager(
+            providers_config_both.model_copy(update={"hedge_delay_ms": 1_000})
+        )
+        calls: list[ProviderType] = []
+
+        async def operation(provider: ProviderType) -> str:
+            calls.append(provider)
+            return provider.value
+
+        result, _ = await manager.run_with_fallback(operation=operation)
+
+        assert result == "openai"
+        assert calls == [ProviderType.OPENAI]
+
+    @pytest.mark.asyncio
+    async def test_run_with_fallback_hedged_failures_raise(
+        self, providers_config_both: ProvidersConfig
+    ) -> None:
+        """Test hedged attempts that all fail surface as a provider execution error."""
+        manager = ProviderManager(providers_config_both)
+
+        async def operation(provider: ProviderType) -> str:
+            await asyncio.sleep(0.05 if provider == ProviderType.OPENAI else 0)
+            raise RuntimeError(provider.value)
+
+        with pytest.raises(ProviderExecutionError) as exc_info:
+            await manager.run_with_fallback(operation=operation, hedge_delay=0.01)
+
+        assert exc_info.value.attempted_providers == [ProviderType.XAI, ProviderType.OPENAI]
+
 
 class TestResearchModelSelection:
     """Test research-specific provider model selection."""
@@ -374,6 +567,17 @@ class TestProviderHealth:
         assert status.healthy is False
         assert status.reason == "Provider disabled"
 
+    def test_check_provider_health_unconfigured_provider(
+        self, providers_config_openai_only: ProvidersConfig
+    ) -> None:
+        """Test an unconfigured provider yields a report that passes validation."""
+        manager = ProviderManager(providers_config_openai_only)
+
+        status = manager.check_provider_health(ProviderType.XAI)
+
+        assert status.reason == "Provider not configured"
+        assert ProviderHealth.model_validate(status.model_dump()) == status
+
     def test_get_providers_health_filters_disabled(
         self, providers_config_xai_disabled: ProvidersConfig, monkeypatch, mocker
     ) -> None:
@@ -388,3 +592,15 @@ class TestProviderHealth:
         assert len(all_statuses) == 2
         assert len(enabled_only_statuses) == 1
         assert enabled_only_statuses[0].provider == ProviderType.OPENAI
+
+    def test_preload_models_builds_enabled_providers_with_keys(
+        self, providers_config_xai_disabled: ProvidersConfig, monkeypatch, mocker
+    ) -> None:
+        """Test startup preloading builds only enabled providers whose API key is set."""
+        manager = ProviderManager(providers_config_xai_disabled)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+        get_model = mocker.patch.object(manager, "get_model", side_effect=RuntimeError("boom"))
+
+        manager.preload_models()
+
+        get_model.assert_called_once_with(ProviderType.OPENAI)
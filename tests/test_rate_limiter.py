@@ -6,9 +6,8 @@ import pytest
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
-from app.core.config import RateLimitPolicy, RateLimitsConfig
+from app.core.config import RateLimitPolicy, RateLimitsConfig, get_settings
 from app.main import create_app
-from app.main import settings as app_settings
 from app.models.chat import ChatResponse
 from app.models.providers import ProviderType
 from app.services.rate_limiter import RateLimiter
@@ -19,6 +18,7 @@ TEST_HEADERS = {"X-API-Key": "oea_0123456789abcdef0123456789abcdef"}
 @pytest.fixture
 def rate_limited_client() -> Iterator[TestClient]:
     """Create test client with strict test-specific rate limits."""
+    app_settings = get_settings()
     original = app_settings.rate_limits.model_copy(deep=True)
     app_settings.rate_limits = RateLimitsConfig(
         enabled=True,
@@ -91,6 +91,28 @@ class TestRateLimiterService:
         assert cost_block is not None and not cost_block.allowed
         assert cost_block.dimension == "cost"
 
+    @pytest.mark.asyncio
+    async def test_policy_resolved_once_per_agent(self, mocker) -> None:
+        limiter = RateLimiter(
+            RateLimitsConfig(
+                enabled=True,
+                default=RateLimitPolicy(requests_per_minute=10, tokens_per_day=100),
+                agents={"chat": RateLimitPolicy(requests_per_minute=2)},
+                cleanup_interval_seconds=1,
+            )
+        )
+        resolve = mocker.spy(limiter, "_resolve_policy")
+
+        for _ in range(3):
+            await limiter.consume_request(api_key_id="key-1", agent="chat")
+            await limiter.record_usage(
+                api_key_id="key-1", agent="chat", tokens=1, estimated_cost=None
+            )
+        blocked = await limiter.consume_request(api_key_id="key-1", agent="chat")
+
+        assert resolve.call_count == 1
+        assert blocked is not None and not blocked.allowed
+
 
 class TestRateLimiterAPI:
     """Integration tests for endpoint-level rate limiting."""
@@ -106,7 +128,7 @@ class TestRateLimiterAPI:
     def test_chat_agent_specific_limit(
         self, rate_limited_client: TestClient, mocker: MockerFixture
     ) -> None:
-        mock_chat = mocker.patch("app.api.routes.chat.chat_agent.chat")
+        mock_chat = mocker.patch("app.agents.chat.ChatAgent.chat")
         mock_chat.return_value = ChatResponse(
             reply="hi",
             provider=ProviderType.OPENAI,
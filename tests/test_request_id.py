@@ -1,8 +1,10 @@
 """Tests for request ID middleware."""
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 
+from app.api.bookkeeping import request_elapsed_seconds
 from app.api.middleware.request_id import get_request_id
 from app.core.config import AuthConfig, Settings
 from app.main import create_app
@@ -88,6 +90,24 @@ class TestRequestIDMiddleware:
         assert "X-Request-ID" in response.headers
         assert response.headers["X-Request-ID"].startswith("req_")
 
+    def test_start_time_in_request_state(self, mocker, disabled_auth_config):
+        """Test that the middleware exposes a monotonic start time on request state."""
+        settings = Settings()
+        settings.auth = disabled_auth_config
+        mocker.patch("app.core.config.get_settings", return_value=settings)
+
+        app = create_app()
+
+        @app.get("/_elapsed")
+        async def elapsed(request: Request) -> dict[str, float | None]:
+            return {"elapsed": request_elapsed_seconds(request)}
+
+        client = TestClient(app)
+        response = client.get("/_elapsed")
+        elapsed_seconds = response.json()["elapsed"]
+        assert elapsed_seconds is not None
+        assert elapsed_seconds >= 0
+
 
 class TestRequestIDContext:
     """Tests for request ID context variable."""
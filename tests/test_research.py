@@ -1,17 +1,31 @@
 """Tests for research agent and endpoint."""
 
+import asyncio
+import json
+from collections.abc import Iterator
+from types import SimpleNamespace
+
 import pytest
+import yaml
 from agno.agent import RunOutput
 from agno.models.message import Citations, UrlCitation
 from agno.models.metrics import Metrics
+from agno.run.agent import RunContentEvent
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
-from app.agents.research import ResearchAgent
+from app.agents.research import ResearchAgent, _emit_frontmatter
+from app.api.routes import research as research_routes
 from app.core.config import ProviderConfig, ProvidersConfig
 from app.main import create_app
 from app.models.providers import ProviderType
-from app.models.research import ResearchDepth, ResearchMetadata, ResearchResponse, SourceReference
+from app.models.research import (
+    ResearchDepth,
+    ResearchMetadata,
+    ResearchRequest,
+    ResearchResponse,
+    SourceReference,
+)
 from app.services.providers import (
     ProviderExecutionError,
     ProviderManager,
@@ -41,9 +55,86 @@ def research_agent(provider_manager: ProviderManager) -> ResearchAgent:
     return ResearchAgent(provider_manager)
 
 
+FRONTMATTER_VECTORS: list[dict[str, str | list[str]]] = [
+    {
+        "title": "Quantum Computing",
+        "topic": "quantum computing",
+        "date": "2026-01-31",
+        "tags": ["research", "ai-generated"],
+        "source": "ObsidianEcho-AI",
+        "model": "gpt-4o",
+        "sources": [],
+    },
+    {
+        "title": 'Rust: "async" # traits',
+        "topic": "yes",
+        "depth": "null",
+        "provider": "  padded  ",
+        "model": "1.5",
+        "sources": ["https://example.com/a?b=c#d", "- dash", "tab\there", "line\nbreak"],
+    },
+    {
+        "title": "Ünïcödé ✓ \U0001f600",
+        "topic": "ctrl\x00\x7f\x85\u2028end",
+        "tags": ["@at", "*star", "&amp", "!bang", "%pct", "'quote", "{brace}", "[list]"],
+    },
+]
+
+
+@pytest.mark.parametrize("frontmatter", FRONTMATTER_VECTORS)
+def test_emit_frontmatter_round_trips_like_safe_dump(
+    frontmatter: dict[str, str | list[str]],
+) -> None:
+    """Hand-rolled frontmatter must load back to the same data as yaml.safe_dump output."""
+    emitted = _emit_frontmatter(frontmatter)
+    reference = yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=False)
+
+    assert yaml.safe_load(emitted) == yaml.safe_load(reference) == frontmatter
+
+
 class TestResearchAgent:
     """Unit tests for research agent behavior."""
 
+    @pytest.mark.parametrize(
+        ("body", "expected_title", "has_h1", "has_sources"),
+        [
+            ("plain text", None, False, False),
+            ("# Title\n\n## Sources\n\n1. x", "Title", True, True),
+            ("## Sources\n\n# Later Title", "Later Title", True, True),
+            ("#\n## Sources", "## Sources", True, True),
+            ("## Overview\n##Sources", None, False, False),
+        ],
+    )
+    def test_scan_body_single_pass(
+        self, body: str, expected_title: str | None, has_h1: bool, has_sources: bool
+    ) -> None:
+        """Body scan finds the first H1 title and any Sources heading in one pass."""
+        scan = ResearchAgent._scan_body(body)
+
+        assert scan.title == expected_title
+        assert scan.has_h1 is has_h1
+        assert scan.has_sources is has_sources
+
+    def test_extract_sources_dedupes_by_url_keeping_first(self) -> None:
+        """Citations are deduplicated by URL in first-seen order."""
+        run_output = RunOutput(
+            citations=Citations(
+                urls=[
+                    UrlCitation(url="https://example.com/one", title="First"),
+                    UrlCitation(url="https://example.com/two", title="Two"),
+                    UrlCitation(url="https://example.com/one", title="Duplicate"),
+                    UrlCitation(url=None, title="No URL"),
+                ]
+            ),
+        )
+
+        sources = ResearchAgent._extract_sources(run_output)
+
+        assert sources == [
+            SourceReference(url="https://example.com/one", title="First"),
+            SourceReference(url="https://example.com/two", title="Two"),
+        ]
+
     @pytest.mark.asyncio
     async def test_research_formats_obsidian_markdown(
         self,
@@ -81,6 +172,28 @@ class TestResearchAgent:
         assert "## Sources" in result.markdown
         assert "https://example.com/one" in result.markdown
 
+    @pytest.mark.asyncio
+    async def test_research_formats_large_bodies_in_worker_thread(
+        self,
+        research_agent: ResearchAgent,
+        provider_manager: ProviderManager,
+        mocker: MockerFixture,
+    ) -> None:
+        """Large research bodies should be formatted off the event loop."""
+        run_output = RunOutput(content="# Deep Topic\n\n" + "detail " * 2_000, model="gpt-4o")
+        mocker.patch.object(
+            provider_manager,
+            "run_with_fallback",
+            new=mocker.AsyncMock(return_value=(run_output, ProviderType.OPENAI)),
+        )
+        to_thread = mocker.spy(asyncio, "to_thread")
+
+        result = await research_agent.research(topic="Deep Topic", depth=ResearchDepth.DEEP)
+
+        to_thread.assert_called_once()
+        assert result.markdown.startswith("---\n")
+        assert "# Deep Topic" in result.markdown
+
     @pytest.mark.asyncio
     async def test_research_adds_heading_and_missing_sources_note(
         self,
@@ -134,14 +247,77 @@ class TestResearchAgent:
         assert "\n```" not in result.markdown
         assert "# Title" in result.markdown
 
+    @pytest.mark.asyncio
+    async def test_research_stream_yields_chunks_then_response(
+        self,
+        research_agent: ResearchAgent,
+        mocker: MockerFixture,
+    ) -> None:
+        """Streaming research should yield content chunks, then the formatted response."""
+        final = RunOutput(content="# Streams\n\nBody text.", model="gpt-4o")
+
+        async def fake_arun(*_args: object, **_kwargs: object):
+            yield RunContentEvent(content="# Streams\n\n")
+            yield RunContentEvent(content="Body text.")
+            yield final
+
+        agent = mocker.MagicMock()
+        agent.arun = fake_arun
+        mocker.patch.object(research_agent, "_get_agent", return_value=agent)
+
+        items = [item async for item in research_agent.research_stream(topic="Streams")]
+
+        assert items[:2] == ["# Streams\n\n", "Body text."]
+        result = items[-1]
+        assert isinstance(result, ResearchResponse)
+        assert result.metadata.provider == ProviderType.OPENAI
+        assert "# Streams" in result.markdown
+
+    @pytest.mark.asyncio
+    async def test_research_stream_falls_back_before_first_chunk(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A provider failing before emitting output should fall back to the next one."""
+        manager = ProviderManager(
+            ProvidersConfig(
+                openai=ProviderConfig(enabled=True, model="gpt-4o"),
+                xai=ProviderConfig(enabled=True, model="grok-beta"),
+                default_provider="openai",
+            )
+        )
+        agent = ResearchAgent(manager)
+
+        async def failing_arun(*_args: object, **_kwargs: object):
+            raise RuntimeError("connection refused")
+            yield  # pragma: no cover
+
+        async def working_arun(*_args: object, **_kwargs: object):
+            yield RunContentEvent(content="ok")
+            yield RunOutput(content="ok", model="grok-beta")
+
+        agents = {
+            ProviderType.OPENAI: mocker.MagicMock(arun=failing_arun),
+            ProviderType.XAI: mocker.MagicMock(arun=working_arun),
+        }
+        mocker.patch.object(
+            agent, "_get_agent", side_effect=lambda *, provider, **_: agents[provider]
+        )
+
+        items = [item async for item in agent.research_stream(topic="Fallback topic")]
+
+        assert items[0] == "ok"
+        assert isinstance(items[-1], ResearchResponse)
+        assert items[-1].metadata.provider == ProviderType.XAI
+
 
 class TestResearchEndpoint:
     """Integration tests for research endpoint."""
 
     @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(create_app())
+    def client(self) -> Iterator[TestClient]:
+        """Create test client with the application lifespan running."""
+        with TestClient(create_app()) as client:
+            yield client
 
     def test_research_endpoint_success(self, client: TestClient, mocker: MockerFixture) -> None:
         """Test successful research request."""
@@ -159,7 +335,7 @@ class TestResearchEndpoint:
             ),
         )
 
-        mock_research = mocker.patch("app.api.routes.research.research_agent.research")
+        mock_research = mocker.patch("app.agents.research.ResearchAgent.research")
         mock_research.return_value = response_payload
 
         response = client.post(
@@ -173,6 +349,110 @@ class TestResearchEndpoint:
         assert data["topic"] == "AI safety"
         assert data["metadata"]["provider"] == "openai"
 
+    def test_research_stream_endpoint_emits_sse_frames(
+        self, client: TestClient, mocker: MockerFixture
+    ) -> None:
+        """Test the streaming endpoint emits delta frames followed by a result frame."""
+        response_payload = ResearchResponse(
+            topic="AI safety",
+            markdown="---\ntitle: AI safety\n---\n\n# AI safety",
+            sources=[],
+            metadata=ResearchMetadata(
+                provider=ProviderType.OPENAI,
+                model="gpt-4o",
+                depth=ResearchDepth.STANDARD,
+                duration_seconds=1.1,
+                tokens_used=12,
+                sources_count=0,
+            ),
+        )
+
+        async def fake_stream(**_kwargs: object):
+            yield "# AI "
+            yield "safety"
+            yield response_payload
+
+        mocker.patch("app.agents.research.ResearchAgent.research_stream", side_effect=fake_stream)
+
+        response = client.post(
+            "/agents/research/stream",
+            json={"topic": "AI safety"},
+            headers={"X-API-Key": "oea_0123456789abcdef0123456789abcdef"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        assert frames[0] == 'event: delta\ndata: {"content":"# AI "}'
+        assert frames[1] == 'event: delta\ndata: {"content":"safety"}'
+        assert frames[2].startswith("event: result\ndata: ")
+        assert json.loads(frames[2].split("data: ", 1)[1])["topic"] == "AI safety"
+
+    async def test_research_stream_bills_before_sending_result(self, mocker: MockerFixture) -> None:
+        """Test usage and history are recorded even if the client leaves at the result frame."""
+        response_payload = ResearchResponse(
+            topic="AI safety",
+            markdown="# AI safety",
+            sources=[],
+            metadata=ResearchMetadata(
+                provider=ProviderType.OPENAI,
+                model="gpt-4o",
+                depth=ResearchDepth.STANDARD,
+                duration_seconds=1.1,
+                tokens_used=12,
+                sources_count=0,
+            ),
+        )
+
+        async def fake_stream(**_kwargs: object):
+            yield "# AI safety"
+            yield response_payload
+
+        agent = mocker.Mock(research_stream=fake_stream)
+        history_service = mocker.AsyncMock()
+        rate_limiter = mocker.AsyncMock()
+
+        response = await research_routes.research_stream(
+            payload=ResearchRequest(topic="AI safety"),
+            http_request=mocker.Mock(state=SimpleNamespace(request_id="req-1")),
+            api_key=mocker.Mock(key_id="key-1"),
+            research_agent=agent,
+            history_service=history_service,
+            rate_limiter=rate_limiter,
+        )
+        frames = response.body_iterator
+        async for frame in frames:
+            if frame.startswith(b"event: result"):
+                break
+        await frames.aclose()  # type: ignore[attr-defined]
+
+        rate_limiter.record_usage.assert_awaited_once()
+        assert rate_limiter.record_usage.await_args.kwargs["tokens"] == 12
+        history_service.record_execution.assert_awaited_once()
+        assert history_service.record_execution.await_args.kwargs["status"] == "completed"
+
+    def test_research_stream_endpoint_reports_errors(
+        self, client: TestClient, mocker: MockerFixture
+    ) -> None:
+        """Test stream failures are reported as an error frame."""
+
+        async def failing_stream(**_kwargs: object):
+            raise ProviderNotConfiguredError("Provider not available")
+            yield  # pragma: no cover
+
+        mocker.patch(
+            "app.agents.research.ResearchAgent.research_stream", side_effect=failing_stream
+        )
+
+        response = client.post(
+            "/agents/research/stream",
+            json={"topic": "AI safety"},
+            headers={"X-API-Key": "oea_0123456789abcdef0123456789abcdef"},
+        )
+
+        assert response.status_code == 200
+        assert response.text == 'event: error\ndata: {"detail":"Provider not available"}\n\n'
+
     def test_research_endpoint_validation_error(self, client: TestClient) -> None:
         """Test validation error for invalid request."""
         response = client.post(
@@ -187,7 +467,7 @@ class TestResearchEndpoint:
         self, client: TestClient, mocker: MockerFixture
     ) -> None:
         """Test provider-not-configured mapped to 400."""
-        mock_research = mocker.patch("app.api.routes.research.research_agent.research")
+        mock_research = mocker.patch("app.agents.research.ResearchAgent.research")
         mock_research.side_effect = ProviderNotConfiguredError("Provider not available")
 
         response = client.post(
@@ -202,7 +482,7 @@ class TestResearchEndpoint:
         self, client: TestClient, mocker: MockerFixture
     ) -> None:
         """Test all-providers-failed mapped to 502."""
-        mock_research = mocker.patch("app.api.routes.research.research_agent.research")
+        mock_research = mocker.patch("app.agents.research.ResearchAgent.research")
         mock_research.side_effect = ProviderExecutionError(
             message="All provider execution attempts failed: openai, xai",
             attempted_providers=[ProviderType.OPENAI, ProviderType.XAI],
@@ -221,7 +501,7 @@ class TestResearchEndpoint:
         self, client: TestClient, mocker: MockerFixture
     ) -> None:
         """Test unexpected exceptions mapped to 500."""
-        mock_research = mocker.patch("app.api.routes.research.research_agent.research")
+        mock_research = mocker.patch("app.agents.research.ResearchAgent.research")
         mock_research.side_effect = Exception("Unexpected")
 
         response = client.post(
@@ -255,7 +535,7 @@ class TestResearchEndpoint:
                 sources_count=0,
             ),
         )
-        mock_research = mocker.patch("app.api.routes.research.research_agent.research")
+        mock_research = mocker.patch("app.agents.research.ResearchAgent.research")
         mock_research.return_value = response_payload
 
         response = client.post(
@@ -267,3 +547,38 @@ class TestResearchEndpoint:
         assert response.status_code == 200
         assert response.headers["content-type"].startswith("text/markdown")
         assert response.text == response_payload.markdown
+
+    def test_research_endpoint_compresses_large_markdown(
+        self, client: TestClient, mocker: MockerFixture
+    ) -> None:
+        """Large markdown bodies are gzip-compressed for clients that accept it."""
+        markdown = "---\ntitle: AI safety\n---\n\n# AI safety\n\n" + "Long paragraph. " * 500
+        response_payload = ResearchResponse(
+            topic="AI safety",
+            markdown=markdown,
+            sources=[],
+            metadata=ResearchMetadata(
+                provider=ProviderType.OPENAI,
+                model="gpt-4o",
+                depth=ResearchDepth.STANDARD,
+                duration_seconds=1.1,
+                tokens_used=123,
+                sources_count=0,
+            ),
+        )
+        mock_research = mocker.patch("app.agents.research.ResearchAgent.research")
+        mock_research.return_value = response_payload
+
+        response = client.post(
+            "/agents/research?as_markdown=true",
+            json={"topic": "AI safety"},
+            headers={
+                "X-API-Key": "oea_0123456789abcdef0123456789abcdef",
+                "Accept-Encoding": "gzip",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(markdown)
+        assert response.text == markdown
@@ -0,0 +1,135 @@
+"""Tests for the agent response cache."""
+
+import pytest
+from agno.agent import RunOutput
+from pytest_mock import MockerFixture
+
+from app.agents.chat import ChatAgent
+from app.agents.research import ResearchAgent
+from app.core.config import ProviderConfig, ProvidersConfig
+from app.models.providers import ProviderType
+from app.services.providers import ProviderManager
+from app.services.response_cache import AsyncTTLCache, make_cache_key
+from app.services.semantic_cache import SemanticCache
+
+
+@pytest.fixture
+def provider_manager() -> ProviderManager:
+    """Create provider manager with OpenAI enabled."""
+    return ProviderManager(
+        ProvidersConfig(
+            openai=ProviderConfig(enabled=True, model="gpt-4o", timeout_seconds=30, max_retries=2),
+            xai=None,
+            default_provider="openai",
+        )
+    )
+
+
+class TestAsyncTTLCache:
+    """Unit tests for the TTL/LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_returns_stored_value(self) -> None:
+        cache: AsyncTTLCache[str] = AsyncTTLCache(max_entries=4, ttl_seconds=60)
+        await cache.set("a", "value")
+
+        assert await cache.get("a") == "value"
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self) -> None:
+        cache: AsyncTTLCache[str] = AsyncTTLCache(max_entries=4, ttl_seconds=60)
+        await cache.set("a", "value", ttl=-1)
+
+        assert await cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: AsyncTTLCache[int] = AsyncTTLCache(max_entries=2, ttl_seconds=60)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+
+    def test_cache_key_ignores_dict_ordering(self) -> None:
+        assert make_cache_key({"a": 1, "b": 2}) == make_cache_key({"b": 2, "a": 1})
+        assert make_cache_key({"a": 1}) != make_cache_key({"a": 2})
+
+
+class TestAgentCaching:
+    """Agents should skip the provider call on exact repeats."""
+
+    @pytest.mark.asyncio
+    async def test_chat_repeat_message_is_cached(
+        self, provider_manager: ProviderManager, mocker: MockerFixture
+    ) -> None:
+        mock_response = mocker.MagicMock()
+        mock_response.content = "Hi there"
+        mock_agent_class = mocker.patch("app.agents.chat.Agent")
+        mock_agent_class.return_value.arun = mocker.AsyncMock(return_value=mock_response)
+
+        chat_agent = ChatAgent(provider_manager, response_cache=AsyncTTLCache())
+        first = await chat_agent.chat("Hello")
+        second = await chat_agent.chat("Hello")
+
+        assert first == second
+        assert mock_agent_class.return_value.arun.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_research_repeat_topic_is_cached(
+        self, provider_manager: ProviderManager, mocker: MockerFixture
+    ) -> None:
+        run_with_fallback = mocker.patch.object(
+            provider_manager,
+            "run_with_fallback",
+            new=mocker.AsyncMock(
+                return_value=(
+                    RunOutput(content="# Title\n\nBody", model="gpt-4o"),
+                    ProviderType.OPENAI,
+                )
+            ),
+        )
+
+        research_agent = ResearchAgent(provider_manager, response_cache=AsyncTTLCache())
+        first = await research_agent.research(topic="Title", focus_areas=["b", "a"])
+        second = await research_agent.research(topic="Title", focus_areas=["a", "b"])
+
+        assert first.markdown == second.markdown
+        assert run_with_fallback.await_count == 1
+        assert not first.metadata.cached
+        assert second.metadata.cached
+        assert second.metadata.tokens_used == 0
+
+    @pytest.mark.asyncio
+    async def test_research_semantic_hit_is_served_unchanged(
+        self, provider_manager: ProviderManager, mocker: MockerFixture
+    ) -> None:
+        class ConstantEmbedder:
+            async def aembed(self, text: str) -> list[float]:
+                return [1.0, 0.0]
+
+        mocker.patch.object(
+            provider_manager,
+            "run_with_fallback",
+            new=mocker.AsyncMock(
+                return_value=(
+                    RunOutput(content="# Kubernetes\n\nBody", model="gpt-4o"),
+                    ProviderType.OPENAI,
+                )
+            ),
+        )
+
+        research_agent = ResearchAgent(
+            provider_manager, semantic_cache=SemanticCache(ConstantEmbedder())
+        )
+        first = await research_agent.research(topic="Kubernetes")
+        second = await research_agent.research(topic="K8s")
+
+        assert second.metadata.cached
+        assert second.topic == first.topic == "Kubernetes"
+        assert second.markdown == first.markdown
@@ -1,6 +1,11 @@
 """Tests for security utilities."""
 
+import hashlib
+import string
+
 from app.core.security import (
+    _cached_sha256_hex,
+    clear_api_key_hash_cache,
     generate_api_key,
     generate_request_id,
     hash_api_key,
@@ -17,19 +22,18 @@ class TestAPIKeyGeneration:
         """Test that generated API keys have correct format."""
         key = generate_api_key()
         assert key.startswith("oea_")
-        assert len(key) == 36  # oea_ (4) + 32 hex chars
+        assert len(key) == 26  # oea_ (4) + 22 URL-safe base64 chars
+        assert validate_api_key_format(key) is True
 
     def test_generate_api_key_uniqueness(self):
         """Test that generated API keys are unique."""
         keys = {generate_api_key() for _ in range(100)}
         assert len(keys) == 100  # All should be unique
 
-    def test_generate_api_key_hex_chars(self):
-        """Test that generated API keys contain only hex characters."""
-        key = generate_api_key()
-        key_part = key[4:]  # Remove oea_ prefix
-        # Should not raise ValueError
-        int(key_part, 16)
+    def test_generate_api_key_urlsafe_chars(self):
+        """Test that generated API keys contain only URL-safe base64 characters."""
+        key_part = generate_api_key()[4:]  # Remove oea_ prefix
+        assert set(key_part) <= set(string.ascii_letters + string.digits + "-_")
 
 
 class TestAPIKeyHashing:
@@ -56,6 +60,26 @@ class TestAPIKeyHashing:
         hashed = hash_api_key(key)
         assert len(hashed) == 64
 
+    def test_hash_api_key_memoizes_well_formed_keys(self):
+        """Test that repeat hashes of the same key are served from the cache."""
+        clear_api_key_hash_cache()
+        key = generate_api_key()
+
+        hash_api_key(key)
+        hash_api_key(key)
+
+        info = _cached_sha256_hex.cache_info()
+        assert info.hits == 1
+        assert info.currsize == 1
+
+    def test_hash_api_key_does_not_cache_oversized_input(self):
+        """Test that oversized input is hashed without being memoized."""
+        clear_api_key_hash_cache()
+        key = "oea_" + "a" * 10_000
+
+        assert hash_api_key(key) == hashlib.sha256(key.encode()).hexdigest()
+        assert _cached_sha256_hex.cache_info().currsize == 0
+
 
 class TestAPIKeyValidation:
     """Tests for API key format validation."""
@@ -65,6 +89,15 @@ class TestAPIKeyValidation:
         key = generate_api_key()
         assert validate_api_key_format(key) is True
 
+    def test_validate_legacy_hex_key(self):
+        """Test validation still accepts keys issued in the legacy hex format."""
+        assert validate_api_key_format("oea_0123456789abcdef0123456789abcdef") is True
+
+    def test_validate_urlsafe_chars_require_current_length(self):
+        """Test non-hex base64 characters are only valid at the current key length."""
+        assert validate_api_key_format("oea_" + "-" * 22) is True
+        assert validate_api_key_format("oea_" + "-" * 32) is False
+
     def test_validate_wrong_prefix(self):
         """Test validation fails for wrong prefix."""
         key = "xxx_0123456789abcdef0123456789abcdef"
@@ -85,6 +118,12 @@ class TestAPIKeyValidation:
         key = "oea_0123456789abcdefghij123456789ab"
         assert validate_api_key_format(key) is False
 
+    def test_validate_rejects_int_literal_syntax(self):
+        """Test validation fails for separators and signs that int(x, 16) would accept."""
+        assert validate_api_key_format("oea_0123456789abcdef_123456789abcdef") is False
+        assert validate_api_key_format("oea_+123456789abcdef0123456789abcdef") is False
+        assert validate_api_key_format("oea_ 123456789abcdef0123456789abcdef") is False
+
     def test_validate_empty_key(self):
         """Test validation fails for empty key."""
         assert validate_api_key_format("") is False
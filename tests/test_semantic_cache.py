@@ -0,0 +1,56 @@
+"""Tests for the embedding-based research cache."""
+
+import pytest
+
+from app.services.semantic_cache import SemanticCache
+
+
+class FakeEmbedder:
+    """Deterministic embedder mapping known texts to fixed vectors."""
+
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self.vectors = vectors
+
+    async def aembed(self, text: str) -> list[float]:
+        return self.vectors[text]
+
+
+@pytest.mark.asyncio
+async def test_similar_text_hits_cache() -> None:
+    embedder = FakeEmbedder(
+        {
+            "deploy to AWS": [1.0, 0.0, 0.1],
+            "AWS deployment process": [0.98, 0.02, 0.12],
+            "quantum computing": [0.0, 1.0, 0.0],
+        }
+    )
+    cache: SemanticCache[str] = SemanticCache(embedder, similarity_threshold=0.95)
+
+    await cache.add(await cache.embed("deploy to AWS"), "standard:", "cached note")
+
+    assert await cache.search(await cache.embed("AWS deployment process"), "standard:") == (
+        "cached note"
+    )
+    assert await cache.search(await cache.embed("quantum computing"), "standard:") is None
+
+
+@pytest.mark.asyncio
+async def test_namespaces_do_not_mix() -> None:
+    embedder = FakeEmbedder({"topic": [1.0, 0.0]})
+    cache: SemanticCache[str] = SemanticCache(embedder)
+
+    await cache.add(await cache.embed("topic"), "quick:", "quick note")
+
+    assert await cache.search(await cache.embed("topic"), "deep:") is None
+
+
+@pytest.mark.asyncio
+async def test_oldest_entries_are_evicted() -> None:
+    embedder = FakeEmbedder({"a": [1.0, 0.0], "b": [0.0, 1.0]})
+    cache: SemanticCache[str] = SemanticCache(embedder, max_entries=1)
+
+    await cache.add(await cache.embed("a"), "", "first")
+    await cache.add(await cache.embed("b"), "", "second")
+
+    assert len(cache) == 1
+    assert await cache.search(await cache.embed("a"), "") is None
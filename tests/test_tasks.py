@@ -4,15 +4,20 @@ import asyncio
 import time
 from typing import Any, cast
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
+from app.api.routes.tasks import create_task_executor
 from app.main import create_app
+from app.models.chat import ChatResponse
+from app.models.providers import ProviderType
 from app.models.tasks import (
     AgentType,
     ChatTaskRequest,
     ResearchTaskRequest,
+    TaskResultResponse,
     TaskStatus,
 )
 from app.services.tasks import TaskManager, TaskNotFoundError, TaskNotReadyError
@@ -45,7 +50,7 @@ class TestTaskManager:
 
         async def executor(request):
             await asyncio.sleep(0.01)
-            return {"agent": request.agent.value, "ok": True}
+            return orjson.dumps({"agent": request.agent.value, "ok": True})
 
         manager = TaskManager(executor=executor, max_workers=1, task_ttl_seconds=60)
         await manager.start()
@@ -61,19 +66,76 @@ class TestTaskManager:
                 expected_status=TaskStatus.COMPLETED,
             )
 
-            result = await manager.get_task_result(submitted.task_id, api_key_id="test-key")
+            result = TaskResultResponse.model_validate_json(
+                await manager.get_task_result(submitted.task_id, api_key_id="test-key")
+            )
             assert result.status == TaskStatus.COMPLETED
             assert result.result == {"agent": "chat", "ok": True}
         finally:
             await manager.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_get_task_long_polls_until_status_changes(self) -> None:
+        """Waiting status reads should return as soon as the task moves on."""
+        release = asyncio.Event()
+
+        async def executor(request):
+            await release.wait()
+            return orjson.dumps({"ok": True})
+
+        manager = TaskManager(executor=executor, max_workers=1, task_ttl_seconds=60)
+        await manager.start()
+        try:
+            submitted = await manager.submit_task(
+                request=ChatTaskRequest(message="hello"), api_key_id="test-key"
+            )
+            await _wait_for_status(
+                manager,
+                submitted.task_id,
+                api_key_id="test-key",
+                expected_status=TaskStatus.PROCESSING,
+            )
+
+            timed_out = await manager.get_task(
+                submitted.task_id, api_key_id="test-key", wait_seconds=0.05
+            )
+            assert timed_out.status == TaskStatus.PROCESSING
+
+            waiter = asyncio.create_task(
+                manager.get_task(submitted.task_id, api_key_id="test-key", wait_seconds=5)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            started = time.monotonic()
+            current = await waiter
+            assert current.status == TaskStatus.COMPLETED
+            assert time.monotonic() - started < 1.0
+        finally:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_executor_dispatches_by_request_type(self, mocker: MockerFixture) -> None:
+        """The executor should route each request type to its agent."""
+        chat_agent = mocker.Mock()
+        chat_agent.chat = mocker.AsyncMock(
+            return_value=ChatResponse(reply="hi", provider=ProviderType.OPENAI, model="gpt-4o")
+        )
+        research_agent = mocker.Mock()
+        execute = create_task_executor(chat_agent, research_agent)
+
+        result = await execute(ChatTaskRequest(message="hello"))
+
+        assert orjson.loads(result)["reply"] == "hi"
+        chat_agent.chat.assert_awaited_once_with(message="hello", provider=None)
+        research_agent.research.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_result_not_ready(self) -> None:
         """Requesting result before completion should raise TaskNotReadyError."""
 
         async def executor(request):
             await asyncio.sleep(0.2)
-            return {"ok": True}
+            return orjson.dumps({"ok": True})
 
         manager = TaskManager(executor=executor, max_workers=1, task_ttl_seconds=60)
         await manager.start()
@@ -95,7 +157,7 @@ class TestTaskManager:
 
         async def executor(request):
             await blocker.wait()
-            return {"ok": True}
+            return orjson.dumps({"ok": True})
 
         manager = TaskManager(executor=executor, max_workers=1, task_ttl_seconds=60)
         await manager.start()
@@ -135,7 +197,7 @@ class TestTaskManager:
 
         async def executor(request):
             await asyncio.sleep(0.01)
-            return {"agent": request.agent.value}
+            return orjson.dumps({"agent": request.agent.value})
 
         manager = TaskManager(executor=executor, max_workers=2, task_ttl_seconds=60)
         await manager.start()
@@ -176,7 +238,7 @@ class TestTaskManager:
         """Tasks should not be visible across different API keys."""
 
         async def executor(request):
-            return {"ok": True}
+            return orjson.dumps({"ok": True})
 
         manager = TaskManager(executor=executor, max_workers=1, task_ttl_seconds=60)
         await manager.start()
@@ -201,8 +263,10 @@ class TestTaskAPI:
         async def fake_executor(request):
             await asyncio.sleep(0.01)
             if request.agent == AgentType.CHAT:
-                return {"reply": f"echo:{request.message}", "agent": request.agent.value}
-            return {"topic": request.topic, "agent": request.agent.value}
+                return orjson.dumps(
+                    {"reply": f"echo:{request.message}", "agent": request.agent.value}
+                )
+            return orjson.dumps({"topic": request.topic, "agent": request.agent.value})
 
         mocker.patch("app.main.create_task_executor", return_value=fake_executor)
         app = create_app()
@@ -260,7 +324,7 @@ class TestTaskAPI:
 
         async def slow_executor(request):
             await asyncio.sleep(0.25)
-            return {"ok": True}
+            return orjson.dumps({"ok": True})
 
         mocker.patch("app.main.create_task_executor", return_value=slow_executor)
         app = create_app()